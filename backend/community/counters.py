@@ -0,0 +1,67 @@
+# backend/community/counters.py
+
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Thread, Comment
+
+
+def actual_comment_count():
+    """게시글별 실제 댓글 수 (Thread 쿼리에 붙이는 상관 서브쿼리)"""
+    comments = Comment.objects.filter(thread=OuterRef('pk')).order_by().values('thread')
+    return Coalesce(Subquery(comments.annotate(n=Count('id')).values('n'), output_field=IntegerField()), 0)
+
+
+def actual_last_activity():
+    """게시글별 마지막 댓글 시각 (댓글이 없으면 작성 시각)"""
+    comments = Comment.objects.filter(thread=OuterRef('pk')).order_by().values('thread')
+    return Coalesce(Subquery(comments.annotate(latest=Max('created_at')).values('latest')), F('created_at'))
+
+
+# 댓글 변경 시 Thread.updated_at도 함께 갱신해, 게시글 상세/댓글 목록의 조건부 GET 검증값을
+# 댓글 전체 집계 없이 게시글 한 행(PK 조회)으로 계산할 수 있게 합니다.
+
+def comment_added(comment):
+    # UPDATE ... SET comment_count = comment_count + 1 (동시에 댓글이 달려도 유실 없음)
+    Thread.objects.filter(pk=comment.thread_id).update(
+        comment_count=F('comment_count') + 1,
+        last_activity_at=comment.created_at,
+        updated_at=timezone.now(),
+    )
+
+
+def comment_edited(comment):
+    Thread.objects.filter(pk=comment.thread_id).update(updated_at=timezone.now())
+
+
+def comment_removed(thread_id):
+    # 지운 댓글이 마지막 댓글이었을 수 있으므로 마지막 활동 시각은 남은 댓글로 다시 계산합니다.
+    Thread.objects.filter(pk=thread_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1,
+        last_activity_at=actual_last_activity(),
+        updated_at=timezone.now(),
+    )
+
+
+def drifted_threads(queryset=None):
+    """카운터가 실제 값과 다른 게시글 (id, lecture_id, 저장된 값, 실제 값)"""
+    queryset = Thread.objects.all() if queryset is None else queryset
+    return (
+        queryset
+        .annotate(actual_count=actual_comment_count(), actual_activity=actual_last_activity())
+        # 댓글이 없는 글의 last_activity_at은 작성 시각(기본값 now)과 미세하게 다를 수 있어 비교하지 않습니다.
+        .filter(
+            ~Q(comment_count=F('actual_count'))
+            | (Q(actual_count__gt=0) & ~Q(last_activity_at=F('actual_activity')))
+        )
+        .values_list('id', 'lecture_id', 'comment_count', 'actual_count', 'last_activity_at', 'actual_activity')
+    )
+
+
+def repair(thread_ids):
+    """지정한 게시글의 카운터를 실제 값으로 다시 계산 (UPDATE 한 번)"""
+    return Thread.objects.filter(pk__in=thread_ids).update(
+        comment_count=actual_comment_count(),
+        last_activity_at=actual_last_activity(),
+    )
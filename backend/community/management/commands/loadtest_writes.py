@@ -0,0 +1,78 @@
+# backend/community/management/commands/loadtest_writes.py
+
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, OperationalError
+from django.conf import settings
+
+from community.models import Thread, Comment
+from user.models import User
+
+
+class Command(BaseCommand):
+    help = "동시 쓰기 부하 테스트: 여러 스레드가 동시에 댓글을 작성하고 처리량/지연/실패 수를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help="동시에 쓰는 스레드 수")
+        parser.add_argument('--writes', type=int, default=200, help="스레드당 작성할 댓글 수")
+        parser.add_argument('--keep', action='store_true', help="테스트 데이터를 지우지 않음")
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        writes = options['writes']
+        db = settings.DATABASES['default']
+        self.stdout.write(f"DB: {connection.vendor} ({db['NAME']}), workers={workers}, writes/worker={writes}")
+
+        user, _ = User.objects.get_or_create(username='__loadtest__')
+        thread = Thread.objects.create(title='[loadtest] 동시 쓰기', content='부하 테스트용 글', student=user)
+
+        latencies = []
+        failures = []
+        lock = threading.Lock()
+        start_barrier = threading.Barrier(workers)
+
+        def worker():
+            local_latencies = []
+            local_failures = 0
+            try:
+                start_barrier.wait()
+                for i in range(writes):
+                    began = time.perf_counter()
+                    try:
+                        Comment.objects.create(thread=thread, student=user, content=f'loadtest {i}')
+                    except OperationalError:
+                        # SQLite busy_timeout 초과 등
+                        local_failures += 1
+                        continue
+                    local_latencies.append(time.perf_counter() - began)
+            finally:
+                # 스레드별 DB 연결 정리
+                connections.close_all()
+            with lock:
+                latencies.extend(local_latencies)
+                failures.append(local_failures)
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        began = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - began
+
+        ok = len(latencies)
+        self.stdout.write(f"성공 {ok}건 / 실패 {sum(failures)}건, {elapsed:.2f}초")
+        self.stdout.write(f"처리량: {ok / elapsed:.1f} writes/s")
+        if ok:
+            quantiles = statistics.quantiles(latencies, n=100) if ok > 1 else [latencies[0]] * 99
+            self.stdout.write(
+                "지연(ms): p50 {:.1f} / p95 {:.1f} / p99 {:.1f} / max {:.1f}".format(
+                    quantiles[49] * 1000, quantiles[94] * 1000, quantiles[98] * 1000, max(latencies) * 1000,
+                )
+            )
+
+        if not options['keep']:
+            thread.delete()
@@ -0,0 +1,43 @@
+# backend/community/management/commands/reconcile_thread_counters.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from community import counters
+from community.signals import thread_list_tags
+from community.models import Thread
+from doro.cache import tagged_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "게시글의 comment_count / last_activity_at을 실제 댓글과 비교해 어긋난 글만 다시 계산합니다. "
+        "(seed_data 등 시그널을 거치지 않은 대량 작업 후 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="어긋난 게시글만 출력하고 저장하지 않음")
+        parser.add_argument('--batch-size', type=int, default=1_000)
+
+    def handle(self, *args, **options):
+        drifted = list(counters.drifted_threads())
+        for pk, _, count, actual_count, activity, actual_activity in drifted[:50]:
+            self.stdout.write(f"  thread {pk}: comments {count}->{actual_count}, last_activity {activity}->{actual_activity}")
+        if len(drifted) > 50:
+            self.stdout.write(f"  ... 외 {len(drifted) - 50}건")
+
+        if options['dry_run'] or not drifted:
+            self.stdout.write(self.style.SUCCESS(f"불일치 게시글 {len(drifted)}건"))
+            return
+
+        batch_size = options['batch_size']
+        ids = [row[0] for row in drifted]
+        with transaction.atomic():
+            for start in range(0, len(ids), batch_size):
+                counters.repair(ids[start:start + batch_size])
+
+        tags = {f'thread:{pk}' for pk in ids}
+        for lecture_id in {row[1] for row in drifted}:
+            tags.update(thread_list_tags(Thread(lecture_id=lecture_id)))
+        tagged_cache.invalidate(*tags)
+        self.stdout.write(self.style.SUCCESS(f"게시글 {len(ids)}건의 댓글 수 / 마지막 활동 시각을 다시 맞췄습니다."))
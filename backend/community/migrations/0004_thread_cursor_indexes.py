@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_thread_lecture'),
+        ('lecture', '0003_alter_lecture_name_alter_lecture_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['lecture', 'created_at', 'id'], name='thread_lecture_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['created_at', 'id'], name='thread_created_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0004_thread_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='thread',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
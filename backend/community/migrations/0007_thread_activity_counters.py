@@ -0,0 +1,57 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:06
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    # 기존 게시글의 댓글 수 / 마지막 활동 시각을 UPDATE 한 번으로 채웁니다.
+    Thread = apps.get_model('community', 'Thread')
+    Comment = apps.get_model('community', 'Comment')
+    comments = Comment.objects.filter(thread=OuterRef('pk')).order_by().values('thread')
+    Thread.objects.update(
+        comment_count=Coalesce(Subquery(comments.annotate(n=Count('id')).values('n'), output_field=IntegerField()), 0),
+        last_activity_at=Coalesce(Subquery(comments.annotate(latest=Max('created_at')).values('latest')), F('created_at')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0006_hot_query_indexes'),
+        ('lecture', '0007_attendance_unique_week'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='thread',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='thread',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['last_activity_at', 'id'], name='thread_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['lecture', 'last_activity_at', 'id'], name='thread_lecture_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['comment_count', 'id'], name='thread_comments_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thread',
+            index=models.Index(fields=['lecture', 'comment_count', 'id'], name='thread_lecture_comments_idx'),
+        ),
+    ]
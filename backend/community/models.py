@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from user.models import User
 from lecture.models import Lecture # Lecture 모델 import
 
@@ -6,6 +7,10 @@ class Thread(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True) # 조건부 GET(ETag) 계산용
+    # 댓글 작성/삭제 시 F()로 함께 갱신하는 비정규화 값 (목록에서 Comment 집계 없이 표시/정렬)
+    comment_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(default=timezone.now) # 마지막 댓글 시각 (댓글이 없으면 작성 시각)
     student = models.ForeignKey(
         User,
         null=True,
@@ -21,6 +26,21 @@ class Thread(models.Model):
         related_name="threads"
     )
 
+    class Meta:
+        indexes = [
+            # 강의 게시판 커서 페이지네이션: WHERE lecture_id = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=['lecture', 'created_at', 'id'], name='thread_lecture_created_idx'),
+            # 전체 게시판 커서 페이지네이션: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['created_at', 'id'], name='thread_created_idx'),
+            # 내 활동: WHERE student_id = ? ORDER BY created_at DESC
+            models.Index(fields=['student', 'created_at'], name='thread_student_created_idx'),
+            # ?ordering=active (최근 활동순) / ?ordering=comments (댓글 많은 순)
+            models.Index(fields=['last_activity_at', 'id'], name='thread_activity_idx'),
+            models.Index(fields=['lecture', 'last_activity_at', 'id'], name='thread_lecture_activity_idx'),
+            models.Index(fields=['comment_count', 'id'], name='thread_comments_idx'),
+            models.Index(fields=['lecture', 'comment_count', 'id'], name='thread_lecture_comments_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -28,6 +48,7 @@ class Thread(models.Model):
 class Comment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     student = models.ForeignKey(
         User,
         null=True,
@@ -38,4 +59,12 @@ class Comment(models.Model):
         'Thread',
         on_delete=models.CASCADE,
         related_name="comments"
-    )
\ No newline at end of file
+    )
+
+    class Meta:
+        indexes = [
+            # 내 활동: WHERE student_id = ? ORDER BY created_at DESC
+            models.Index(fields=['student', 'created_at'], name='comment_student_created_idx'),
+            # 게시글 댓글 커서 페이지네이션: WHERE thread_id = ? ORDER BY created_at, id
+            models.Index(fields=['thread', 'created_at', 'id'], name='comment_thread_created_idx'),
+        ]
\ No newline at end of file
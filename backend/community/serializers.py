@@ -1,31 +1,37 @@
 from rest_framework import serializers
+from doro.prefetch import EagerLoadingMixin
 from .models import Thread, Comment
 
 # 1. 게시글 목록용
-class ThreadSerializer(serializers.ModelSerializer):
+class ThreadSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     student_name = serializers.ReadOnlyField(source='student.username')
 
+    select_related_fields = ('student',)
+    only_fields = (
+        'id', 'title', 'content', 'created_at', 'lecture', 'comment_count', 'last_activity_at', 'student__username',
+    )
+
     class Meta:
         model = Thread
-        fields = ['id', 'title', 'content', 'created_at', 'student_name', 'lecture']
-        read_only_fields = ['student']
+        fields = ['id', 'title', 'content', 'created_at', 'student_name', 'lecture', 'comment_count', 'last_activity_at']
+        read_only_fields = ['student', 'comment_count', 'last_activity_at']
 
 # 2. 댓글용
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     student_name = serializers.ReadOnlyField(source='student.username')
 
+    select_related_fields = ('student',)
+
     class Meta:
         model = Comment
         fields = ['id', 'content', 'created_at', 'student_name']
 
-# 3. 게시글 상세 조회용 (댓글 포함)
-class ThreadDetailSerializer(serializers.ModelSerializer):
+# 3. 게시글 상세 조회용 (댓글은 뷰에서 첫 페이지만 붙임 - community_detail_api)
+class ThreadDetailSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     student_name = serializers.ReadOnlyField(source='student.username')
-    
-    # models.py의 related_name="comments"와 일치해야 합니다.
-    comments = CommentSerializer(many=True, read_only=True) 
+
+    select_related_fields = ('student',)
 
     class Meta:
         model = Thread
-        # comments 필드가 반드시 포함되어야 합니다.
-        fields = ['id', 'title', 'content', 'created_at', 'student_name', 'comments']
\ No newline at end of file
+        fields = ['id', 'title', 'content', 'created_at', 'student_name', 'comment_count', 'last_activity_at']
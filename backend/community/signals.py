@@ -0,0 +1,65 @@
+# backend/community/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from django.db.models import QuerySet
+
+from doro import realtime
+from doro.cache import tagged_cache
+from .models import Thread, Comment
+from . import counters
+from .serializers import CommentSerializer
+
+
+# === 캐시 무효화 (doro.cache 태그, 트랜잭션 커밋 후) ===
+
+def thread_list_tags(thread):
+    # 강의 게시판 글은 '전체' 게시판에도 보입니다.
+    tags = ['threads:all']
+    if thread.lecture_id:
+        tags.append(f'threads:lecture:{thread.lecture_id}')
+    return tags
+
+
+@receiver([post_save, post_delete], sender=Thread)
+def thread_changed(sender, instance, **kwargs):
+    tagged_cache.invalidate_on_commit(f'thread:{instance.pk}', *thread_list_tags(instance))
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def comment_changed(sender, instance, **kwargs):
+    tagged_cache.invalidate_on_commit(f'thread:{instance.thread_id}')
+
+
+# === 게시글 댓글 수 / 마지막 활동 시각 (community/counters.py) ===
+
+def deleting_thread(origin):
+    # 게시글 삭제로 함께 지워지는 댓글이면 곧 사라질 게시글의 카운터를 갱신할 필요가 없습니다.
+    return isinstance(origin, Thread) or (isinstance(origin, QuerySet) and origin.model is Thread)
+
+
+def invalidate_thread_lists(thread_id):
+    # 목록에 댓글 수가 표시되고 활동순 정렬도 바뀌므로 게시글이 속한 목록 캐시를 무효화합니다.
+    lecture_id = Thread.objects.filter(pk=thread_id).values_list('lecture_id', flat=True).first()
+    tagged_cache.invalidate_on_commit(*thread_list_tags(Thread(lecture_id=lecture_id)))
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    if not created:
+        counters.comment_edited(instance)
+        return
+    counters.comment_added(instance)
+    invalidate_thread_lists(instance.thread_id)
+    # 게시글을 지켜보는 사용자에게 댓글 목록 항목과 같은 모양으로 보냅니다. (doro/realtime.py)
+    realtime.publish([f'thread:{instance.thread_id}'], 'comment',
+                     {**CommentSerializer(instance).data, 'thread_id': instance.thread_id})
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, origin=None, **kwargs):
+    if deleting_thread(origin):
+        return
+    counters.comment_removed(instance.thread_id)
+    invalidate_thread_lists(instance.thread_id)
@@ -1,3 +1,49 @@
 from django.test import TestCase
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from doro.cache import tagged_cache
+from user.models import User
+from .models import Thread, Comment
+
+
+class CommentConditionalRequestTests(APITestCase):
+    """댓글 목록/작성 API: 조건부 GET 검증값은 GET에만 적용됩니다. (doro/conditional.py)"""
+
+    def setUp(self):
+        self.user = User.objects.create(username='student', role=1)
+        self.thread = Thread.objects.create(title='t', content='c', student=self.user)
+        self.url = f'/api/community/{self.thread.pk}/comments/'
+        self.client.force_authenticate(self.user)
+
+    def test_get_with_current_etag_is_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_post_with_cached_etag_creates_comment(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.post(self.url, {'content': 'hello'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Comment.objects.filter(thread=self.thread).count(), 1)
+        # 댓글이 생겼으므로 같은 ETag로 조회하면 새 목록을 받습니다.
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_deleting_comment_changes_validators(self):
+        comment = Comment.objects.create(thread=self.thread, student=self.user, content='c')
+        response = self.client.get(self.url)
+        # 삭제를 반영하지 못하는 Last-Modified는 보내지 않습니다.
+        self.assertNotIn('Last-Modified', response)
+        comment.delete()
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+
+class ThreadCacheInvalidationTests(TestCase):
+    """게시글 캐시 태그는 변경이 커밋된 뒤에 무효화됩니다."""
+
+    def test_thread_tag_is_invalidated_after_commit(self):
+        thread = Thread.objects.create(title='t', content='c', student=User.objects.create(username='student', role=1))
+        tags = [f'thread:{thread.pk}']
+        tagged_cache.set('probe', 'cached', tags)
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(thread=thread, student=thread.student, content='c')
+            self.assertEqual(tagged_cache.get('probe', tags), 'cached')
+        self.assertIsNone(tagged_cache.get('probe', tags))
@@ -2,27 +2,46 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
+from doro.pagination import CursorPagination
+from doro.cache import tagged_cache, make_key
+from doro.conditional import conditional_on
 from .models import Thread, Comment
 from .serializers import ThreadSerializer, ThreadDetailSerializer, CommentSerializer
 
+# 게시글 목록 커서 페이지네이션 (Thread(lecture, created_at, id) 인덱스 사용)
+thread_pagination = CursorPagination(ordering=('-created_at', '-id'))
+
+# ?ordering= 값별 정렬 (모두 Thread의 비정규화 컬럼 + 복합 인덱스로 정렬, Comment 집계 없음)
+THREAD_ORDERINGS = {
+    'latest': thread_pagination,                                              # 최신 글순 (기본)
+    'active': CursorPagination(ordering=('-last_activity_at', '-id')),        # 최근 활동(댓글)순
+    'comments': CursorPagination(ordering=('-comment_count', '-id')),         # 댓글 많은 순
+}
+
+# 게시글 댓글 커서 페이지네이션 (오래된 댓글부터, Comment(thread, created_at, id) 인덱스 사용)
+comment_pagination = CursorPagination(ordering=('created_at', 'id'))
+
 # 1. 게시글 목록 조회(GET) 및 작성(POST)
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticatedOrReadOnly])
 def community_list_create_api(request):
     if request.method == 'GET':
         lecture_id = request.query_params.get('lecture_id')
-        
-        if lecture_id:
-            # 특정 강의 게시판 조회
-            threads = Thread.objects.filter(lecture_id=lecture_id).order_by('-created_at')
-        else:
-            # 전체 게시판 (강의가 지정되지 않은 글 + 강의 글 모두 볼지, 아니면 구분할지 정책에 따라 다름)
-            # 여기서는 '전체' 탭이므로 모든 글을 보여줍니다.
-            threads = Thread.objects.all().order_by('-created_at')
-            
-        serializer = ThreadSerializer(threads, many=True)
-        return Response(serializer.data)
+        # 목록 응답에 영향을 주는 파라미터만 캐시 키에 포함
+        params = {
+            name: request.query_params[name]
+            for name in ('lecture_id', 'ordering', thread_pagination.cursor_query_param, thread_pagination.page_size_query_param)
+            if name in request.query_params
+        }
+        tag = f'threads:lecture:{lecture_id}' if lecture_id else 'threads:all'
+        data = tagged_cache.get_or_set(
+            make_key('community', 'threads', params=params),
+            lambda: thread_list_data(request, lecture_id),
+            tags=[tag],
+        )
+        return Response(data)
 
     elif request.method == 'POST':
         serializer = ThreadSerializer(data=request.data)
@@ -32,26 +51,87 @@ def community_list_create_api(request):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-# 2. 게시글 상세 조회 (GET) - 댓글 포함
+
+def thread_list_data(request, lecture_id):
+    """게시글 목록 응답 데이터 계산 (캐시 미스일 때만 호출)"""
+    ordering = request.query_params.get('ordering') or 'latest'
+    pagination = THREAD_ORDERINGS.get(ordering)
+    if pagination is None:
+        raise ValidationError({'ordering': f"{', '.join(THREAD_ORDERINGS)} 중 하나여야 합니다."})
+
+    if lecture_id:
+        # 특정 강의 게시판 조회
+        threads = Thread.objects.filter(lecture_id=lecture_id)
+    else:
+        # 전체 게시판 (강의가 지정되지 않은 글 + 강의 글 모두 볼지, 아니면 구분할지 정책에 따라 다름)
+        # 여기서는 '전체' 탭이므로 모든 글을 보여줍니다.
+        threads = Thread.objects.all()
+
+    threads = ThreadSerializer.setup_eager_loading(threads.order_by(*pagination.ordering))
+
+    # ?cursor= 또는 ?page_size= 가 있으면 커서 페이지 단위로 응답
+    if pagination.is_requested(request):
+        page, next_cursor = pagination.paginate_queryset(threads, request)
+        serializer = ThreadSerializer(page, many=True)
+        return pagination.get_response_data(list(serializer.data), next_cursor)
+
+    return list(ThreadSerializer(threads, many=True).data)
+
+# 2. 게시글 상세 조회 (GET) - 댓글은 첫 페이지와 전체 개수만 포함
+# 댓글 변경 시 Thread.updated_at이 함께 갱신되므로 검증값은 게시글 한 행으로 계산합니다. (community/counters.py)
 @api_view(['GET'])
 @permission_classes([IsAuthenticatedOrReadOnly])
+@conditional_on(lambda pk: [Thread.objects.filter(pk=pk)])
 def community_detail_api(request, pk):
-    thread = get_object_or_404(Thread, pk=pk)
-    serializer = ThreadDetailSerializer(thread)
-    return Response(serializer.data)
+    def build():
+        thread = get_object_or_404(ThreadDetailSerializer.setup_eager_loading(Thread.objects.all()), pk=pk)
+        data = dict(ThreadDetailSerializer(thread).data)
+        # 다음 페이지는 comments_next_cursor로 댓글 목록 API(?cursor=)에서 이어서 받습니다.
+        size = comment_pagination.page_size
+        comments = thread_comments(pk).order_by(*comment_pagination.ordering)[:size + 1]
+        page, next_cursor = comment_pagination.split_page(list(comments), size)
+        data['comments'] = list(CommentSerializer(page, many=True).data)
+        data['comments_next_cursor'] = next_cursor
+        return data
 
-# 3. 댓글 작성 (POST)
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def comment_create_api(request, pk):
-    thread = get_object_or_404(Thread, pk=pk)
-    serializer = CommentSerializer(data=request.data)
-    
-    if serializer.is_valid():
-        # 작성자(user)와 게시글(thread) 정보를 함께 저장
-        serializer.save(student=request.user, thread=thread)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    # 글 수정/댓글 작성 시 thread:<id> 태그로 무효화 (community/signals.py)
+    data = tagged_cache.get_or_set(make_key('thread', pk), build, tags=[f'thread:{pk}'])
+    return Response(data)
+
+# 3. 댓글 목록 조회(GET, 커서 페이지) 및 작성(POST)
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticatedOrReadOnly])
+@conditional_on(lambda pk: [Thread.objects.filter(pk=pk)])
+def comment_list_create_api(request, pk):
+    if request.method == 'GET':
+        params = {
+            name: request.query_params[name]
+            for name in (comment_pagination.cursor_query_param, comment_pagination.page_size_query_param)
+            if name in request.query_params
+        }
+
+        def build():
+            get_object_or_404(Thread.objects.only('id'), pk=pk)
+            page, next_cursor = comment_pagination.paginate_queryset(thread_comments(pk), request)
+            return comment_pagination.get_response_data(list(CommentSerializer(page, many=True).data), next_cursor)
+
+        data = tagged_cache.get_or_set(make_key('thread', pk, 'comments', params=params), build, tags=[f'thread:{pk}'])
+        return Response(data)
+
+    elif request.method == 'POST':
+        thread = get_object_or_404(Thread, pk=pk)
+        serializer = CommentSerializer(data=request.data)
+
+        if serializer.is_valid():
+            # 작성자(user)와 게시글(thread) 정보를 함께 저장
+            serializer.save(student=request.user, thread=thread)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+def thread_comments(thread_id):
+    """게시글 댓글 (Comment(thread, created_at, id) 인덱스 순서, 작성자 JOIN)"""
+    return CommentSerializer.setup_eager_loading(Comment.objects.filter(thread_id=thread_id))
 
 # 4. [추가됨] 내 활동 내역 (내가 쓴 글, 댓글) 조회
 @api_view(['GET'])
@@ -61,7 +141,7 @@ def my_activity_api(request):
     user = request.user
     
     # 내가 쓴 글
-    my_threads = Thread.objects.filter(student=user).order_by('-created_at')
+    my_threads = ThreadSerializer.setup_eager_loading(Thread.objects.filter(student=user).order_by('-created_at'))
     thread_serializer = ThreadSerializer(my_threads, many=True)
     
     # 내가 쓴 댓글 (댓글이 달린 글의 제목도 같이 전달)
@@ -1,8 +1,14 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import Consultation
+from .models import Consultation, InstructorAvailability
 
 @admin.register(Consultation)
 class ConsultationAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(InstructorAvailability)
+class InstructorAvailabilityAdmin(admin.ModelAdmin):
+    list_display = ('instructor', 'weekday', 'start_time', 'end_time')
+    list_filter = ('weekday',)
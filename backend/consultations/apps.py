@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ConsultationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "consultations"
+
+    def ready(self):
+        # 실시간 이벤트 시그널 등록
+        from . import signals  # noqa: F401
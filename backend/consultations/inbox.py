@@ -0,0 +1,121 @@
+# backend/consultations/inbox.py
+
+import datetime
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from doro import realtime
+from doro.pagination import CursorPagination
+from .models import Consultation
+from .tasks import send_consultation_confirmation
+
+# 강사 상담함: 상담 시각이 빠른 순 (consult_instructor_status_idx / consult_instructor_sched_idx)
+inbox_pagination = CursorPagination(ordering=('scheduled_at', 'id'))
+
+STATUSES = [status for status, _ in Consultation.STATUS_CHOICES]
+TYPES = [value for value, _ in Consultation.TYPE_CHOICES]
+METHODS = [value for value, _ in Consultation.METHOD_CHOICES]
+
+# 상태 전이 (완료/취소는 끝 상태)
+TRANSITIONS = {
+    'PENDING': {'APPROVED', 'CANCELED'},
+    'APPROVED': {'COMPLETED', 'CANCELED'},
+    'COMPLETED': set(),
+    'CANCELED': set(),
+}
+# 한 번에 바꿀 수 있는 최대 상담 수
+MAX_BATCH = 500
+# 실시간 이벤트에 담는 필드
+EVENT_FIELDS = ('id', 'student_id', 'instructor_id', 'status', 'scheduled_at')
+
+
+class UnknownConsultations(Exception):
+    """없거나 내 상담이 아닌 ID (ids 속성)"""
+    def __init__(self, ids):
+        super().__init__(ids)
+        self.ids = ids
+
+
+class InvalidTransition(Exception):
+    """상태를 바꿀 수 없는 상담 (conflicts 속성: [(ID, 현재 상태), ...])"""
+    def __init__(self, conflicts):
+        super().__init__(conflicts)
+        self.conflicts = conflicts
+
+
+def can_transition(current, target):
+    """같은 상태로의 전이는 허용 (재시도해도 같은 결과)"""
+    return current == target or target in TRANSITIONS.get(current, ())
+
+
+def parse_filters(params):
+    """
+    쿼리 파라미터 -> 필터 dict (잘못된 값은 400)
+    - status / type / method: 값 하나
+    - date_from / date_to: 상담 날짜 범위 (YYYY-MM-DD, 서버 시간대)
+    """
+    filters = {}
+    for name, field, choices in (('status', 'status', STATUSES), ('type', 'consultation_type', TYPES),
+                                 ('method', 'method', METHODS)):
+        value = params.get(name, '').strip().upper()
+        if value:
+            if value not in choices:
+                raise ValidationError({name: f"{', '.join(choices)} 중에서 선택해야 합니다."})
+            filters[field] = value
+    tz = timezone.get_current_timezone()
+    for name, lookup, days in (('date_from', 'scheduled_at__gte', 0), ('date_to', 'scheduled_at__lt', 1)):
+        if params.get(name):
+            try:
+                day = datetime.date.fromisoformat(params[name]) + datetime.timedelta(days=days)
+            except ValueError:
+                raise ValidationError({name: "YYYY-MM-DD 형식이어야 합니다."})
+            filters[lookup] = datetime.datetime.combine(day, datetime.time.min, tzinfo=tz)
+    return filters
+
+
+def publish_changes(rows):
+    """
+    상담 변경을 학생과 강사에게 실시간 이벤트로 보냅니다. (doro/realtime.py, 커밋된 뒤 발행)
+    rows: [{id, student_id, instructor_id, status, scheduled_at}, ...]
+    """
+    for row in rows:
+        realtime.publish([f"user:{row['student_id']}", f"user:{row['instructor_id']}"], 'consultation', row)
+
+
+def inbox(instructor, filters):
+    """강사에게 온 상담 (정렬은 inbox_pagination이 적용)"""
+    return Consultation.objects.filter(instructor=instructor, **filters)
+
+
+@transaction.atomic
+def transition(instructor, ids, target):
+    """
+    강사의 상담 여러 건을 target 상태로 한 번에 바꿉니다. (전부 바꾸거나 하나도 바꾸지 않음)
+    - 없거나 내 상담이 아닌 ID가 있으면 UnknownConsultations
+    - TRANSITIONS에 없는 전이가 있으면 InvalidTransition
+    상담 행을 잠근 채 상태를 확인하므로, 학생의 취소와 엇갈려도 확인한 상태 그대로 바뀝니다.
+    승인된 상담은 확정 안내 메일 작업을 넣습니다. (consultations/tasks.py)
+    UPDATE 한 번으로 바꾸므로 post_save 시그널 대신 여기서 실시간 이벤트를 보냅니다.
+    반환값: 실제로 상태가 바뀐 상담 ID 목록
+    """
+    ids = list(dict.fromkeys(ids))
+    current = dict(
+        Consultation.objects.select_for_update().filter(instructor=instructor, pk__in=ids).values_list('pk', 'status')
+    )
+    missing = [pk for pk in ids if pk not in current]
+    if missing:
+        raise UnknownConsultations(missing)
+    conflicts = [(pk, current[pk]) for pk in ids if not can_transition(current[pk], target)]
+    if conflicts:
+        raise InvalidTransition(conflicts)
+
+    changed = [pk for pk in ids if current[pk] != target]
+    if changed:
+        Consultation.objects.filter(pk__in=changed).update(status=target)
+        publish_changes(Consultation.objects.filter(pk__in=changed).values(*EVENT_FIELDS))
+        if target == 'APPROVED':
+            # 확정 안내 메일은 상태 변경과 같은 트랜잭션에서 큐에 넣습니다. (롤백되면 함께 취소)
+            send_consultation_confirmation.enqueue_many([((pk,), {}) for pk in changed])
+    return changed
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0004_alter_consultation_consultation_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultation',
+            index=models.Index(fields=['student', 'created_at'], name='consult_student_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='consultation',
+            index=models.Index(fields=['student', 'status', 'created_at'], name='consult_student_status_idx'),
+        ),
+    ]
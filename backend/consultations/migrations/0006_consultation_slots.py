@@ -0,0 +1,107 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:38
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# 배제 제약은 이 마이그레이션에서만 만듭니다. (consultations/scheduling.py는 위반 시 SlotConflict로 바꿀 때 이름만 사용)
+TABLE = 'consultations_consultation'
+EXCLUSION_CONSTRAINT = 'consult_no_overlap'
+POSTGRES_INSTALL_SQL = (
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    f"ALTER TABLE {TABLE} ADD CONSTRAINT {EXCLUSION_CONSTRAINT} EXCLUDE USING gist "
+    f"(instructor_id WITH =, tstzrange(scheduled_at, ends_at, '[)') WITH &&) WHERE (status <> 'CANCELED')",
+)
+POSTGRES_UNINSTALL_SQL = (
+    f"ALTER TABLE {TABLE} DROP CONSTRAINT IF EXISTS {EXCLUSION_CONSTRAINT}",
+)
+
+
+def fill_ends_at(apps, schema_editor):
+    # 기존 상담은 모두 30분 상담으로 봅니다. (SLOT_LENGTH)
+    Consultation = apps.get_model('consultations', 'Consultation')
+    Consultation.objects.update(ends_at=models.F('scheduled_at') + timedelta(minutes=30))
+
+
+def install_exclusion_constraint(apps, schema_editor):
+    # PostgreSQL만: 같은 강사의 시간 겹침을 막는 배제 제약 (SQLite는 scheduling.book()의 잠금 검사만 사용)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT DISTINCT a.id FROM {TABLE} a JOIN {TABLE} b "
+            f"ON a.instructor_id = b.instructor_id AND a.id <> b.id "
+            f"AND a.scheduled_at < b.ends_at AND b.scheduled_at < a.ends_at "
+            f"WHERE a.status <> 'CANCELED' AND b.status <> 'CANCELED' ORDER BY a.id"
+        )
+        conflicts = [row[0] for row in cursor.fetchall()]
+    if conflicts:
+        # 이미 겹쳐 있는 상담은 자동으로 고치지 않습니다. (어느 쪽을 취소할지는 사람이 정해야 함)
+        raise RuntimeError(f"시간이 겹치는 상담이 있어 배제 제약을 만들 수 없습니다. 정리 후 다시 실행하세요: {conflicts}")
+    for sql in POSTGRES_INSTALL_SQL:
+        schema_editor.execute(sql)
+
+
+def uninstall_exclusion_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for sql in POSTGRES_UNINSTALL_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0005_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructorAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, '월'), (1, '화'), (2, '수'), (3, '목'), (4, '금'), (5, '토'), (6, '일')])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+            ],
+            options={
+                'ordering': ['instructor', 'weekday', 'start_time'],
+            },
+        ),
+        migrations.AddField(
+            model_name='consultation',
+            name='ends_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_ends_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='consultation',
+            name='ends_at',
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='consultation',
+            index=models.Index(fields=['instructor', 'scheduled_at'], name='consult_instructor_sched_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='consultation',
+            constraint=models.CheckConstraint(condition=models.Q(('ends_at__gt', models.F('scheduled_at'))), name='consult_ends_after_start'),
+        ),
+        migrations.AddField(
+            model_name='instructoravailability',
+            name='instructor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availabilities', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='instructoravailability',
+            index=models.Index(fields=['instructor', 'weekday', 'start_time'], name='availability_instructor_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='instructoravailability',
+            constraint=models.CheckConstraint(condition=models.Q(('end_time__gt', models.F('start_time'))), name='availability_end_after_start'),
+        ),
+        migrations.RunPython(install_exclusion_constraint, uninstall_exclusion_constraint),
+    ]
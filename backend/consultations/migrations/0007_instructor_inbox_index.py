@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('consultations', '0006_consultation_slots'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultation',
+            index=models.Index(fields=['instructor', 'status', 'scheduled_at'], name='consult_instructor_status_idx'),
+        ),
+    ]
@@ -1,6 +1,11 @@
+from datetime import timedelta
+
 from django.db import models
 from user.models import User
 
+# 상담 한 건의 길이 (빈 시간 슬롯 단위)
+SLOT_LENGTH = timedelta(minutes=30)
+
 class Consultation(models.Model):
     # 상태 상수
     STATUS_CHOICES = (
@@ -33,8 +38,56 @@ class Consultation(models.Model):
     content = models.TextField() 
     
     scheduled_at = models.DateTimeField() 
+    # 상담 종료 시각 (scheduled_at + SLOT_LENGTH, 저장할 때 계산) - 강사별 시간 겹침 검사에 사용
+    ends_at = models.DateTimeField(editable=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 내 상담 목록: WHERE student_id = ? ORDER BY created_at DESC
+            models.Index(fields=['student', 'created_at'], name='consult_student_created_idx'),
+            # 상태 필터: WHERE student_id = ? AND status = ? ORDER BY created_at DESC
+            models.Index(fields=['student', 'status', 'created_at'], name='consult_student_status_idx'),
+            # 강사 일정: WHERE instructor_id IN (...) AND scheduled_at BETWEEN ? AND ? (빈 시간 조회, 겹침 검사)
+            models.Index(fields=['instructor', 'scheduled_at'], name='consult_instructor_sched_idx'),
+            # 강사 상담함 상태 필터: WHERE instructor_id = ? AND status = ? ORDER BY scheduled_at, id
+            models.Index(fields=['instructor', 'status', 'scheduled_at'], name='consult_instructor_status_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(ends_at__gt=models.F('scheduled_at')), name='consult_ends_after_start'),
+        ]
+        # PostgreSQL에서는 같은 강사의 시간 겹침을 배제 제약(consult_no_overlap)으로도 막습니다.
+        # (migrations/0006_consultation_slots.py, consultations/scheduling.py)
+
+    def save(self, *args, **kwargs):
+        self.ends_at = self.scheduled_at + SLOT_LENGTH
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.student.username} -> {self.instructor.username} ({self.status})"
+
+
+class InstructorAvailability(models.Model):
+    """강사의 주간 상담 가능 시간 (요일별 반복, 서버 시간대 기준 시각)"""
+    WEEKDAY_CHOICES = (
+        (0, '월'), (1, '화'), (2, '수'), (3, '목'), (4, '금'), (5, '토'), (6, '일'),
+    )
+
+    instructor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='availabilities')
+    weekday = models.PositiveSmallIntegerField(choices=WEEKDAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+
+    class Meta:
+        ordering = ['instructor', 'weekday', 'start_time']
+        indexes = [
+            # 빈 시간 조회: WHERE instructor_id IN (...) (요일/시작 시각 순)
+            models.Index(fields=['instructor', 'weekday', 'start_time'], name='availability_instructor_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(end_time__gt=models.F('start_time')), name='availability_end_after_start'),
+        ]
+
     def __str__(self):
-        return f"{self.student.username} -> {self.instructor.username} ({self.status})"
\ No newline at end of file
+        return f"{self.instructor.username} {self.get_weekday_display()} {self.start_time:%H:%M}-{self.end_time:%H:%M}"
\ No newline at end of file
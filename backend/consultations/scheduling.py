@@ -0,0 +1,209 @@
+# backend/consultations/scheduling.py
+
+import bisect
+import datetime
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from user.models import User
+from .models import Consultation, InstructorAvailability, SLOT_LENGTH
+
+CANCELED = 'CANCELED'
+
+# 빈 시간 조회 한 번에 받는 최대 강사 수 / 기간 (월 달력 6주)
+MAX_INSTRUCTORS = 50
+MAX_DAYS = 42
+
+# PostgreSQL 배제 제약: 같은 강사의 (취소되지 않은) 상담 시간 [scheduled_at, ends_at)가 겹치지 않게 합니다.
+# 제약은 migrations/0006에서 만들고, 여기서는 저장 중 위반을 SlotConflict로 바꿀 때 이름만 씁니다.
+# SQLite에는 배제 제약이 없으므로 book()의 잠근 상태 겹침 검사로만 막습니다.
+EXCLUSION_CONSTRAINT = 'consult_no_overlap'
+
+
+class SlotConflict(Exception):
+    """같은 강사의 다른 상담과 시간이 겹침"""
+
+
+class OutsideAvailability(Exception):
+    """강사의 상담 가능 시간(슬롯)이 아님"""
+
+
+def parse_range(params):
+    """
+    쿼리 파라미터 -> (강사 ID 목록, 시작일, 종료일) (잘못된 값은 400)
+    - instructor_id: 쉼표로 여러 개 (최대 50명)
+    - start / end: 조회 기간 (YYYY-MM-DD, 종료일 포함, 최대 42일)
+    """
+    values = [value.strip() for value in params.get('instructor_id', '').split(',') if value.strip()]
+    if not values:
+        raise ValidationError({'instructor_id': "강사 ID를 입력해야 합니다."})
+    if not all(value.isdigit() for value in values):
+        raise ValidationError({'instructor_id': "정수여야 합니다."})
+    instructor_ids = list(dict.fromkeys(int(value) for value in values))
+    if len(instructor_ids) > MAX_INSTRUCTORS:
+        raise ValidationError({'instructor_id': f"한 번에 최대 {MAX_INSTRUCTORS}명까지 조회할 수 있습니다."})
+
+    dates = {}
+    for name in ('start', 'end'):
+        try:
+            dates[name] = datetime.date.fromisoformat(params.get(name, ''))
+        except ValueError:
+            raise ValidationError({name: "YYYY-MM-DD 형식이어야 합니다."})
+    if dates['end'] < dates['start']:
+        raise ValidationError({'end': "시작일 이후여야 합니다."})
+    if (dates['end'] - dates['start']).days >= MAX_DAYS:
+        raise ValidationError({'end': f"기간은 최대 {MAX_DAYS}일입니다."})
+    return instructor_ids, dates['start'], dates['end']
+
+
+def booked(instructor_ids, start, end):
+    """
+    기간 [start, end)와 겹치는 (취소되지 않은) 상담 시작 시각 -> {강사 ID: 정렬된 시작 시각 목록}
+    상담 길이가 SLOT_LENGTH로 고정이므로 시작 시각 범위만으로 겹치는 상담을 모두 찾습니다.
+    (consult_instructor_sched_idx 범위 스캔, 강사 수와 관계없이 쿼리 1번)
+    시작 시각은 start와 같은 시간대로 바꿔 둡니다. (시간대가 같으면 비교할 때 UTC 변환을 하지 않음)
+    """
+    tz = start.tzinfo
+    rows = (
+        Consultation.objects
+        .filter(instructor_id__in=instructor_ids, scheduled_at__gt=start - SLOT_LENGTH, scheduled_at__lt=end)
+        .exclude(status=CANCELED).order_by().values_list('instructor_id', 'scheduled_at')
+    )
+    starts = defaultdict(list)
+    for instructor_id, scheduled_at in rows:
+        starts[instructor_id].append(scheduled_at.astimezone(tz))
+    for values in starts.values():
+        values.sort()
+    return starts
+
+
+def windows_of(instructor_ids):
+    """강사별 요일별 상담 가능 시간 -> {강사 ID: {요일: [(시작, 종료), ...]}}"""
+    windows = defaultdict(lambda: defaultdict(list))
+    rows = InstructorAvailability.objects.filter(instructor_id__in=instructor_ids).order_by().values_list(
+        'instructor_id', 'weekday', 'start_time', 'end_time',
+    )
+    for instructor_id, weekday, start_time, end_time in rows:
+        windows[instructor_id][weekday].append((start_time, end_time))
+    for by_weekday in windows.values():
+        for values in by_weekday.values():
+            values.sort()
+    return windows
+
+
+def window_slots(day, start_time, end_time, tz):
+    """하루의 상담 가능 시간을 SLOT_LENGTH 단위로 나눈 슬롯 시작 시각 (tz: 서버 시간대)"""
+    slot = datetime.datetime.combine(day, start_time, tzinfo=tz)
+    end = datetime.datetime.combine(day, end_time, tzinfo=tz)
+    while slot + SLOT_LENGTH <= end:
+        yield slot
+        slot += SLOT_LENGTH
+
+
+def free_slots(instructor_ids, start_date, end_date):
+    """
+    기간(start_date ~ end_date, 종료일 포함)의 강사별 빈 슬롯 시작 시각 -> {강사 ID: [datetime, ...]}
+    상담 가능 시간에서 이미 잡힌 상담과 겹치는 슬롯, 지난 슬롯을 뺍니다.
+    쿼리는 가능 시간 1번 + 상담 1번이고, 겹침 판정은 정렬된 시작 시각 이분 탐색으로 합니다.
+    슬롯은 서버 시간대(aware datetime)로 만들어지므로 응답에서 다시 변환할 필요가 없습니다.
+    """
+    tz = timezone.get_current_timezone()
+    range_start = datetime.datetime.combine(start_date, datetime.time.min, tzinfo=tz)
+    range_end = datetime.datetime.combine(end_date + datetime.timedelta(days=1), datetime.time.min, tzinfo=tz)
+    windows = windows_of(instructor_ids)
+    starts = booked([pk for pk in instructor_ids if pk in windows], range_start, range_end)
+    now = timezone.localtime(timezone.now(), tz)
+
+    days = [start_date + datetime.timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    result = {}
+    for instructor_id in instructor_ids:
+        taken = starts.get(instructor_id, [])
+        slots = []
+        for day in days:
+            for start_time, end_time in windows.get(instructor_id, {}).get(day.weekday(), ()):
+                for slot in window_slots(day, start_time, end_time, tz):
+                    if slot < now:
+                        continue
+                    # slot 종료 전에 시작한 상담 중 가장 늦은 것이 slot 시작 뒤에 끝나면 겹칩니다.
+                    index = bisect.bisect_left(taken, slot + SLOT_LENGTH)
+                    if index and taken[index - 1] + SLOT_LENGTH > slot:
+                        continue
+                    slots.append(slot)
+        result[instructor_id] = slots
+    return result
+
+
+def is_available(instructor_id, scheduled_at):
+    """
+    scheduled_at이 강사의 상담 가능 시간 안의 슬롯인지 (슬롯 경계에 맞아야 함)
+    상담 가능 시간을 하나도 등록하지 않은 강사는 시간 제한 없이 신청을 받습니다.
+    """
+    windows = windows_of([instructor_id]).get(instructor_id)
+    if not windows:
+        return True
+    tz = timezone.get_current_timezone()
+    local = timezone.localtime(scheduled_at, tz)
+    for start_time, end_time in windows.get(local.weekday(), ()):
+        if local in window_slots(local.date(), start_time, end_time, tz):
+            return True
+    return False
+
+
+def has_conflict(instructor_id, scheduled_at, exclude_pk=None):
+    """같은 강사의 (취소되지 않은) 다른 상담과 시간이 겹치는지 (consult_instructor_sched_idx 범위 조회)"""
+    overlapping = Consultation.objects.filter(
+        instructor_id=instructor_id,
+        scheduled_at__gt=scheduled_at - SLOT_LENGTH,
+        scheduled_at__lt=scheduled_at + SLOT_LENGTH,
+    ).exclude(status=CANCELED)
+    if exclude_pk is not None:
+        overlapping = overlapping.exclude(pk=exclude_pk)
+    return overlapping.exists()
+
+
+def book(serializer, **extra):
+    """
+    상담 신청/수정 저장 (ConsultationSerializer, 검증이 끝난 상태)
+    강사/시간/상태가 바뀌어 시간을 새로 차지하면 강사의 가능 시간과 다른 상담과의 겹침을 확인합니다.
+    - 가능 시간이 아니면 OutsideAvailability, 겹치면 SlotConflict
+    겹침 검사와 저장은 한 트랜잭션에서 강사 행을 잠근 채 실행되어, 같은 강사에 대한 동시 신청은 한 줄로 섭니다.
+    (SQLite는 IMMEDIATE 트랜잭션이 시작할 때 쓰기 잠금을 잡으므로 같은 효과, PostgreSQL은 배제 제약이 한 번 더 막음)
+    """
+    instance = serializer.instance
+    data = serializer.validated_data
+    instructor = data.get('instructor', getattr(instance, 'instructor', None))
+    scheduled_at = data.get('scheduled_at', getattr(instance, 'scheduled_at', None))
+    status = data.get('status', getattr(instance, 'status', 'PENDING'))
+
+    moved = instance is None or any(
+        name in data and data[name] != getattr(instance, name) for name in ('instructor', 'scheduled_at', 'status')
+    )
+    # 취소된 상담은 시간을 차지하지 않고, 시간과 관계없는 수정(내용 등)은 검사하지 않습니다.
+    if status == CANCELED or not moved:
+        return serializer.save(**extra)
+
+    if not is_available(instructor.pk, scheduled_at):
+        raise OutsideAvailability
+    with transaction.atomic():
+        User.objects.select_for_update().filter(pk=instructor.pk).values_list('pk').first()
+        if has_conflict(instructor.pk, scheduled_at, exclude_pk=getattr(instance, 'pk', None)):
+            raise SlotConflict
+        try:
+            with transaction.atomic():
+                return serializer.save(**extra)
+        except IntegrityError as exc:
+            if EXCLUSION_CONSTRAINT in str(exc):
+                raise SlotConflict from exc
+            raise
+
+
+@transaction.atomic
+def set_availability(instructor, windows):
+    """강사의 상담 가능 시간을 windows([{weekday, start_time, end_time}, ...])로 교체합니다."""
+    InstructorAvailability.objects.filter(instructor=instructor).delete()
+    return InstructorAvailability.objects.bulk_create(
+        [InstructorAvailability(instructor=instructor, **window) for window in windows]
+    )
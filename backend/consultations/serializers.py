@@ -1,17 +1,27 @@
 from rest_framework import serializers
-from .models import Consultation
+from doro.prefetch import EagerLoadingMixin
+from .inbox import can_transition, MAX_BATCH
+from .models import Consultation, InstructorAvailability
 from user.models import User
 
-class ConsultationSerializer(serializers.ModelSerializer):
+class ConsultationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     student_name = serializers.ReadOnlyField(source='student.username')
     # instructor_name을 커스텀 메서드로 변경하여 성+이름 조합으로 반환
     instructor_name = serializers.SerializerMethodField()
 
+    select_related_fields = ('student', 'instructor')
+
     class Meta:
         model = Consultation
         fields = '__all__'
         read_only_fields = ['student', 'created_at'] # status는 수정 가능해야 하므로 read_only에서 제외
 
+    def validate_status(self, value):
+        # 상태 변경은 상태 전이 규칙을 따릅니다. (consultations/inbox.py TRANSITIONS)
+        if self.instance is not None and not can_transition(self.instance.status, value):
+            raise serializers.ValidationError(f"{self.instance.status}에서 {value}(으)로 바꿀 수 없습니다.")
+        return value
+
     def get_instructor_name(self, obj):
         # 성(last_name) + 이름(first_name) 조합. 없으면 아이디(username) 사용
         full_name = f"{obj.instructor.last_name}{obj.instructor.first_name}"
@@ -20,4 +30,35 @@ class ConsultationSerializer(serializers.ModelSerializer):
 class InstructorSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'first_name', 'last_name']
\ No newline at end of file
+        fields = ['id', 'username', 'first_name', 'last_name']
+
+
+class InstructorAvailabilitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = InstructorAvailability
+        fields = ['id', 'weekday', 'start_time', 'end_time']
+        read_only_fields = ['id']
+
+    def validate(self, attrs):
+        if attrs['end_time'] <= attrs['start_time']:
+            raise serializers.ValidationError({'end_time': "시작 시각보다 늦어야 합니다."})
+        return attrs
+
+
+class AvailabilityUpdateSerializer(serializers.Serializer):
+    """상담 가능 시간 전체 교체 (PUT)"""
+    windows = InstructorAvailabilitySerializer(many=True)
+
+    def validate_windows(self, windows):
+        # 같은 요일의 시간대끼리 겹치면 슬롯이 두 번 만들어지므로 막습니다.
+        ordered = sorted(windows, key=lambda window: (window['weekday'], window['start_time']))
+        for before, after in zip(ordered, ordered[1:]):
+            if before['weekday'] == after['weekday'] and after['start_time'] < before['end_time']:
+                raise serializers.ValidationError("같은 요일의 상담 가능 시간이 겹칩니다.")
+        return ordered
+
+
+class ConsultationTransitionSerializer(serializers.Serializer):
+    """상담 일괄 상태 변경 (강사 상담함)"""
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=MAX_BATCH)
+    status = serializers.ChoiceField(choices=['APPROVED', 'COMPLETED', 'CANCELED'])
@@ -0,0 +1,16 @@
+# backend/consultations/signals.py
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .inbox import EVENT_FIELDS, publish_changes
+from .models import Consultation
+
+
+# === 실시간 이벤트 (새 신청, 상세 수정/상태 변경) ===
+# 강사 상담함의 일괄 상태 변경은 UPDATE로 처리되므로 inbox.transition()이 직접 보냅니다.
+
+@receiver(post_save, sender=Consultation)
+def consultation_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        publish_changes([{field: getattr(instance, field) for field in EVENT_FIELDS}])
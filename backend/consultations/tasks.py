@@ -0,0 +1,27 @@
+# backend/consultations/tasks.py
+
+from django.core.mail import send_mail
+from django.utils import timezone
+
+from taskqueue.queue import task
+from .models import Consultation
+
+
+@task()
+def send_consultation_confirmation(consultation_id):
+    """상담 확정 안내 메일 (강사가 승인한 상담, 보내기 전에 취소되었으면 보내지 않음)"""
+    consultation = Consultation.objects.select_related('student', 'instructor').filter(pk=consultation_id).first()
+    if consultation is None or consultation.status != 'APPROVED' or not consultation.student.email:
+        return
+
+    instructor = consultation.instructor
+    instructor_name = f"{instructor.last_name}{instructor.first_name}".strip() or instructor.username
+    scheduled_at = timezone.localtime(consultation.scheduled_at)
+    send_mail(
+        "[DORO] 상담 일정이 확정되었습니다",
+        f"{instructor_name} 강사님과의 {consultation.get_consultation_type_display()} "
+        f"({consultation.get_method_display()})이 {scheduled_at:%Y-%m-%d %H:%M}에 확정되었습니다.",
+        None,
+        [consultation.student.email],
+        fail_silently=False,
+    )
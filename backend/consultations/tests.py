@@ -1,3 +1,169 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from taskqueue.models import Task
+from user.models import User
+from . import inbox, scheduling
+from .models import Consultation, InstructorAvailability, SLOT_LENGTH
+from .serializers import ConsultationSerializer
+
+
+class SchedulingTests(APITestCase):
+    """빈 슬롯 계산, 가능 시간/겹침 검사, 중복 신청 409 (consultations/scheduling.py)"""
+
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', role=2)
+        self.student = User.objects.create(username='student', role=1)
+        # 다음 주 월요일 10:00-12:00 (30분 슬롯 4개)
+        today = timezone.localdate()
+        self.day = today + datetime.timedelta(days=7 - today.weekday())
+        InstructorAvailability.objects.create(
+            instructor=self.instructor, weekday=0, start_time=datetime.time(10), end_time=datetime.time(12),
+        )
+
+    def at(self, hour, minute=0):
+        return datetime.datetime.combine(self.day, datetime.time(hour, minute), tzinfo=timezone.get_current_timezone())
+
+    def consult(self, scheduled_at, status='PENDING'):
+        return Consultation.objects.create(
+            student=self.student, instructor=self.instructor, content='상담', scheduled_at=scheduled_at, status=status,
+        )
+
+    def free(self):
+        return scheduling.free_slots([self.instructor.pk], self.day, self.day)[self.instructor.pk]
+
+    def test_free_slots_skip_booked_and_overlapping_slots(self):
+        self.assertEqual(self.free(), [self.at(10), self.at(10, 30), self.at(11), self.at(11, 30)])
+
+        self.consult(self.at(11))
+        # 슬롯 경계에 맞지 않는 상담은 걸치는 두 슬롯을 모두 막습니다.
+        self.consult(self.at(10, 15))
+        self.consult(self.at(11, 30), status='CANCELED')
+
+        self.assertEqual(self.free(), [self.at(11, 30)])
+
+    def test_free_slots_for_instructor_without_availability(self):
+        other = User.objects.create(username='other', role=2)
+        self.assertEqual(scheduling.free_slots([other.pk], self.day, self.day), {other.pk: []})
+
+    def test_is_available(self):
+        self.assertTrue(scheduling.is_available(self.instructor.pk, self.at(11, 30)))
+        self.assertFalse(scheduling.is_available(self.instructor.pk, self.at(11, 45)))  # 경계가 아님
+        self.assertFalse(scheduling.is_available(self.instructor.pk, self.at(12)))  # 가능 시간 밖
+        self.assertFalse(scheduling.is_available(self.instructor.pk, self.at(10) + datetime.timedelta(days=1)))
+        # 가능 시간을 등록하지 않은 강사는 제한 없음
+        other = User.objects.create(username='other', role=2)
+        self.assertTrue(scheduling.is_available(other.pk, self.at(23, 45)))
+
+    def test_has_conflict(self):
+        booked = self.consult(self.at(10, 30))
+
+        self.assertTrue(scheduling.has_conflict(self.instructor.pk, self.at(10, 30)))
+        self.assertTrue(scheduling.has_conflict(self.instructor.pk, self.at(10, 45)))
+        self.assertFalse(scheduling.has_conflict(self.instructor.pk, self.at(10)))
+        self.assertFalse(scheduling.has_conflict(self.instructor.pk, self.at(10, 30) + SLOT_LENGTH))
+        # 자기 자신(수정 중인 상담)과 취소된 상담은 겹침이 아닙니다.
+        self.assertFalse(scheduling.has_conflict(self.instructor.pk, self.at(10, 30), exclude_pk=booked.pk))
+        booked.status = 'CANCELED'
+        booked.save()
+        self.assertFalse(scheduling.has_conflict(self.instructor.pk, self.at(10, 30)))
+
+    def test_double_booking_returns_409(self):
+        self.client.force_authenticate(self.student)
+        data = {'instructor': self.instructor.pk, 'content': '상담', 'scheduled_at': self.at(10).isoformat()}
+
+        first = self.client.post('/api/consultations/', data)
+        second = self.client.post('/api/consultations/', data)
+        outside = self.client.post('/api/consultations/', {**data, 'scheduled_at': self.at(13).isoformat()})
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 409)
+        self.assertEqual(outside.status_code, 400)
+        self.assertEqual(Consultation.objects.count(), 1)
+
+
+class InboxTransitionTests(APITestCase):
+    """강사 상담함 일괄 상태 변경과 상세 수정의 상태 전이 검사 (consultations/inbox.py, serializers.py)"""
+
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', role=2)
+        self.student = User.objects.create(username='student', role=1)
+        start = timezone.now() + datetime.timedelta(days=1)
+        self.pending = [self.consult(start + SLOT_LENGTH * i) for i in range(2)]
+        self.completed = self.consult(start + SLOT_LENGTH * 2, status='COMPLETED')
+
+    def consult(self, scheduled_at, status='PENDING', instructor=None):
+        return Consultation.objects.create(
+            student=self.student, instructor=instructor or self.instructor, content='상담',
+            scheduled_at=scheduled_at, status=status,
+        )
+
+    def statuses(self):
+        return dict(Consultation.objects.values_list('pk', 'status'))
+
+    def confirmations(self):
+        return list(Task.objects.filter(name='consultations.send_consultation_confirmation')
+                    .order_by('pk').values_list('payload', flat=True))
+
+    def transition(self, ids, target):
+        self.client.force_authenticate(self.instructor)
+        return self.client.post('/api/consultations/inbox/transition/', {'ids': ids, 'status': target}, format='json')
+
+    def test_unknown_or_foreign_ids_are_rejected(self):
+        other = User.objects.create(username='other', role=2)
+        foreign = self.consult(timezone.now() + datetime.timedelta(days=2), instructor=other)
+        before = self.statuses()
+
+        with self.assertRaises(inbox.UnknownConsultations) as raised:
+            inbox.transition(self.instructor, [self.pending[0].pk, foreign.pk, 999999], 'APPROVED')
+        response = self.transition([self.pending[0].pk, foreign.pk], 'APPROVED')
+
+        self.assertEqual(raised.exception.ids, [foreign.pk, 999999])
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data['ids'], [foreign.pk])
+        self.assertEqual(self.statuses(), before)
+
+    def test_invalid_transition_rolls_back_whole_batch(self):
+        before = self.statuses()
+
+        response = self.transition([p.pk for p in self.pending] + [self.completed.pk], 'APPROVED')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['conflicts'], [{'id': self.completed.pk, 'status': 'COMPLETED'}])
+        self.assertEqual(self.statuses(), before)
+        self.assertEqual(self.confirmations(), [])
+
+    def test_same_state_retry_is_idempotent(self):
+        ids = [p.pk for p in self.pending]
+        first = self.transition(ids, 'APPROVED')
+        retry = self.transition(ids, 'APPROVED')
+
+        self.assertEqual(first.data, {'status': 'APPROVED', 'updated': ids})
+        self.assertEqual((retry.status_code, retry.data), (200, {'status': 'APPROVED', 'updated': []}))
+        # 다시 보내도 확정 메일은 한 번씩만
+        self.assertEqual(self.confirmations(), [{'args': [pk], 'kwargs': {}} for pk in ids])
+
+    def test_approved_enqueues_confirmations(self):
+        changed = inbox.transition(self.instructor, [self.pending[0].pk], 'APPROVED')
+        inbox.transition(self.instructor, [self.pending[1].pk], 'CANCELED')
+
+        self.assertEqual(changed, [self.pending[0].pk])
+        self.assertEqual(self.confirmations(), [{'args': [self.pending[0].pk], 'kwargs': {}}])
+
+    def test_validate_status_follows_transitions(self):
+        invalid = ConsultationSerializer(self.completed, data={'status': 'CANCELED'}, partial=True)
+        same = ConsultationSerializer(self.completed, data={'status': 'COMPLETED'}, partial=True)
+        approve = ConsultationSerializer(self.pending[0], data={'status': 'APPROVED'}, partial=True)
+
+        self.assertFalse(invalid.is_valid())
+        self.assertIn('status', invalid.errors)
+        self.assertTrue(same.is_valid(), same.errors)
+        self.assertTrue(approve.is_valid(), approve.errors)
+
+        self.client.force_authenticate(self.instructor)
+        response = self.client.put(f'/api/consultations/{self.completed.pk}/', {'status': 'PENDING'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.completed.refresh_from_db()
+        self.assertEqual(self.completed.status, 'COMPLETED')
@@ -5,5 +5,9 @@ from . import views
 urlpatterns = [
     path("", views.consultation_list_create_api),
     path("instructors/", views.instructor_list_api),
+    path("slots/", views.consultation_slots_api),
+    path("availability/", views.availability_api),
+    path("inbox/", views.instructor_inbox_api),
+    path("inbox/transition/", views.instructor_inbox_transition_api),
     path("<int:pk>/", views.consultation_detail_api), # [추가] 상세/수정/삭제 URL
 ]
\ No newline at end of file
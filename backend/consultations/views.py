@@ -2,8 +2,13 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
-from .models import Consultation
-from .serializers import ConsultationSerializer, InstructorSerializer
+from .models import Consultation, InstructorAvailability, SLOT_LENGTH
+from .serializers import (
+    ConsultationSerializer, InstructorSerializer, InstructorAvailabilitySerializer, AvailabilityUpdateSerializer,
+    ConsultationTransitionSerializer,
+)
+from . import inbox, scheduling
+from .tasks import send_consultation_confirmation
 from user.models import User
 from lecture.models import Enrollment # Enrollment 모델 import 필요
 from django.shortcuts import get_object_or_404
@@ -17,6 +22,7 @@ def consultation_list_create_api(request):
     if request.method == 'GET':
         # 1. 기본 쿼리셋: 내가 신청한 상담 전체 (최신순)
         queryset = Consultation.objects.filter(student=request.user).order_by('-created_at')
+        queryset = ConsultationSerializer.setup_eager_loading(queryset)
 
         # 2. 필터링 적용 (쿼리 파라미터가 있을 경우)
         status_param = request.query_params.get('status')
@@ -38,13 +44,26 @@ def consultation_list_create_api(request):
         return Response(serializer.data)
 
     elif request.method == 'POST':
-        # ... (기존 POST 로직 그대로 유지) ...
         serializer = ConsultationSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(student=request.user)
+            # 강사의 상담 가능 시간 / 다른 상담과의 겹침을 확인하고 저장
+            error = booking_error(serializer, student=request.user)
+            if error:
+                return error
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+
+def booking_error(serializer, **extra):
+    """scheduling.book()으로 저장하고, 저장하지 못하면 에러 응답을 반환합니다. (성공 시 None)"""
+    try:
+        scheduling.book(serializer, **extra)
+    except scheduling.OutsideAvailability:
+        return Response({"error": "강사의 상담 가능 시간이 아닙니다."}, status=status.HTTP_400_BAD_REQUEST)
+    except scheduling.SlotConflict:
+        return Response({"error": "해당 시간에는 이미 다른 상담이 있습니다."}, status=status.HTTP_409_CONFLICT)
+    return None
+
 # 2. 강사 목록 조회 (수정됨: 내 강의 강사만)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -66,7 +85,7 @@ def instructor_list_api(request):
 @permission_classes([IsAuthenticated])
 def consultation_detail_api(request, pk):
     """상담 상세 조회, 수정, 삭제"""
-    consultation = get_object_or_404(Consultation, pk=pk)
+    consultation = get_object_or_404(ConsultationSerializer.setup_eager_loading(Consultation.objects.all()), pk=pk)
 
     # 권한 체크: 본인이 신청한 상담이거나 담당 강사만 접근 가능
     if consultation.student != request.user and consultation.instructor != request.user:
@@ -80,10 +99,88 @@ def consultation_detail_api(request, pk):
         # 수정 로직 (partial=True로 일부 필드만 수정 가능)
         serializer = ConsultationSerializer(consultation, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            approved = consultation.status != 'APPROVED' and serializer.validated_data.get('status') == 'APPROVED'
+            error = booking_error(serializer)
+            if error:
+                return error
+            if approved:
+                send_consultation_confirmation.enqueue(consultation.pk)
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     elif request.method == 'DELETE':
         consultation.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# 3. 강사별 빈 상담 시간 조회
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def consultation_slots_api(request):
+    """
+    강사별 빈 상담 슬롯 (?instructor_id=1,2,3&start=2026-11-01&end=2026-11-30)
+    슬롯 길이는 slot_minutes분이고, 각 강사의 slots에는 신청할 수 있는 시작 시각만 담깁니다.
+    """
+    instructor_ids, start, end = scheduling.parse_range(request.query_params)
+    slots = scheduling.free_slots(instructor_ids, start, end)
+    return Response({
+        'start': start,
+        'end': end,
+        'slot_minutes': int(SLOT_LENGTH.total_seconds() // 60),
+        'instructors': [
+            {'instructor_id': instructor_id, 'slots': [slot.isoformat() for slot in slots[instructor_id]]}
+            for instructor_id in instructor_ids
+        ],
+    })
+
+
+# 4. 내 상담 가능 시간 조회(GET) 및 전체 교체(PUT)
+@api_view(['GET', 'PUT'])
+@permission_classes([IsAuthenticated])
+def availability_api(request):
+    """강사 본인의 주간 상담 가능 시간 (PUT: {"windows": [{"weekday": 0, "start_time": "10:00", "end_time": "12:00"}]})"""
+    if request.method == 'PUT':
+        serializer = AvailabilityUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        scheduling.set_availability(request.user, serializer.validated_data['windows'])
+
+    windows = InstructorAvailability.objects.filter(instructor=request.user)
+    return Response(InstructorAvailabilitySerializer(windows, many=True).data)
+
+
+# 5. 강사 상담함 (내게 온 상담)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def instructor_inbox_api(request):
+    """
+    내게 신청된 상담 목록 (상담 시각 순 커서 페이지네이션 - 항상 {next_cursor, results})
+    필터: status, type, method, date_from, date_to
+    """
+    filters = inbox.parse_filters(request.query_params)
+    queryset = ConsultationSerializer.setup_eager_loading(inbox.inbox(request.user, filters))
+    page, next_cursor = inbox.inbox_pagination.paginate_queryset(queryset, request)
+    return Response(inbox.inbox_pagination.get_response_data(ConsultationSerializer(page, many=True).data, next_cursor))
+
+
+# 6. 강사 상담 일괄 상태 변경 (승인/완료/취소)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def instructor_inbox_transition_api(request):
+    """
+    {"ids": [1, 2, 3], "status": "APPROVED"} - 한 트랜잭션에서 전부 바꾸거나 하나도 바꾸지 않습니다.
+    - 없거나 내 상담이 아닌 ID: 404 / 바꿀 수 없는 상태(예: 완료 -> 취소): 409
+    """
+    serializer = ConsultationTransitionSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    target = serializer.validated_data['status']
+    try:
+        changed = inbox.transition(request.user, serializer.validated_data['ids'], target)
+    except inbox.UnknownConsultations as exc:
+        return Response({"error": "상담을 찾을 수 없습니다.", "ids": exc.ids}, status=status.HTTP_404_NOT_FOUND)
+    except inbox.InvalidTransition as exc:
+        return Response({
+            "error": f"{target}(으)로 바꿀 수 없는 상담이 있습니다.",
+            "conflicts": [{'id': pk, 'status': current} for pk, current in exc.conflicts],
+        }, status=status.HTTP_409_CONFLICT)
+    return Response({'status': target, 'updated': changed})
+
@@ -5,6 +5,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
+
+실시간 이벤트 스트림(/api/stream/, doro/stream.py)은 연결을 오래 열어 두므로 ASGI 서버에서만 제공합니다.
+    uvicorn doro.asgi:application
+기본 pub/sub(프로세스 메모리)은 같은 프로세스에서 생긴 변경만 전달하므로, 서버 프로세스를 여러 개 띄우면
+DORO_REALTIME_BACKEND=redis 로 바꿉니다. (settings.REALTIME)
+스트림 접속권(/api/stream/ticket/)은 캐시에 보관하므로 이때 캐시도 DORO_CACHE_BACKEND=redis(또는 file)로 공유합니다.
 """
 
 import os
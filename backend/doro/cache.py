@@ -0,0 +1,151 @@
+# backend/doro/cache.py
+
+import threading
+import uuid
+from urllib.parse import urlencode
+
+from django.core.cache import caches
+from django.db import transaction
+
+from .metrics import current_metrics
+
+MISSING = object()
+
+
+def make_key(resource, *parts, params=None):
+    """
+    리소스 단위 캐시 키 생성
+    make_key('lecture', 42, 'notices', params={'page_size': 20}) -> 'lecture:42:notices?page_size=20'
+    """
+    key = ':'.join(str(part) for part in (resource, *parts))
+    if params:
+        key += '?' + urlencode(sorted(params.items()))
+    return key
+
+
+class TaggedCache:
+    """
+    Django 캐시 백엔드(locmem / file / redis) 위에 태그 기반 무효화를 얹은 캐시
+
+    값을 저장할 때 태그별 버전을 함께 저장해두고, 읽을 때 현재 태그 버전과 다르면 미스로 처리합니다.
+    invalidate('lecture:42')는 태그 버전만 바꾸므로 관련 키를 하나하나 찾아 지울 필요가 없고,
+    값과 태그 버전은 get_many 한 번으로 함께 읽습니다.
+    TTL과 크기 제한(LRU 제거)은 백엔드 설정(CACHES의 TIMEOUT, MAX_ENTRIES)을 따릅니다.
+    """
+
+    def __init__(self, alias='default', prefix='tagged'):
+        self.alias = alias
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _entry_key(self, key):
+        return f'{self.prefix}:entry:{key}'
+
+    def _tag_key(self, tag):
+        return f'{self.prefix}:tag:{tag}'
+
+    @staticmethod
+    def _new_version():
+        return uuid.uuid4().hex
+
+    # --- 통계 (프로세스별 카운터) ---
+    # 카운터는 이 프로세스의 조회만 셉니다. locmem은 캐시 자체도 워커마다 따로라 워커별 적중률이고,
+    # redis/file처럼 캐시를 공유해도 카운터는 합쳐지지 않습니다. (Server-Timing cache, run_benchmarks meta)
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {'hits': 0, 'misses': 0, 'sets': 0, 'invalidations': 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _count_lookup(self, hit):
+        # 프로세스 통계와 함께 현재 요청의 측정값(Server-Timing)에도 더합니다.
+        self._count('hits' if hit else 'misses')
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.add_cache_lookup(hit)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+    # --- 조회 / 저장 ---
+    def _current_versions(self, tags, fetched):
+        """태그별 현재 버전 (처음 쓰이는 태그는 새 버전을 발급)"""
+        versions = {}
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            version = fetched.get(tag_key)
+            if version is None:
+                version = self._new_version()
+                # 다른 프로세스가 먼저 발급했다면 그 값을 따릅니다.
+                if not self.backend.add(tag_key, version, None):
+                    version = self.backend.get(tag_key, version)
+            versions[tag] = version
+        return versions
+
+    def get(self, key, tags=(), default=None):
+        value, _ = self._lookup(key, tags)
+        return default if value is MISSING else value
+
+    def _lookup(self, key, tags):
+        entry_key = self._entry_key(key)
+        fetched = self.backend.get_many([entry_key, *(self._tag_key(tag) for tag in tags)])
+        versions = self._current_versions(tags, fetched)
+
+        entry = fetched.get(entry_key)
+        if entry is not None and entry['tags'] == versions:
+            self._count_lookup(True)
+            return entry['value'], versions
+        self._count_lookup(False)
+        return MISSING, versions
+
+    def set(self, key, value, tags=(), timeout=None, versions=None):
+        if versions is None:
+            versions = self._current_versions(tags, self.backend.get_many([self._tag_key(tag) for tag in tags]))
+        entry = {'tags': versions, 'value': value}
+        if timeout is None:
+            self.backend.set(self._entry_key(key), entry)
+        else:
+            self.backend.set(self._entry_key(key), entry, timeout)
+        self._count('sets')
+
+    def get_or_set(self, key, builder, tags=(), timeout=None):
+        """캐시에 있으면 반환, 없으면 builder()로 계산해 저장 후 반환"""
+        value, versions = self._lookup(key, tags)
+        if value is MISSING:
+            value = builder()
+            # 계산 전에 읽은 태그 버전으로 저장하므로, 계산 중 무효화되면 다음 조회에서 다시 계산됩니다.
+            self.set(key, value, tags, timeout, versions=versions)
+        return value
+
+    def delete(self, key):
+        self.backend.delete(self._entry_key(key))
+
+    def invalidate(self, *tags):
+        """태그가 붙은 모든 캐시 값을 무효화"""
+        if not tags:
+            return
+        self.backend.set_many({self._tag_key(tag): self._new_version() for tag in tags}, None)
+        self._count('invalidations', len(tags))
+
+    def invalidate_on_commit(self, *tags):
+        """
+        현재 트랜잭션이 커밋된 뒤 무효화 (트랜잭션 밖이면 바로)
+        커밋 전에 무효화하면 그 사이 다른 요청이 커밋 전 데이터를 새 태그 버전으로 다시 캐시해
+        만료될 때까지 옛 값이 남고, 롤백되면 쓸데없이 캐시만 비웁니다. (모델 시그널에서 사용)
+        """
+        transaction.on_commit(lambda: self.invalidate(*tags))
+
+
+# 앱 공용 인스턴스
+tagged_cache = TaggedCache()
@@ -0,0 +1,54 @@
+# backend/doro/conditional.py
+
+import functools
+import hashlib
+
+from django.db.models import Count, Max
+from django.views.decorators.http import condition
+
+
+def conditional_on(get_querysets, field='updated_at'):
+    """
+    조건부 GET(ETag) 데코레이터
+    get_querysets(**view_kwargs)가 돌려준 queryset들의 COUNT와 MAX(updated_at)만으로
+    검증값을 만들기 때문에, 변경이 없으면 직렬화 없이 304(본문 없음)를 응답합니다.
+    - 수정: MAX(updated_at)가 바뀜 / 추가: COUNT, MAX가 바뀜 / 삭제: COUNT가 바뀜
+
+    Last-Modified는 보내지 않습니다. 삭제는 MAX(updated_at)를 바꾸지 않으므로 If-Modified-Since만 보내는
+    클라이언트가 삭제 후에도 304를 받게 되기 때문입니다. (ETag/If-None-Match만 사용)
+
+    검증값은 get_querysets의 행만 봅니다. 응답에 JOIN으로 함께 나가는 다른 테이블의 값
+    (작성자 이름 student_name, 강의 이름 등)이 바뀌어도 ETag는 그대로이므로, 그런 값이 바뀌는 경우에는
+    해당 행의 updated_at을 함께 갱신하거나 그 테이블의 queryset을 get_querysets에 더해야 합니다.
+
+    @api_view 아래(안쪽)에 두어야 인증/권한 검사 이후에 실행됩니다.
+    검증은 GET/HEAD에만 적용합니다. 같은 뷰의 POST/PUT/DELETE는 집계 쿼리 없이 그대로 실행되고,
+    캐시된 ETag를 If-None-Match로 함께 보내도 412가 되지 않습니다.
+
+        @api_view(['GET'])
+        @permission_classes([IsAuthenticated])
+        @conditional_on(lambda lecture_id: [LectureNotice.objects.filter(lecture_id=lecture_id)])
+        def course_notice_list_api(request, lecture_id): ...
+    """
+    def etag_func(request, *args, **kwargs):
+        count, latest = 0, None
+        for queryset in get_querysets(*args, **kwargs):
+            result = queryset.order_by().aggregate(count=Count('pk'), latest=Max(field))
+            count += result['count']
+            if result['latest'] is not None and (latest is None or result['latest'] > latest):
+                latest = result['latest']
+        raw = f"{request.path}:{count}:{latest.isoformat() if latest else ''}"
+        return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+    conditional = condition(etag_func=etag_func)
+
+    def decorator(view):
+        conditional_view = conditional(view)
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method in ('GET', 'HEAD'):
+                return conditional_view(request, *args, **kwargs)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,97 @@
+# backend/doro/metrics.py
+
+import contextvars
+import time
+from contextlib import contextmanager
+
+from rest_framework import serializers
+
+# 현재 요청의 측정값 (RequestMetricsMiddleware가 샘플링한 요청에서만 설정됨)
+current_metrics = contextvars.ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """요청 하나 동안 모은 측정값"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total_time = 0.0
+        self.db_time = 0.0
+        self.query_count = 0
+        self.serializer_time = 0.0
+        self.serializer_db_time = 0.0   # 시리얼라이저 안에서 실행된 쿼리 시간 (지연 평가된 queryset)
+        self.queries = []          # (sql, duration, origin) - 느린 요청 로그용 (최대 max_logged_queries개)
+        self._seen = set()
+        self.duplicate_count = 0
+        self._serializer_depth = 0
+        self.cache_hits = 0        # TaggedCache 조회 적중/미스 (doro/cache.py)
+        self.cache_misses = 0
+
+    def add_query(self, sql, params, duration, origin, max_logged_queries):
+        self.query_count += 1
+        self.db_time += duration
+        if self._serializer_depth:
+            self.serializer_db_time += duration
+        key = (sql, repr(params))
+        if key in self._seen:
+            self.duplicate_count += 1
+        else:
+            self._seen.add(key)
+        if len(self.queries) < max_logged_queries:
+            self.queries.append((sql, duration, origin))
+
+    def add_cache_lookup(self, hit):
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    @property
+    def pure_serializer_time(self):
+        """DB 시간을 뺀 순수 직렬화 시간"""
+        return max(self.serializer_time - self.serializer_db_time, 0.0)
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self.started
+
+
+@contextmanager
+def serializer_timer():
+    """시리얼라이저 .data 계산 시간 누적 (중첩 호출은 바깥 한 번만 계산)"""
+    metrics = current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    metrics._serializer_depth += 1
+    began = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._serializer_depth -= 1
+        if metrics._serializer_depth == 0:
+            metrics.serializer_time += time.perf_counter() - began
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    @property
+    def data(self):
+        with serializer_timer():
+            return super().data
+
+
+class SerializerTimingMixin:
+    """
+    .data 계산 시간을 요청 측정값(Server-Timing의 ser)에 더하는 시리얼라이저 믹스인
+    many=True로 만들어지는 ListSerializer도 TimedListSerializer로 바꿔 함께 측정합니다.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, 'Meta', None)
+        if meta is not None and not hasattr(meta, 'list_serializer_class'):
+            meta.list_serializer_class = TimedListSerializer
+
+    @property
+    def data(self):
+        with serializer_timer():
+            return super().data
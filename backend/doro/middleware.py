@@ -0,0 +1,152 @@
+# backend/doro/middleware.py
+
+import json
+import logging
+import random
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+from .cache import tagged_cache
+from .metrics import RequestMetrics, current_metrics
+
+slow_request_logger = logging.getLogger('doro.slow_requests')
+
+DEFAULTS = {
+    'SAMPLE_RATE': 1.0,          # 측정할 요청 비율 (0.0 ~ 1.0)
+    'SLOW_REQUEST_MS': 500,      # 이 시간보다 오래 걸린 요청은 SQL과 함께 로그로 남김
+    'SERVER_TIMING': True,       # Server-Timing 응답 헤더 추가
+    'MAX_LOGGED_QUERIES': 50,    # 느린 요청 로그에 남길 최대 SQL 수
+}
+
+PROJECT_DIR = str(Path(settings.BASE_DIR).resolve())
+# 라이브러리와 doro 공용 모듈(미들웨어, 캐시 등) 프레임은 건너뛰고 뷰/앱 코드 위치를 찾습니다.
+LIBRARY_MARKERS = ('site-packages', 'dist-packages', str(Path(__file__).resolve().parent))
+
+
+def query_origin():
+    """쿼리를 실행한 프로젝트 코드 위치 (라이브러리/미들웨어 프레임은 건너뜀)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(PROJECT_DIR) and not any(marker in filename for marker in LIBRARY_MARKERS):
+            return f"{Path(filename).relative_to(PROJECT_DIR)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class RequestMetricsMiddleware:
+    """
+    요청별 전체 시간, DB 시간, 쿼리 수, 중복 쿼리 수, 시리얼라이저 시간을 측정해
+    Server-Timing 헤더로 내보내고, 느린 요청은 SQL과 호출 위치를 구조화 로그로 남깁니다.
+    설정: settings.REQUEST_METRICS (SAMPLE_RATE로 운영 환경에서는 일부 요청만 측정)
+    동기/비동기 모두 지원합니다. (ASGI에서 맨 앞의 미들웨어가 동기 전용이면 측정하지 않는 요청과
+    비동기 뷰(실시간 스트림)까지 모든 요청이 동기<->비동기 변환을 거치게 됨)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = {**DEFAULTS, **getattr(settings, 'REQUEST_METRICS', {})}
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if random.random() >= self.config['SAMPLE_RATE']:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with self.record_queries(metrics):
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        if random.random() >= self.config['SAMPLE_RATE']:
+            return await self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            # DB 연결은 스레드별이고, 동기 뷰/ORM 호출은 요청마다 정해진 스레드(sync_to_async)에서 실행되므로
+            # 쿼리 기록 래퍼도 그 스레드의 연결에 겁니다. (측정하는 요청만 스레드를 한 번 더 오감)
+            with await sync_to_async(self.record_queries)(metrics):
+                response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def record_queries(self, metrics):
+        """현재 스레드의 모든 DB 연결에 쿼리 기록 래퍼를 건 ExitStack (with 블록을 나가면 해제)"""
+        max_logged = self.config['MAX_LOGGED_QUERIES']
+
+        def record_query(execute, sql, params, many, context):
+            began = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                metrics.add_query(sql, params, time.perf_counter() - began, query_origin(), max_logged)
+
+        wrappers = ExitStack()
+        for alias in connections:
+            wrappers.enter_context(connections[alias].execute_wrapper(record_query))
+        return wrappers
+
+    def finish(self, request, response, metrics):
+        metrics.finish()
+        if self.config['SERVER_TIMING']:
+            response['Server-Timing'] = self.server_timing(metrics)
+        if metrics.total_time * 1000 >= self.config['SLOW_REQUEST_MS']:
+            self.log_slow_request(request, response, metrics)
+        return response
+
+    @staticmethod
+    def server_timing(metrics):
+        app_time = max(metrics.total_time - metrics.db_time - metrics.pure_serializer_time, 0.0)
+        timings = [
+            f'total;dur={metrics.total_time * 1000:.1f}',
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries, '
+            f'{metrics.duplicate_count} duplicates"',
+            f'ser;dur={metrics.pure_serializer_time * 1000:.1f}',
+            f'app;dur={app_time * 1000:.1f}',
+        ]
+        lookups = metrics.cache_hits + metrics.cache_misses
+        if lookups:
+            # 이 요청의 적중 수 + 이 프로세스의 누적 적중률 (워커마다 따로 집계)
+            timings.append(
+                f'cache;desc="{metrics.cache_hits}/{lookups} hits, '
+                f'hit-rate {tagged_cache.stats()["hit_rate"]:.2f} (process)"'
+            )
+        return ', '.join(timings)
+
+    @staticmethod
+    def log_slow_request(request, response, metrics):
+        record = {
+            'event': 'slow_request',
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'user_id': getattr(getattr(request, 'user', None), 'pk', None),
+            'total_ms': round(metrics.total_time * 1000, 1),
+            'db_ms': round(metrics.db_time * 1000, 1),
+            'serializer_ms': round(metrics.pure_serializer_time * 1000, 1),
+            'queries': metrics.query_count,
+            'duplicate_queries': metrics.duplicate_count,
+            'sql': [
+                {'sql': sql, 'ms': round(duration * 1000, 2), 'origin': origin}
+                for sql, duration, origin in metrics.queries
+            ],
+        }
+        slow_request_logger.warning(json.dumps(record, ensure_ascii=False, default=str))
@@ -0,0 +1,136 @@
+# backend/doro/pagination.py
+
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+class CursorPagination:
+    """
+    (created_at, id) 같은 정렬 키 기준 커서(keyset) 페이지네이션
+    OFFSET 없이 "마지막으로 본 행보다 뒤" 조건으로 잘라내므로,
+    아무리 깊이 스크롤해도 페이지 조회 비용이 일정합니다.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def __init__(self, ordering=('-created_at', '-id'), page_size=20, max_page_size=100):
+        # 모든 정렬 키는 같은 방향이어야 합니다. (복합 인덱스 한 방향 스캔)
+        descending = {field.startswith('-') for field in ordering}
+        if len(descending) != 1:
+            raise ValueError("정렬 키의 방향이 모두 같아야 합니다.")
+        self.ordering = tuple(ordering)
+        self.fields = tuple(field.lstrip('-') for field in ordering)
+        self.descending = descending.pop()
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def is_requested(self, request):
+        """커서 모드 사용 여부 (파라미터가 없으면 기존 전체 목록 응답 유지)"""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw in (None, ''):
+            return self.page_size
+        try:
+            size = int(raw)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "정수여야 합니다."})
+        if size < 1:
+            raise ValidationError({self.page_size_query_param: "1 이상이어야 합니다."})
+        return min(size, self.max_page_size)
+
+    # --- 커서 인코딩 (클라이언트에게는 불투명한 문자열) ---
+    def encode_cursor(self, values):
+        raw = json.dumps(list(values), default=self._json_default, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def _json_default(value):
+        # DjangoJSONEncoder는 마이크로초를 밀리초로 잘라 같은 키를 다시 찾지 못하므로 직접 처리
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        raise TypeError(f"커서에 사용할 수 없는 값입니다: {value!r}")
+
+    def decode_cursor(self, cursor, model=None):
+        """
+        커서 문자열 -> 정렬 키 값 목록
+        클라이언트가 커서를 고쳐 보낼 수 있으므로 각 값을 model 필드의 to_python()으로 변환해 확인합니다.
+        (잘못된 값이 ORM까지 가서 500이 되지 않도록, 모델 필드가 아닌 annotate 정렬 키는 문자열/숫자만)
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError({self.cursor_query_param: "잘못된 커서입니다."})
+        if not isinstance(values, list) or len(values) != len(self.fields):
+            raise ValidationError({self.cursor_query_param: "잘못된 커서입니다."})
+        try:
+            return [self._to_python(model, field, value) for field, value in zip(self.fields, values)]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise ValidationError({self.cursor_query_param: "잘못된 커서입니다."})
+
+    @staticmethod
+    def _to_python(model, field, value):
+        # None/True/목록 등은 정렬 키 값이 될 수 없습니다. (bool은 int의 하위 클래스라 따로 거름)
+        if value is None or isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise TypeError(f"커서 값이 올바르지 않습니다: {value!r}")
+        try:
+            model_field = model._meta.get_field(field) if model is not None else None
+        except FieldDoesNotExist:
+            model_field = None
+        return value if model_field is None else model_field.to_python(value)
+
+    def cursor_for(self, obj):
+        """행(모델 인스턴스 또는 dict)의 정렬 키로 커서 생성"""
+        if isinstance(obj, dict):
+            return self.encode_cursor(obj[field] for field in self.fields)
+        return self.encode_cursor(getattr(obj, field) for field in self.fields)
+
+    def keyset_filter(self, values):
+        """
+        (a, b) < (x, y) 를 인덱스가 탈 수 있는 형태로 풀어 씁니다.
+        a < x OR (a = x AND b < y)
+        """
+        lookup = 'lt' if self.descending else 'gt'
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.fields, values):
+            condition |= Q(**equal, **{f'{field}__{lookup}': value})
+            equal[field] = value
+        return condition
+
+    def filter_queryset(self, queryset, request):
+        """커서 이후의 행만 남기고 정렬 (슬라이싱 전 단계)"""
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.keyset_filter(self.decode_cursor(cursor, queryset.model)))
+        return queryset.order_by(*self.ordering)
+
+    def paginate_queryset(self, queryset, request):
+        """
+        한 페이지(page_size개)와 다음 커서를 반환합니다.
+        page_size + 1개를 가져와 다음 페이지 존재 여부를 COUNT 없이 판단합니다.
+        """
+        size = self.get_page_size(request)
+        rows = list(self.filter_queryset(queryset, request)[:size + 1])
+        return self.split_page(rows, size)
+
+    def split_page(self, rows, size):
+        if len(rows) > size:
+            rows = rows[:size]
+            return rows, self.cursor_for(rows[-1])
+        return rows, None
+
+    def get_response_data(self, data, next_cursor):
+        return {
+            'next_cursor': next_cursor,
+            'results': data,
+        }
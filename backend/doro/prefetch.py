@@ -0,0 +1,69 @@
+# backend/doro/prefetch.py
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from .metrics import SerializerTimingMixin
+
+
+class EagerLoadingMixin(SerializerTimingMixin):
+    """
+    시리얼라이저가 읽는 관계(FK, 역참조)를 직접 선언하는 믹스인
+    목록 뷰에서 setup_eager_loading()을 거치면 행마다 FK를 지연 로딩하는
+    N+1 쿼리 대신 select_related / prefetch_related 한 번으로 끝납니다.
+
+    - select_related_fields: 정참조 FK 경로 (예: 'lecture__instructor')
+    - prefetch_related_fields: 역참조/M2M 경로
+    - only_fields: 읽는 컬럼만 가져올 때 지정 (관계 컬럼은 'student__username' 형태)
+
+    중첩 시리얼라이저도 이 믹스인을 쓰면 선언이 경로 앞에 붙어 자동으로 합쳐집니다.
+    (.data 계산 시간은 SerializerTimingMixin을 통해 요청 측정값에 더해집니다.)
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    only_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return eager_load(queryset, cls)
+
+
+def collect_relations(serializer_class, prefix=''):
+    """시리얼라이저(및 중첩 시리얼라이저)가 선언한 관계 경로 수집"""
+    select = [prefix + path for path in getattr(serializer_class, 'select_related_fields', ())]
+    prefetch = [prefix + path for path in getattr(serializer_class, 'prefetch_related_fields', ())]
+    only = [prefix + path for path in getattr(serializer_class, 'only_fields', ())]
+
+    for field in serializer_class().fields.values():
+        if field.source == '*':
+            continue
+        path = prefix + field.source.replace('.', '__')
+
+        if isinstance(field, serializers.ListSerializer):
+            child_class = type(field.child)
+            if issubclass(child_class, EagerLoadingMixin):
+                # 역참조 목록은 별도 쿼리 1번 (자식 시리얼라이저의 선언까지 적용)
+                child_queryset = child_class.Meta.model._default_manager.all()
+                prefetch.append(Prefetch(path, queryset=eager_load(child_queryset, child_class)))
+        elif isinstance(field, serializers.BaseSerializer):
+            if isinstance(field, EagerLoadingMixin):
+                # 정참조 중첩 객체는 JOIN으로 함께 가져옵니다.
+                select.append(path)
+                child_select, child_prefetch, child_only = collect_relations(type(field), path + '__')
+                select += child_select
+                prefetch += child_prefetch
+                only += child_only
+
+    return select, prefetch, only
+
+
+def eager_load(queryset, serializer_class):
+    """queryset에 시리얼라이저가 선언한 select_related / prefetch_related / only 적용"""
+    select, prefetch, only = collect_relations(serializer_class)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if only:
+        queryset = queryset.only(*only)
+    return queryset
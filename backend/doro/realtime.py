@@ -0,0 +1,190 @@
+# backend/doro/realtime.py
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger('doro.realtime')
+
+# 구독자 한 명이 쌓아 둘 수 있는 최대 이벤트 수 (넘치면 연결을 끊어 클라이언트가 다시 접속/조회하게 함)
+MAX_PENDING = 100
+
+
+class Overflow(Exception):
+    """구독자가 이벤트를 제때 읽지 못해 대기열이 넘침"""
+
+
+class Broker:
+    """
+    실시간 이벤트 pub/sub 백엔드 (settings.REALTIME['BACKEND'])
+    - publish(channel, message): 동기 코드(시그널, 뷰)에서 호출, message는 JSON 문자열
+    - subscribe(channels): 스트림 뷰(비동기)에서 호출, Subscription을 돌려줌
+    """
+
+    def publish(self, channel, message):
+        raise NotImplementedError
+
+    def subscribe(self, channels):
+        raise NotImplementedError
+
+
+class Subscription:
+    async def get(self, timeout):
+        """다음 메시지 (timeout초 동안 없으면 None, 대기열이 넘쳤으면 Overflow)"""
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+
+# === 프로세스 메모리 (기본값) ===
+# 같은 프로세스에서 발행한 이벤트만 받습니다. (ASGI 서버 프로세스 하나가 API와 스트림을 함께 처리할 때)
+
+class InProcessSubscription(Subscription):
+    def __init__(self, broker, channels):
+        self.broker = broker
+        self.channels = channels
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=MAX_PENDING)
+        self.overflowed = False
+
+    def put(self, message):
+        # 이벤트 루프 스레드에서만 호출됩니다. (call_soon_threadsafe)
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout):
+        if self.overflowed:
+            raise Overflow
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker(Broker):
+    def __init__(self, **options):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, message)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 (연결 종료 중)
+                self.unsubscribe(subscription)
+
+    def subscribe(self, channels):
+        subscription = InProcessSubscription(self, channels)
+        with self._lock:
+            for channel in channels:
+                self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[channel]
+
+
+# === Redis pub/sub (redis 패키지 필요) ===
+# API 서버, ASGI 서버, 작업 워커가 여러 프로세스/서버로 나뉘어 있어도 이벤트가 전달됩니다.
+
+class RedisSubscription(Subscription):
+    def __init__(self, client, channels):
+        self.client = client
+        self.channels = channels
+        self.pubsub = None
+
+    async def get(self, timeout):
+        if self.pubsub is None:
+            self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            await self.pubsub.subscribe(*self.channels)
+        message = await self.pubsub.get_message(timeout=timeout)
+        return None if message is None else message['data'].decode()
+
+    async def close(self):
+        if self.pubsub is not None:
+            await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+class RedisBroker(Broker):
+    def __init__(self, location='redis://127.0.0.1:6379/2', **options):
+        import redis
+        self.location = location
+        self.client = redis.Redis.from_url(location)
+
+    def publish(self, channel, message):
+        self.client.publish(channel, message)
+
+    def subscribe(self, channels):
+        from redis import asyncio as redis_asyncio
+        # 연결은 이벤트 루프에 묶이므로 구독마다 새로 만듭니다.
+        return RedisSubscription(redis_asyncio.Redis.from_url(self.location), channels)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = settings.REALTIME
+                _broker = import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+    return _broker
+
+
+# === 발행 ===
+
+def encode(event_type, data):
+    return json.dumps({'type': event_type, 'data': data}, cls=DjangoJSONEncoder, ensure_ascii=False)
+
+
+def publish(channels, event_type, data):
+    """
+    channels(['user:3', 'lecture:42', ...])의 구독자에게 이벤트를 보냅니다.
+    트랜잭션 안이면 커밋된 뒤에 보냅니다. (롤백된 변경이 화면에 나타나지 않도록)
+    발행 실패는 로그만 남기고 요청을 실패시키지 않습니다. (클라이언트는 다시 접속할 때 목록을 새로 조회)
+    """
+    message = encode(event_type, data)
+
+    def send():
+        broker = get_broker()
+        for channel in channels:
+            try:
+                broker.publish(channel, message)
+            except Exception:
+                logger.exception("realtime publish to %s failed", channel)
+
+    transaction.on_commit(send)
+
+
+def format_sse(message):
+    """
+    메시지 -> SSE 프레임 (이벤트 이름 없이 보내므로 클라이언트는 onmessage 하나에서 type으로 나눔)
+    메시지는 한 줄 JSON이라 다시 파싱하지 않고 그대로 씁니다.
+    """
+    return f"data: {message}\n\n"
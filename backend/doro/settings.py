@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,9 +43,13 @@ INSTALLED_APPS = [
     'lecture.apps.LectureConfig',
     'notice.apps.NoticeConfig',
     'consultations.apps.ConsultationsConfig',
+    'search.apps.SearchConfig',
+    'taskqueue.apps.TaskqueueConfig',
 ]
 
 MIDDLEWARE = [
+    # 요청별 시간/쿼리 측정 (Server-Timing 헤더, 느린 요청 로그) - 전체 시간을 재기 위해 맨 앞에 둡니다.
+    'doro.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -81,11 +86,84 @@ CORS_ALLOWED_ORIGINS = [
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
-DATABASES = {
+# DORO_DB_ENGINE 환경 변수로 선택합니다. (기본값: sqlite)
+#   sqlite   - 개발/단일 서버용. WAL 모드로 읽기와 쓰기가 서로 막지 않게 하고,
+#              쓰기 잠금은 busy_timeout 동안 기다린 뒤 실패합니다.
+#   postgres - 운영용. 연결을 CONN_MAX_AGE 동안 재사용하고 재사용 전 상태를 확인합니다.
+#              DORO_DB_POOL=1 이면 Django 내장 커넥션 풀을 사용합니다. (psycopg 3 + psycopg_pool 필요)
+
+DB_ENGINE = os.environ.get('DORO_DB_ENGINE', 'sqlite')
+
+if DB_ENGINE == 'postgres':
+    DB_POOL = os.environ.get('DORO_DB_POOL') == '1'
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DORO_DB_NAME', 'doro'),
+            'USER': os.environ.get('DORO_DB_USER', 'doro'),
+            'PASSWORD': os.environ.get('DORO_DB_PASSWORD', ''),
+            'HOST': os.environ.get('DORO_DB_HOST', '127.0.0.1'),
+            'PORT': os.environ.get('DORO_DB_PORT', '5432'),
+            # 풀을 쓰면 연결 수명은 풀이 관리하므로 CONN_MAX_AGE는 0이어야 합니다.
+            'CONN_MAX_AGE': 0 if DB_POOL else int(os.environ.get('DORO_DB_CONN_MAX_AGE', 60)),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.environ.get('DORO_DB_POOL_MIN', 2)),
+                    'max_size': int(os.environ.get('DORO_DB_POOL_MAX', 20)),
+                    'timeout': 10,
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            # 데이터베이스 파일 경로를 지정합니다.
+            'NAME': os.environ.get('DORO_DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # 쓰기 잠금 대기 시간 (초, busy_timeout)
+                'timeout': int(os.environ.get('DORO_DB_BUSY_TIMEOUT', 20)),
+                # 쓰기 트랜잭션은 시작할 때 잠금을 잡아 도중에 "database is locked"로 실패하지 않게 합니다.
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            },
+        }
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# DORO_CACHE_BACKEND 환경 변수로 선택합니다. (기본값: 프로세스 메모리 LRU)
+#   locmem - 프로세스별 메모리 캐시, MAX_ENTRIES를 넘으면 오래 안 쓴 키부터 제거
+#   file   - 파일 캐시 (여러 워커 프로세스가 같은 서버에서 공유)
+#   redis  - Redis 캐시 (redis 패키지 필요, 여러 서버가 공유)
+
+CACHE_MAX_ENTRIES = int(os.environ.get('DORO_CACHE_MAX_ENTRIES', 10000))
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'doro',
+        'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('DORO_CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('DORO_CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        # 데이터베이스 파일 경로를 지정합니다.
-        'NAME': BASE_DIR / 'db.sqlite3',
+        **CACHE_BACKENDS[os.environ.get('DORO_CACHE_BACKEND', 'locmem')],
+        'TIMEOUT': int(os.environ.get('DORO_CACHE_TIMEOUT', 300)),  # 기본 TTL (초)
+        'KEY_PREFIX': 'doro',
     }
 }
 
@@ -166,4 +244,65 @@ SIMPLE_JWT = {
 
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
+
+# 백그라운드 작업 큐 (taskqueue) - 메일 발송처럼 느린 일은 요청 안에서 하지 않고 큐에 넣습니다.
+#   worker - manage.py run_tasks 워커가 실행 (운영)
+#   thread - 웹 프로세스의 스레드 풀이 커밋 직후 실행 (개발용, 워커 없이 동작)
+TASK_QUEUE = {
+    'EXECUTOR': os.environ.get('DORO_TASK_EXECUTOR', 'thread' if DEBUG else 'worker'),
+    'THREADS': int(os.environ.get('DORO_TASK_THREADS', 2)),
+}
+
+# 새 공지 알림 메일 (notice/tasks.py)
+#   LECTURE_NOTICE - 새 강의 공지를 그 강의 수강생에게
+#   SYSTEM_NOTICE  - 새 시스템 공지를 전체 회원에게 (회원 수만큼 메일이 나가므로 기본은 끔, DORO_SYSTEM_NOTICE_EMAILS=1)
+NOTICE_EMAILS = {
+    'LECTURE_NOTICE': True,
+    'SYSTEM_NOTICE': os.environ.get('DORO_SYSTEM_NOTICE_EMAILS') == '1',
+}
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# 테스트 중에는 작업 큐를 'worker' 실행기로 고정 (doro/testing.py)
+TEST_RUNNER = 'doro.testing.TestRunner'
+
+# 실시간 이벤트 pub/sub (doro/realtime.py, 스트림: /api/stream/)
+# DORO_REALTIME_BACKEND 환경 변수로 선택합니다.
+#   memory - 프로세스 메모리 (기본값, ASGI 서버 프로세스 하나가 API와 스트림을 함께 처리할 때)
+#   redis  - Redis pub/sub (redis 패키지 필요, 여러 프로세스/서버가 공유)
+REALTIME_BACKENDS = {
+    'memory': {'BACKEND': 'doro.realtime.InProcessBroker'},
+    'redis': {
+        'BACKEND': 'doro.realtime.RedisBroker',
+        'OPTIONS': {'location': os.environ.get('DORO_REALTIME_LOCATION', 'redis://127.0.0.1:6379/2')},
+    },
+}
+REALTIME = REALTIME_BACKENDS[os.environ.get('DORO_REALTIME_BACKEND', 'memory')]
+
+# 요청 측정 미들웨어 설정 (doro/middleware.py)
+REQUEST_METRICS = {
+    'SAMPLE_RATE': float(os.environ.get('DORO_METRICS_SAMPLE_RATE', 1.0 if DEBUG else 0.05)),
+    'SLOW_REQUEST_MS': int(os.environ.get('DORO_SLOW_REQUEST_MS', 500)),
+    'SERVER_TIMING': True,
+}
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        # 느린 요청 로그는 메시지 자체가 JSON 한 줄입니다.
+        'json_line': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'slow_requests': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json_line',
+        },
+    },
+    'loggers': {
+        'doro.slow_requests': {
+            'handlers': ['slow_requests'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
@@ -0,0 +1,177 @@
+# backend/doro/stream.py
+
+import secrets
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from community.models import Thread
+from lecture.models import Enrollment, Lecture
+from user.models import User
+from .realtime import Overflow, format_sse, get_broker
+
+# 이벤트가 없을 때 보내는 주석 줄 간격 (초, 프록시/로드밸런서의 유휴 연결 종료보다 짧게)
+HEARTBEAT = 25
+# 연결이 끊겼을 때 EventSource가 다시 접속하기까지 기다리는 시간 (밀리초)
+RETRY_MS = 5000
+# 한 연결에서 지켜볼 수 있는 최대 게시글 수
+MAX_THREADS = 50
+# 스트림 접속권 유효 시간 (초, 발급 직후 EventSource를 여는 데만 쓰므로 짧게)
+TICKET_TTL = 30
+
+
+def ticket_key(ticket):
+    return f'stream:ticket:{ticket}'
+
+
+def issue_ticket(user, expires_at):
+    """
+    스트림 접속권 발급 (한 번만 쓸 수 있는 임의 문자열, 캐시에 사용자와 액세스 토큰 만료 시각 보관)
+    서버 프로세스가 여러 개면 발급/사용하는 프로세스가 다를 수 있으므로 공유 캐시(file/redis)를 씁니다.
+    """
+    ticket = secrets.token_urlsafe(32)
+    cache.set(ticket_key(ticket), (user.pk, expires_at), TICKET_TTL)
+    return ticket
+
+
+def redeem_ticket(ticket):
+    """접속권 -> (사용자, 만료 시각), 쓰고 나면 바로 지웁니다. (동시에 같은 접속권으로 들어와도 delete()가 성공한 한 번만)"""
+    key = ticket_key(ticket)
+    value = cache.get(key)
+    if value is None or not cache.delete(key):
+        raise AuthenticationFailed("스트림 접속권이 유효하지 않거나 만료되었습니다.")
+    user_id, expires_at = value
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if user is None:
+        raise AuthenticationFailed("스트림 접속권이 유효하지 않거나 만료되었습니다.")
+    return user, expires_at
+
+
+def authenticate(request):
+    """
+    Authorization 헤더의 액세스 토큰 또는 ?ticket= 의 스트림 접속권 -> (사용자, 토큰 만료 시각)
+    브라우저 EventSource는 헤더를 붙일 수 없지만, 액세스 토큰을 URL에 넣으면 접근 로그에 남으므로
+    /api/stream/ticket/ 에서 받은 짧은 일회용 접속권만 쿼리 파라미터로 받습니다.
+    """
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    if header:
+        raw_token = auth.get_raw_token(header)
+        if not raw_token:
+            raise AuthenticationFailed("로그인이 필요합니다.")
+        token = auth.get_validated_token(raw_token)
+        return auth.get_user(token), token['exp']
+    ticket = request.GET.get('ticket', '')
+    if not ticket:
+        raise AuthenticationFailed("로그인이 필요합니다.")
+    return redeem_ticket(ticket)
+
+
+def parse_threads(params):
+    values = [value.strip() for value in params.get('threads', '').split(',') if value.strip()]
+    if not all(value.isdigit() for value in values):
+        raise ValueError("threads는 쉼표로 구분한 게시글 ID여야 합니다.")
+    if len(values) > MAX_THREADS:
+        raise ValueError(f"게시글은 한 번에 최대 {MAX_THREADS}개까지 지켜볼 수 있습니다.")
+    return [int(value) for value in values]
+
+
+def channels_for(user, thread_ids):
+    """
+    사용자가 받을 채널
+    - user:<ID>     내 상담 상태 변경
+    - system        시스템 공지
+    - lecture:<ID>  수강 중이거나 담당하는 강의의 새 공지
+    - thread:<ID>   지켜보는 게시글의 새 댓글 (?threads=)
+    수강 신청처럼 채널이 바뀌는 변경은 다시 접속해야 반영됩니다.
+    """
+    lecture_ids = set(Enrollment.objects.filter(student=user).values_list('lecture_id', flat=True))
+    lecture_ids.update(Lecture.objects.filter(instructor=user).values_list('pk', flat=True))
+    thread_ids = Thread.objects.filter(pk__in=thread_ids).values_list('pk', flat=True) if thread_ids else []
+    return [
+        f'user:{user.pk}', 'system',
+        *(f'lecture:{pk}' for pk in sorted(lecture_ids)),
+        *(f'thread:{pk}' for pk in thread_ids),
+    ]
+
+
+@sync_to_async
+def open_stream(request):
+    user, expires_at = authenticate(request)
+    return channels_for(user, parse_threads(request.GET)), expires_at
+
+
+async def events(channels, expires_at):
+    """
+    구독한 채널의 이벤트를 SSE 프레임으로 내보냅니다.
+    - 이벤트가 없으면 HEARTBEAT초마다 주석 줄을 보내 연결을 유지합니다.
+    - 액세스 토큰이 만료되거나 이벤트를 제때 읽지 못해 대기열이 넘치면 스트림을 끝냅니다.
+      (클라이언트는 새 접속권으로 다시 접속하고 목록을 한 번 새로 조회)
+    클라이언트가 연결을 끊으면 Django가 이 제너레이터를 취소하므로 finally에서 구독을 정리합니다.
+    """
+    subscription = get_broker().subscribe(channels)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                return
+            try:
+                message = await subscription.get(min(HEARTBEAT, remaining))
+            except Overflow:
+                return
+            yield ": ping\n\n" if message is None else format_sse(message)
+    finally:
+        await subscription.close()
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def stream_ticket_api(request):
+    """
+    실시간 스트림 접속권 발급 (EventSource로 /api/stream/?ticket=... 에 접속하기 직전에 호출)
+    접속권은 TICKET_TTL초 안에 한 번만 쓸 수 있고, 스트림은 지금 쓰는 액세스 토큰이 만료될 때 끝납니다.
+    ASGI 서버가 아니면 스트림을 열 수 없으므로 501을 돌려줍니다. (클라이언트는 접속하지 않고 조회만)
+    """
+    if not isinstance(request._request, ASGIRequest):
+        return Response({"error": "실시간 스트림은 ASGI 서버에서만 제공합니다."}, status=501)
+    ticket = issue_ticket(request.user, request.auth['exp'])
+    return Response({"ticket": ticket, "expires_in": TICKET_TTL}, status=201)
+
+
+@require_GET
+async def event_stream_api(request):
+    """
+    실시간 이벤트 스트림 (Server-Sent Events)
+    새 공지, 지켜보는 게시글의 댓글, 상담 상태 변경을 목록을 다시 조회하지 않고 바로 받습니다.
+    data는 {"type": ..., "data": {...}} JSON 한 줄입니다. (doro/realtime.py)
+
+    연결 하나가 오래 열려 있으므로 ASGI 서버(uvicorn doro.asgi:application 등)에서만 제공합니다.
+    WSGI(runserver 포함)에서는 워커 스레드를 붙잡으므로 501을 돌려주고, 클라이언트는 기존처럼 조회합니다.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"error": "실시간 스트림은 ASGI 서버에서만 제공합니다."}, status=501)
+    try:
+        channels, expires_at = await open_stream(request)
+    except InvalidToken:
+        return JsonResponse({"error": "토큰이 유효하지 않거나 만료되었습니다."}, status=401)
+    except AuthenticationFailed as exc:
+        return JsonResponse({"error": str(exc.detail)}, status=401)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    response = StreamingHttpResponse(events(channels, expires_at), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx 등 프록시가 응답을 모아 두지 않고 바로 흘려보내도록
+    response['X-Accel-Buffering'] = 'no'
+    return response
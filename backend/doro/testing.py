@@ -0,0 +1,53 @@
+# backend/doro/testing.py
+
+from django.conf import settings
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext
+
+
+class TestRunner(DiscoverRunner):
+    """
+    manage.py test 실행기 (settings.TEST_RUNNER)
+    DEBUG 기본값인 스레드 실행기는 커밋 직후 풀 스레드가 테스트 DB에 접근해 잠금 오류를 내므로,
+    테스트에서는 작업을 큐에 넣기만 하는 'worker' 실행기로 고정합니다. (작업은 테스트가 직접 호출)
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.TASK_QUEUE = {**settings.TASK_QUEUE, 'EXECUTOR': 'worker'}
+
+
+class QueryCountAssertionsMixin:
+    """
+    목록 API의 쿼리 수가 행 개수와 무관하게 일정한지 검사하는 TestCase 믹스인
+
+        class NoticeApiTests(QueryCountAssertionsMixin, APITestCase):
+            def test_list_queries(self):
+                self.assertConstantQueries('/api/dashboard/notices/', self.make_notices)
+
+    populate(n)은 n개의 행을 추가로 만드는 함수입니다.
+    """
+    query_count_sizes = (1, 10)
+
+    def count_queries(self, url, client=None, **params):
+        client = client or self.client
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url, params)
+        self.assertLess(response.status_code, 400, getattr(response, 'data', response.content))
+        return len(ctx.captured_queries)
+
+    def assertConstantQueries(self, url, populate, client=None, expected=None, **params):
+        """행 개수를 늘려도 쿼리 수가 같아야 하고, expected가 있으면 그 값과도 같아야 합니다."""
+        counts = []
+        for size in self.query_count_sizes:
+            populate(size)
+            counts.append(self.count_queries(url, client, **params))
+
+        self.assertEqual(
+            len(set(counts)), 1,
+            f"{url}: 행 수 {self.query_count_sizes}에 대해 쿼리 수가 {counts}로 증가했습니다. (N+1 의심)",
+        )
+        if expected is not None:
+            self.assertEqual(counts[0], expected, f"{url}: 쿼리 수 {counts[0]} != 기대값 {expected}")
+        return counts[0]
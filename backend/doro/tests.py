@@ -0,0 +1,172 @@
+import base64
+import datetime
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import AsyncClient, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from community.models import Thread, Comment
+from consultations.models import Consultation
+from lecture.management.commands.explain_queries import LIST_ENDPOINTS, Command as ExplainQueries
+from lecture.models import Lecture, Enrollment, LectureNotice, Assignment, Attendance
+from notice import notifications
+from notice.models import SystemNotice
+from user.models import User, InterestTag, UserInterest
+from .cache import tagged_cache
+from .testing import QueryCountAssertionsMixin
+
+
+# 캐시를 끄고 실제 쿼리를 셉니다. (explain_queries와 같은 조건)
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+class ListEndpointQueryCountTests(QueryCountAssertionsMixin, APITestCase):
+    """explain_queries의 LIST_ENDPOINTS 전체: 행이 늘어도 쿼리 수가 같아야 합니다. (N+1 검사)"""
+
+    def setUp(self):
+        self.student, self.ids = ExplainQueries().create_sample_data()
+        self.instructor = User.objects.get(pk=self.ids['instructor'])
+        self.lecture = Lecture.objects.get(pk=self.ids['lecture'])
+        self.thread = Thread.objects.get(pk=self.ids['thread'])
+        self.client.force_authenticate(self.student)
+        self.rows = 0
+
+    def populate(self, n):
+        """목록 API마다 보이는 행을 n개씩 더 만듭니다. (수강 강의, 공지, 과제, 글/댓글, 상담, 알림, 관심분야 등)"""
+        now = timezone.now()
+        for _ in range(n):
+            self.rows += 1
+            i = self.rows
+            lecture = Lecture.objects.create(name=f'lecture {i}', instructor=self.instructor, status='OPEN')
+            Enrollment.objects.create(lecture=lecture, student=self.student)
+            notice = LectureNotice.objects.create(lecture=self.lecture, title=f'notice {i}', body='b')
+            notifications.fan_out('lecture_notice', notice.pk)
+            Assignment.objects.create(lecture=lecture, title=f'a {i}', content='c', deadline=now)
+            Attendance.objects.create(
+                lecture=self.lecture, user=self.student, week=i + 1,
+                attendance_date=now.date() - datetime.timedelta(days=i),
+            )
+            thread = Thread.objects.create(title=f'게시판 질문 {i}', content='c', student=self.student, lecture=self.lecture)
+            Comment.objects.create(thread=thread, student=self.student, content='c')
+            Comment.objects.create(thread=self.thread, student=self.student, content=f'c {i}')
+            SystemNotice.objects.create(author=self.instructor, title=f's {i}', content='c')
+            Consultation.objects.create(
+                student=self.student, instructor=self.instructor, content='c',
+                scheduled_at=now + datetime.timedelta(days=1, hours=i),
+            )
+            tag = InterestTag.objects.create(name=f'tag {i}')
+            UserInterest.objects.create(user=self.student, tag=tag)
+
+    def test_list_endpoints_constant_queries(self):
+        for name, url, _ in LIST_ENDPOINTS:
+            # 상담함은 강사 화면이라 강사로 조회합니다.
+            user = self.instructor if '/inbox/' in url else self.student
+            self.client.force_authenticate(user)
+            # 엔드포인트마다 샘플 데이터만 있는 상태에서 시작합니다. (쌓인 행이 페이지 크기를 넘으면 차이가 안 보임)
+            with self.subTest(name), transaction.atomic():
+                self.assertConstantQueries(url.format(**self.ids), self.populate)
+                transaction.set_rollback(True)
+
+
+class StreamTicketTests(TestCase):
+    """실시간 스트림 접속권: 액세스 토큰 대신 짧은 일회용 접속권만 URL에 실립니다. (doro/stream.py)"""
+
+    def setUp(self):
+        self.user = User.objects.create(username='student', role=1)
+        self.auth = {'Authorization': f'Bearer {RefreshToken.for_user(self.user).access_token}'}
+        self.client = AsyncClient()
+
+    async def test_ticket_is_single_use(self):
+        response = await self.client.post('/api/stream/ticket/', headers=self.auth)
+        self.assertEqual(response.status_code, 201)
+        url = f"/api/stream/?ticket={response.json()['ticket']}"
+
+        stream = await self.client.get(url)
+        self.assertEqual(stream.status_code, 200)
+        self.assertEqual(stream['Content-Type'], 'text/event-stream')
+        self.assertEqual((await self.client.get(url)).status_code, 401)
+
+    async def test_access_token_in_query_is_rejected(self):
+        token = self.auth['Authorization'].split()[1]
+        self.assertEqual((await self.client.get(f'/api/stream/?token={token}')).status_code, 401)
+
+    def test_ticket_requires_asgi_server(self):
+        self.assertEqual(self.client_class().post('/api/stream/ticket/', headers=self.auth).status_code, 501)
+
+
+@override_settings(REQUEST_METRICS={'SAMPLE_RATE': 1.0})
+class RequestMetricsAsyncTests(TestCase):
+    """ASGI에서도 요청 측정 미들웨어가 동기 뷰의 쿼리를 셉니다."""
+
+    async def test_counts_queries_of_sync_view(self):
+        user = await User.objects.acreate(username='student', role=1)
+        auth = {'Authorization': f'Bearer {RefreshToken.for_user(user).access_token}'}
+        response = await AsyncClient().get('/api/interests/', headers=auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('"0 queries', response['Server-Timing'])
+
+
+@override_settings(REQUEST_METRICS={'SAMPLE_RATE': 1.0})
+class CacheServerTimingTests(APITestCase):
+    """TaggedCache를 조회한 요청은 Server-Timing에 cache 항목(요청 적중 수, 프로세스 적중률)이 붙습니다."""
+
+    def setUp(self):
+        cache.clear()
+        tagged_cache.reset_stats()
+        self.client.force_authenticate(User.objects.create(username='student', role=1))
+
+    def test_reports_cache_hits(self):
+        miss = self.client.get('/api/courses/facets/')
+        hit = self.client.get('/api/courses/facets/')
+        uncached = self.client.get('/api/interests/')
+
+        self.assertIn('cache;desc="0/1 hits, hit-rate 0.00 (process)"', miss['Server-Timing'])
+        self.assertIn('cache;desc="1/1 hits, hit-rate 0.50 (process)"', hit['Server-Timing'])
+        self.assertNotIn('cache;', uncached['Server-Timing'])
+        self.assertEqual(tagged_cache.stats()['hits'], 1)
+
+
+class TamperedCursorTests(APITestCase):
+    """디코딩은 되지만 값이 잘못된 커서는 500이 아니라 400 "잘못된 커서입니다."가 됩니다. (doro/pagination.py)"""
+
+    BAD_VALUES = (['abc', 1], [None, None], [1, 'x'], [[1], {}], [True, 1])
+
+    def setUp(self):
+        self.student = User.objects.create(username='student', role=1)
+        self.instructor = User.objects.create(username='instructor', role=2)
+
+    @staticmethod
+    def cursor(values):
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+    def test_bad_cursor_values_are_rejected(self):
+        urls = [
+            (self.student, '/api/community/'),
+            (self.student, '/api/courses/'),
+            (self.student, '/api/notifications/'),
+            (self.instructor, '/api/consultations/inbox/'),
+        ]
+        for user, url in urls:
+            self.client.force_authenticate(user)
+            for values in self.BAD_VALUES:
+                with self.subTest(url=url, values=values):
+                    response = self.client.get(url, {'cursor': self.cursor(values)})
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(response.json(), {'cursor': "잘못된 커서입니다."})
+
+    def test_bad_feed_cursor_is_rejected(self):
+        self.client.force_authenticate(self.student)
+        for values in (['abc', 'system', 1], [None, 'system', 1], ['2026-01-01T00:00:00+00:00', None, 1]):
+            with self.subTest(values=values):
+                response = self.client.get('/api/dashboard/notices/', {'cursor': self.cursor(values)})
+                self.assertEqual(response.status_code, 400)
+
+    def test_issued_cursor_still_works(self):
+        self.client.force_authenticate(self.student)
+        for i in range(3):
+            Thread.objects.create(title=f't{i}', content='c', student=self.student)
+        first = self.client.get('/api/community/', {'page_size': 2}).json()
+        second = self.client.get('/api/community/', {'page_size': 2, 'cursor': first['next_cursor']}).json()
+        self.assertEqual([row['title'] for row in second['results']], ['t0'])
@@ -1,15 +1,19 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 # 각 앱의 view 함수들을 직접 import
 from lecture import views as lecture_views
 from notice import views as notice_views
 from community import views as community_views
 from user import views as user_views
+from search import views as search_views
+from doro import stream
 
 urlpatterns = [
     path('admin/', admin.site.urls),
 
     # === 1. 대시보드 (Dashboard) API ===
+    # 대시보드 통합 (내 강의 + 최신 공지 + 다가오는 과제, 캐시된 스냅샷)
+    path('api/dashboard/', notice_views.dashboard_api),
     # 내 수강 목록
     path('api/dashboard/my-courses/', lecture_views.my_course_list_api),
     # 공지 목록 (통합: 시스템 공지 + 내 강의 공지)
@@ -18,23 +22,44 @@ urlpatterns = [
     path('api/dashboard/notices/<int:pk>/', notice_views.notice_detail_api),
     # 강의별 과제 현황
     path('api/dashboard/tasks/', lecture_views.my_task_list_api),
+    # 알림함 (새 강의 공지/과제)
+    path('api/notifications/', notice_views.notification_list_api),
+    path('api/notifications/unread-count/', notice_views.notification_unread_count_api),
+    path('api/notifications/read/', notice_views.notification_read_api),
+    # 실시간 이벤트 스트림 (SSE, ASGI 서버 전용)
+    path('api/stream/', stream.event_stream_api),
+    path('api/stream/ticket/', stream.stream_ticket_api),
 
     # === 2. 커뮤니티 (Community) API ===
     # 글 목록 조회 및 작성 (GET, POST)
     path('api/community/', community_views.community_list_create_api),
     # 글 상세 조회 (:id -> <int:pk>)
     path('api/community/<int:pk>/', community_views.community_detail_api),
-    path('api/community/<int:pk>/comments/', community_views.comment_create_api),
+    path('api/community/<int:pk>/comments/', community_views.comment_list_create_api),
     path('api/community/me/', community_views.my_activity_api),
     # === 3. 강의 내부 기능 (Lecture Specific) ===
     path('api/lecture/<int:lecture_id>/notices/', lecture_views.course_notice_list_api),
     path('api/lecture/notices/<int:pk>/', lecture_views.lecture_notice_detail_api),
     path('api/lecture/<int:lecture_id>/assignments/', lecture_views.course_assignment_list_api),
-    path('api/lecture/<int:lecture_id>/attendance/', lecture_views.my_attendance_api),
+    path('api/lecture/<int:lecture_id>/attendance/', lecture_views.attendance_api),
+    path('api/lecture/<int:lecture_id>/attendance/stats/', lecture_views.attendance_stats_api),
+    # 강의 목록 (수강신청 카탈로그, 필터/패싯)
+    path('api/courses/', lecture_views.course_catalog_api),
+    path('api/courses/facets/', lecture_views.course_facets_api),
+    path('api/courses/recommend/', lecture_views.course_recommend_api),
+    # 수강신청 (프론트엔드가 끝 슬래시 없이 POST하므로 슬래시 선택 - APPEND_SLASH 리다이렉트는 POST 본문을 잃음)
+    re_path(r'^api/courses/(?P<lecture_id>\d+)/enroll/?$', lecture_views.course_enroll_api),
     # === 4. 유저 (User) API ===
     path('api/user/signup/', user_views.signup_api),
     path('api/user/login/', user_views.login_api),
     path('api/user/logout/', user_views.logout_api),
+    path('api/user/password/reset/', user_views.find_pw_api),
     path('api/user/me/', user_views.user_profile_api),
+    path('api/user/overview/', user_views.user_overview_api),
+    path('api/user/me/interests/', user_views.user_interests_api),
+    path('api/interests/', user_views.interest_tag_list_api),
+    path('api/interests/<int:tag_id>/users/', user_views.interest_tag_users_api),
+    # === 5. 검색 (Search) API ===
+    path('api/search/', search_views.search_api),
     path('api/consultations/', include('consultations.urls')), # include 사용하거나 직접 연결
 ]
\ No newline at end of file
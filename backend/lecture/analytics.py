@@ -0,0 +1,122 @@
+# backend/lecture/analytics.py
+
+import numpy as np
+
+from .models import Attendance
+
+ABSENT = Attendance.Status.ABSENT
+PRESENT = Attendance.Status.PRESENT
+LATE = Attendance.Status.LATE
+
+
+def rate(part, total):
+    return round(part / total, 4) if total else 0.0
+
+
+def attendance_stats(lecture_id, user_id=None):
+    """
+    강의 출결 통계 (학생별 출석/지각/결석 수와 비율, 주차별 합계, 연속 출석)
+    (user_id, week, status) 정수 배열을 쿼리 한 번으로 읽어 NumPy로 한 번에 집계합니다.
+    user_id를 주면 해당 학생 행만 계산합니다.
+    """
+    rows = Attendance.objects.filter(lecture_id=lecture_id)
+    if user_id is not None:
+        rows = rows.filter(user_id=user_id)
+    rows = list(rows.order_by('user_id', 'week').values_list('user_id', 'user__username', 'week', 'status'))
+    if not rows:
+        return {'lecture_id': lecture_id, 'summary': summary(0, 0, 0), 'weeks': [], 'students': []}
+
+    user_ids, usernames, weeks, statuses = zip(*rows)
+    users = np.fromiter(user_ids, dtype=np.int64, count=len(rows))
+    weeks = np.fromiter(weeks, dtype=np.int32, count=len(rows))
+    statuses = np.fromiter(statuses, dtype=np.int8, count=len(rows))
+
+    # 학생 ID -> 0..n-1 (행이 user_id 순으로 정렬되어 있으므로 first_index도 오름차순)
+    student_ids, first_index, student_index = np.unique(users, return_index=True, return_inverse=True)
+    n_students = len(student_ids)
+
+    # status 값(0,1,2)별 개수: 학생 인덱스 * 3 + status 로 한 번에 bincount
+    per_student = np.bincount(student_index * 3 + statuses, minlength=n_students * 3).reshape(n_students, 3)
+
+    week_values, week_index = np.unique(weeks, return_inverse=True)
+    per_week = np.bincount(week_index * 3 + statuses, minlength=len(week_values) * 3).reshape(len(week_values), 3)
+
+    current, longest = attendance_streaks(student_index, weeks, statuses != ABSENT, n_students)
+
+    students = []
+    for i, student_id in enumerate(student_ids.tolist()):
+        absent, present, late = per_student[i].tolist()
+        total = absent + present + late
+        students.append({
+            'student_id': student_id,
+            'username': usernames[first_index[i]],
+            'present': present,
+            'late': late,
+            'absent': absent,
+            'total': total,
+            'attendance_rate': rate(present + late, total),
+            'present_rate': rate(present, total),
+            'late_rate': rate(late, total),
+            'absent_rate': rate(absent, total),
+            'current_streak': int(current[i]),
+            'longest_streak': int(longest[i]),
+        })
+
+    week_totals = []
+    for week, (absent, present, late) in zip(week_values.tolist(), per_week.tolist()):
+        total = absent + present + late
+        week_totals.append({
+            'week': week,
+            'present': present,
+            'late': late,
+            'absent': absent,
+            'total': total,
+            'attendance_rate': rate(present + late, total),
+        })
+
+    absent, present, late = per_student.sum(axis=0).tolist()
+    return {
+        'lecture_id': lecture_id,
+        'summary': summary(n_students, len(rows), present + late),
+        'weeks': week_totals,
+        'students': students,
+    }
+
+
+def summary(students, records, attended):
+    return {
+        'students': students,
+        'records': records,
+        'attendance_rate': rate(attended, records),
+    }
+
+
+def attendance_streaks(student_index, weeks, attended, n_students):
+    """
+    학생별 (현재 연속 출석, 최장 연속 출석) 주차 수 (지각도 출석으로 계산)
+    행은 (학생, 주차) 순으로 정렬되어 있어야 합니다.
+    학생이 바뀌거나, 주차가 건너뛰어지거나, 결석이면 연속이 끊깁니다.
+    """
+    n = len(weeks)
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = (
+        (student_index[1:] != student_index[:-1])
+        | (weeks[1:] != weeks[:-1] + 1)
+        | ~attended[:-1]
+    )
+    # 출석한 행마다 속한 연속 구간 번호
+    run_id = np.cumsum(starts & attended) - 1
+    run_lengths = np.bincount(run_id[attended], minlength=max(int(run_id.max()) + 1, 0))
+
+    longest = np.zeros(n_students, dtype=np.int64)
+    if attended.any():
+        run_owner = np.zeros(len(run_lengths), dtype=np.int64)
+        run_owner[run_id[attended]] = student_index[attended]
+        np.maximum.at(longest, run_owner, run_lengths)
+
+    # 학생별 마지막 행이 출석이면 그 행이 속한 구간 길이가 현재 연속 출석
+    last_rows = np.r_[np.nonzero(student_index[1:] != student_index[:-1])[0], n - 1]
+    current = np.zeros(n_students, dtype=np.int64)
+    ongoing = attended[last_rows]
+    current[student_index[last_rows[ongoing]]] = run_lengths[run_id[last_rows[ongoing]]]
+    return current, longest
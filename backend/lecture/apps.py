@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class LectureConfig(AppConfig):
     #default_auto_field = "django.db.models.BigAutoField"
     name = "lecture"
+
+    def ready(self):
+        # 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,112 @@
+# backend/lecture/catalog.py
+
+import datetime
+
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import TruncMonth
+from rest_framework.exceptions import ValidationError
+
+from doro.cache import tagged_cache, make_key
+from doro.pagination import CursorPagination
+from .models import Lecture, LectureSchedule
+
+# 강의 목록 커서 페이지네이션 (Lecture(status|instructor, created_at, id) 인덱스 사용)
+catalog_pagination = CursorPagination(ordering=('-created_at', '-id'))
+
+# 강의 생성/수정/삭제, 일정 변경 시 무효화 (lecture/signals.py)
+FACET_TAG = 'courses:facets'
+
+STATUSES = [status for status, _ in Lecture.STATUS_CHOICES]
+
+
+def parse_filters(params):
+    """
+    쿼리 파라미터 -> 필터 dict (잘못된 값은 400)
+    - status: 쉼표로 여러 개 (예: OPEN,RECRUITING)
+    - instructor_id: 강사 ID
+    - start_from / start_to: 강의 일정 시작일 범위 (YYYY-MM-DD)
+    - q: 강의명 검색
+    """
+    filters = {}
+    if params.get('status'):
+        statuses = [value.strip().upper() for value in params['status'].split(',') if value.strip()]
+        if set(statuses) - set(STATUSES):
+            raise ValidationError({'status': f"{', '.join(STATUSES)} 중에서 선택해야 합니다."})
+        filters['status'] = statuses
+    if params.get('instructor_id'):
+        if not params['instructor_id'].isdigit():
+            raise ValidationError({'instructor_id': "정수여야 합니다."})
+        filters['instructor_id'] = int(params['instructor_id'])
+    for name in ('start_from', 'start_to'):
+        if params.get(name):
+            try:
+                filters[name] = datetime.date.fromisoformat(params[name])
+            except ValueError:
+                raise ValidationError({name: "YYYY-MM-DD 형식이어야 합니다."})
+    if params.get('q', '').strip():
+        filters['q'] = params['q'].strip()
+    return filters
+
+
+def filtered_lectures(filters, exclude=()):
+    """필터를 적용한 강의 queryset (exclude: 패싯 계산 시 제외할 필터 이름)"""
+    lectures = Lecture.objects.all()
+    if 'status' in filters and 'status' not in exclude:
+        lectures = lectures.filter(status__in=filters['status'])
+    if 'instructor_id' in filters and 'instructor_id' not in exclude:
+        lectures = lectures.filter(instructor_id=filters['instructor_id'])
+    if 'schedule' not in exclude and ('start_from' in filters or 'start_to' in filters):
+        # 일정 인덱스(start_date, lecture)로 해당 기간에 시작하는 강의 ID만 서브쿼리로 고릅니다.
+        schedules = LectureSchedule.objects.all()
+        if 'start_from' in filters:
+            schedules = schedules.filter(start_date__gte=filters['start_from'])
+        if 'start_to' in filters:
+            schedules = schedules.filter(start_date__lte=filters['start_to'])
+        lectures = lectures.filter(id__in=schedules.values('lecture_id'))
+    if 'q' in filters:
+        lectures = lectures.filter(name__icontains=filters['q'])
+    return lectures
+
+
+def with_card_fields(lectures):
+    """목록 카드에 표시할 첫 일정 시작일 (현재 페이지 행에만 계산되는 상관 서브쿼리)"""
+    first_start = (
+        LectureSchedule.objects.filter(lecture=OuterRef('pk')).order_by().values('lecture')
+        .annotate(first=Min('start_date')).values('first')
+    )
+    return lectures.annotate(start_date=Subquery(first_start))
+
+
+def facet_counts(filters):
+    """
+    패싯별 개수 (다른 패싯의 필터는 적용하고 자기 패싯의 필터는 빼고 셉니다)
+    결과는 필터 조합별로 캐시되고, 강의/일정이 바뀌면 FACET_TAG로 한 번에 무효화됩니다.
+    """
+    def build():
+        status_rows = (
+            filtered_lectures(filters, exclude=('status',)).order_by()
+            .values('status').annotate(count=Count('id'))
+        )
+        instructor_rows = (
+            filtered_lectures(filters, exclude=('instructor_id',)).filter(instructor__isnull=False).order_by()
+            .values('instructor_id', 'instructor__username').annotate(count=Count('id'))
+            .order_by('-count', 'instructor_id')
+        )
+        month_rows = (
+            LectureSchedule.objects.filter(lecture__in=filtered_lectures(filters, exclude=('schedule',)))
+            .annotate(month=TruncMonth('start_date')).order_by()
+            .values('month').annotate(count=Count('lecture_id', distinct=True)).order_by('month')
+        )
+        counts = {row['status']: row['count'] for row in status_rows}
+        return {
+            'status': [{'value': status, 'label': label, 'count': counts.get(status, 0)}
+                       for status, label in Lecture.STATUS_CHOICES],
+            'instructor': [{'value': row['instructor_id'], 'label': row['instructor__username'], 'count': row['count']}
+                           for row in instructor_rows],
+            'start_month': [{'value': row['month'].strftime('%Y-%m'), 'count': row['count']} for row in month_rows],
+        }
+
+    params = {name: value for name, value in filters.items()}
+    if 'status' in params:
+        params['status'] = ','.join(sorted(params['status']))
+    return tagged_cache.get_or_set(make_key('courses', 'facets', params=params), build, tags=[FACET_TAG])
@@ -0,0 +1,181 @@
+# backend/lecture/enrollment.py
+
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Lecture, Enrollment, WaitlistEntry, EnrollmentRequest
+
+# 수강신청 결과
+ENROLLED = 'ENROLLED'
+ALREADY_ENROLLED = 'ALREADY_ENROLLED'
+WAITLISTED = 'WAITLISTED'
+DROPPED = 'DROPPED'
+WAITLIST_CANCELLED = 'WAITLIST_CANCELLED'
+
+# 수강신청을 받는 강의 상태
+OPEN_STATUS = 'OPEN'
+# Idempotency-Key 기록 보관 기간
+REQUEST_TTL = timedelta(hours=24)
+
+
+class NoSeat(Exception):
+    pass
+
+
+# === 좌석 (Lecture.seats_taken) ===
+# 좌석 수는 "seats_taken < capacity" 조건부 UPDATE 한 번으로 차지합니다.
+# 같은 강의에 동시에 몰린 요청은 강의 행 잠금에서 한 줄로 서고, 조건을 통과한 만큼만 좌석을 얻습니다.
+# 잠금을 짧게 잡도록 UPDATE는 트랜잭션의 마지막 쓰기로 둡니다.
+
+def take_seat(lecture_id):
+    return Lecture.objects.filter(
+        pk=lecture_id, status=OPEN_STATUS, seats_taken__lt=F('capacity'),
+    ).update(seats_taken=F('seats_taken') + 1) == 1
+
+
+def release_seat(lecture_id):
+    Lecture.objects.filter(pk=lecture_id, seats_taken__gt=0).update(seats_taken=F('seats_taken') - 1)
+
+
+def waitlist_position(entry):
+    """대기 순번 (1부터, waitlist_queue_idx 범위 COUNT)"""
+    ahead = WaitlistEntry.objects.filter(lecture_id=entry.lecture_id).filter(
+        Q(created_at__lt=entry.created_at) | Q(created_at=entry.created_at, id__lt=entry.id),
+    )
+    return ahead.count() + 1
+
+
+def status_of(student, lecture):
+    """내 신청 상태: (ENROLLED | WAITLISTED | None, 대기 순번 또는 None)"""
+    if Enrollment.objects.filter(lecture=lecture, student=student).exists():
+        return ENROLLED, None
+    entry = WaitlistEntry.objects.filter(lecture=lecture, student=student).first()
+    if entry is not None:
+        return WAITLISTED, waitlist_position(entry)
+    return None, None
+
+
+def enroll(student, lecture):
+    """
+    수강신청 (lecture는 OPEN 상태여야 함 - 호출하는 쪽에서 확인)
+    반환값: (ENROLLED | ALREADY_ENROLLED | WAITLISTED, 대기 순번 또는 None)
+    - 좌석이 남아 있으면 수강 등록, 정원이 찼으면 대기자로 등록
+    - 이미 수강 중이면 아무것도 바꾸지 않음 (수강 중복은 Enrollment의 unique 제약이 막음)
+    """
+    try:
+        with transaction.atomic():
+            # 중복 신청은 여기서 걸러져 강의 행 잠금을 잡지 않습니다.
+            Enrollment.objects.create(lecture=lecture, student=student)
+            if not take_seat(lecture.pk):
+                raise NoSeat
+    except IntegrityError:
+        return ALREADY_ENROLLED, None
+    except NoSeat:
+        entry, _ = WaitlistEntry.objects.get_or_create(lecture=lecture, student=student)
+        # 정원이 찬 것을 확인한 뒤 대기 등록 전에 좌석이 풀렸을 수 있으므로 한 번 더 채웁니다.
+        if student.pk in fill_from_waitlist(lecture):
+            return ENROLLED, None
+        return WAITLISTED, waitlist_position(entry)
+
+    # 대기 중에 좌석이 생겨(정원 증가 등) 바로 등록된 경우 대기 기록을 지웁니다.
+    WaitlistEntry.objects.filter(lecture=lecture, student=student).delete()
+    return ENROLLED, None
+
+
+@transaction.atomic
+def drop(student, lecture):
+    """
+    수강 취소 또는 대기 취소
+    반환값: (DROPPED | WAITLIST_CANCELLED | None, 자동 등록된 대기자 ID 또는 None)
+    수강 취소로 빈 좌석은 수강신청 중인 강의라면 가장 먼저 대기한 학생에게 넘어갑니다. (좌석 수 변화 없음)
+    """
+    deleted, _ = Enrollment.objects.filter(lecture=lecture, student=student).delete()
+    if not deleted:
+        removed, _ = WaitlistEntry.objects.filter(lecture=lecture, student=student).delete()
+        return (WAITLIST_CANCELLED if removed else None), None
+
+    promoted = promote_next(lecture) if lecture.status == OPEN_STATUS else None
+    if promoted is None:
+        release_seat(lecture.pk)
+    return DROPPED, promoted
+
+
+def promote_next(lecture):
+    """
+    대기 1순위 학생을 수강 등록 (동시에 취소가 여러 건이어도 각자 다른 대기자를 잠가 가져감)
+    반환값: 등록된 학생 ID 또는 None (대기자 없음)
+    """
+    entry = (
+        WaitlistEntry.objects.select_for_update(skip_locked=True)
+        .filter(lecture=lecture).order_by('created_at', 'id').first()
+    )
+    if entry is None:
+        return None
+    entry.delete()
+    Enrollment.objects.create(lecture=lecture, student_id=entry.student_id)
+    return entry.student_id
+
+
+def fill_from_waitlist(lecture):
+    """
+    빈 좌석이 있으면 대기자를 순서대로 등록합니다. (정원 증가, 대기 등록과 취소가 엇갈린 경우)
+    좌석이 없으면 조건부 UPDATE 한 번으로 끝납니다. 반환값: 등록된 학생 ID 목록
+    """
+    promoted = []
+    while True:
+        try:
+            with transaction.atomic():
+                if not take_seat(lecture.pk):
+                    return promoted
+                student_id = promote_next(lecture)
+                if student_id is None:
+                    raise NoSeat  # 대기자가 없으면 차지한 좌석을 되돌림
+        except NoSeat:
+            return promoted
+        promoted.append(student_id)
+
+
+# === 멱등성 (Idempotency-Key) ===
+
+def claim_request(user, key, lecture, method):
+    """
+    요청 키를 선점합니다. (트랜잭션 안에서 호출 - 처리 결과와 함께 커밋/롤백)
+    반환값: (새 기록, None) 또는 (None, 이미 처리된 기록)
+    같은 키의 동시 요청은 unique 인덱스에서 먼저 온 트랜잭션이 끝날 때까지 기다린 뒤 저장된 응답을 받습니다.
+    """
+    try:
+        with transaction.atomic():
+            return EnrollmentRequest.objects.create(user=user, key=key, lecture=lecture, method=method), None
+    except IntegrityError:
+        return None, EnrollmentRequest.objects.get(user=user, key=key)
+
+
+def prune_requests():
+    """보관 기간이 지난 요청 기록 삭제. 반환값: 삭제 수"""
+    deleted, _ = EnrollmentRequest.objects.filter(created_at__lt=timezone.now() - REQUEST_TTL).delete()
+    return deleted
+
+
+# === 보정 (manage.py reconcile_enrollments) ===
+
+def recount_seats():
+    """
+    seats_taken을 실제 수강 인원으로 다시 맞춥니다. (bulk_create, 관리자 화면 등 API를 거치지 않은 변경 후)
+    정원보다 인원이 많으면 정원을 인원에 맞춥니다. 반환값: 값이 바뀐 강의 수
+    """
+    enrolled = (
+        Enrollment.objects.filter(lecture=OuterRef('pk')).order_by().values('lecture')
+        .annotate(n=Count('id')).values('n')
+    )
+    actual = Coalesce(Subquery(enrolled, output_field=IntegerField()), 0)
+    with transaction.atomic():
+        drifted = list(
+            Lecture.objects.annotate(actual=actual).exclude(seats_taken=F('actual')).values_list('pk', 'actual')
+        )
+        for lecture_id, count in drifted:
+            Lecture.objects.filter(pk=lecture_id).update(seats_taken=count, capacity=Greatest('capacity', Value(count)))
+    return len(drifted)
@@ -0,0 +1,24 @@
+# backend/lecture/management/commands/build_recommendations.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from lecture import recommend
+
+
+class Command(BaseCommand):
+    help = (
+        "수강/찜 이력과 강의 내용으로 강의 간 유사도를 계산해 추천 색인을 다시 만듭니다. "
+        "(주기 실행용 배치 - 예: 매일 새벽 cron으로 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=recommend.TOP_K, help="강의별로 저장할 유사 강의 수")
+
+    def handle(self, *args, **options):
+        began = time.perf_counter()
+        counts = recommend.build(k=options['top_k'])
+        for name, count in counts.items():
+            self.stdout.write(f"  {name}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"추천 색인 생성 완료 ({time.perf_counter() - began:.1f}s)"))
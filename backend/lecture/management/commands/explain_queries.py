@@ -0,0 +1,167 @@
+# backend/lecture/management/commands/explain_queries.py
+
+import datetime
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from community.models import Thread, Comment
+from consultations.models import Consultation, InstructorAvailability
+from lecture.models import Lecture, Enrollment, LectureNotice, Assignment, Attendance
+from notice.models import SystemNotice
+from user.models import User
+
+# (이름, URL 템플릿, 허용 항목)
+# 허용 항목 'sort': 여러 강의를 합쳐 정렬하는 쿼리처럼 인덱스만으로 정렬할 수 없는 경우
+#   (정렬 대상이 한 사용자의 수강 강의 범위로 제한되어 있어 허용)
+LIST_ENDPOINTS = [
+    ('community 전체', '/api/community/', ()),
+    ('community 전체 (커서)', '/api/community/?page_size=20', ()),
+    ('community 강의 (커서)', '/api/community/?lecture_id={lecture}&page_size=20', ()),
+    ('community 활동순 (커서)', '/api/community/?ordering=active&page_size=20', ()),
+    ('community 강의 활동순 (커서)', '/api/community/?lecture_id={lecture}&ordering=active&page_size=20', ()),
+    ('community 댓글순 (커서)', '/api/community/?ordering=comments&page_size=20', ()),
+    ('community 강의 댓글순 (커서)', '/api/community/?lecture_id={lecture}&ordering=comments&page_size=20', ()),
+    ('community 댓글 (커서)', '/api/community/{thread}/comments/?page_size=20', ()),
+    ('community 내 활동', '/api/community/me/', ()),
+    ('dashboard 통합', '/api/dashboard/', ('sort',)),
+    ('dashboard 내 강의', '/api/dashboard/my-courses/', ()),
+    ('dashboard 공지 (커서)', '/api/dashboard/notices/?page_size=20', ('sort',)),
+    ('dashboard 과제', '/api/dashboard/tasks/', ('sort',)),
+    ('notifications 알림함 (커서)', '/api/notifications/', ()),
+    ('notifications 안 읽은 알림 (커서)', '/api/notifications/?unread=1', ()),
+    ('notifications 안 읽은 수', '/api/notifications/unread-count/', ()),
+    ('lecture 공지', '/api/lecture/{lecture}/notices/', ()),
+    ('lecture 과제', '/api/lecture/{lecture}/assignments/', ()),
+    ('lecture 내 출결', '/api/lecture/{lecture}/attendance/', ()),
+    ('consultations 목록', '/api/consultations/', ()),
+    ('consultations 목록 (상태)', '/api/consultations/?status=PENDING', ()),
+    ('consultations 상담함 (커서)', '/api/consultations/inbox/', ()),
+    ('consultations 상담함 상태 (커서)', '/api/consultations/inbox/?status=PENDING&date_from={today}', ()),
+    ('consultations 빈 시간', '/api/consultations/slots/?instructor_id={instructor}&start={today}&end={month_end}', ()),
+    ('courses 목록', '/api/courses/', ()),
+    ('courses 상태 필터', '/api/courses/?status=OPEN', ()),
+    ('courses 강사 필터', '/api/courses/?instructor_id={instructor}', ()),
+    # 시작일 필터는 일정 인덱스(start_date)로 후보 강의를 먼저 고르므로, 기간 안의 강의만 정렬
+    ('courses 시작일 필터', '/api/courses/?start_from=2026-01-01&start_to=2026-12-31', ('sort',)),
+    # 패싯 개수는 필터된 강의 전체를 GROUP BY로 세므로 임시 정렬 허용 (필터 조합별로 캐시됨)
+    ('courses 패싯', '/api/courses/facets/?status=OPEN', ('sort',)),
+    ('courses 추천', '/api/courses/recommend/', ()),
+    ('interests 태그 목록', '/api/interests/', ()),
+    # 관련도 순 정렬은 일치한 문서만 대상으로 하므로 임시 정렬 허용 (전문 검색 색인으로 후보를 찾음)
+    ('search 통합 검색', '/api/search/?q=게시판', ('sort',)),
+]
+
+# 'SCAN subquery'는 UNION 결과(코루틴)를 읽는 단계라 테이블 스캔이 아닙니다.
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (?!subquery\b)(\S+)$')
+SQLITE_TEMP_SORT = re.compile(r'USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)')
+POSTGRES_FULL_SCAN = re.compile(r'Seq Scan on (\S+)')
+POSTGRES_SORT = re.compile(r'(?<!Incremental )Sort\s+\(')
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "모든 목록 API가 실행하는 쿼리에 EXPLAIN (QUERY PLAN)을 실행해 "
+        "전체 테이블 스캔이나 임시 정렬(temp B-tree, Sort)이 있으면 실패합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plan', action='store_true', help="모든 쿼리 계획 출력")
+
+    def handle(self, *args, **options):
+        self.verbose_plan = options['verbose_plan']
+        problems = []
+        try:
+            # 샘플 데이터를 만들어 실행하고 끝나면 되돌립니다.
+            with transaction.atomic():
+                user, ids = self.create_sample_data()
+                client = APIClient()
+                client.force_authenticate(user)
+                # 캐시를 끄고 실제 쿼리가 실행되게 합니다.
+                with override_settings(
+                    CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+                    ALLOWED_HOSTS=['*'],
+                ):
+                    for name, url, allow in LIST_ENDPOINTS:
+                        problems += self.check_endpoint(client, name, url.format(**ids), allow)
+                raise Rollback
+        except Rollback:
+            pass
+
+        if problems:
+            for problem in problems:
+                self.stderr.write(problem)
+            raise CommandError(f"인덱스를 타지 않는 쿼리 {len(problems)}건")
+        self.stdout.write(self.style.SUCCESS(f"{len(LIST_ENDPOINTS)}개 목록 API 모두 인덱스를 사용합니다."))
+
+    def create_sample_data(self):
+        now = timezone.now()
+        student = User.objects.create(username='__explain_student__', role=1)
+        instructor = User.objects.create(username='__explain_instructor__', role=2)
+        lecture = Lecture.objects.create(name='explain', instructor=instructor)
+        Enrollment.objects.create(lecture=lecture, student=student)
+        thread = Thread.objects.create(title='게시판 질문', content='c', student=student, lecture=lecture)
+        Comment.objects.create(thread=thread, student=student, content='c')
+        LectureNotice.objects.create(lecture=lecture, title='n', body='b')
+        SystemNotice.objects.create(author=instructor, title='s', content='c')
+        Assignment.objects.create(lecture=lecture, title='a', content='c', deadline=now)
+        Attendance.objects.create(lecture=lecture, user=student, attendance_date=now.date())
+        Consultation.objects.create(student=student, instructor=instructor, content='c', scheduled_at=now)
+        InstructorAvailability.objects.create(
+            instructor=instructor, weekday=now.weekday(), start_time=datetime.time(9), end_time=datetime.time(18),
+        )
+        today = timezone.localdate()
+        return student, {
+            'lecture': lecture.pk, 'thread': thread.pk, 'instructor': instructor.pk,
+            'today': today, 'month_end': today + datetime.timedelta(days=27),
+        }
+
+    def check_endpoint(self, client, name, url, allow):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        if response.status_code >= 400:
+            return [f"[{name}] {url} -> HTTP {response.status_code}"]
+
+        problems = []
+        for query in ctx.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            plan = self.explain(sql)
+            if self.verbose_plan:
+                self.stdout.write(f"[{name}] {sql}\n  " + "\n  ".join(plan))
+            for issue in self.find_issues(plan, allow):
+                problems.append(f"[{name}] {url}: {issue}\n  SQL: {sql}\n  PLAN: " + "\n        ".join(plan))
+        self.stdout.write(f"{'NG' if problems else 'OK'}  {name}  ({len(ctx.captured_queries)} queries)")
+        return problems
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+                return [row[-1] for row in cursor.fetchall()]
+            if connection.vendor == 'postgresql':
+                # 작은 테이블에서는 순차 스캔이 더 싸게 계산되므로, 쓸 수 있는 인덱스가 있는지만 확인합니다.
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('EXPLAIN ' + sql)
+                return [row[0] for row in cursor.fetchall()]
+        raise CommandError(f"지원하지 않는 DB입니다: {connection.vendor}")
+
+    def find_issues(self, plan, allow):
+        if connection.vendor == 'sqlite':
+            full_scan, sort = SQLITE_FULL_SCAN, SQLITE_TEMP_SORT
+        else:
+            full_scan, sort = POSTGRES_FULL_SCAN, POSTGRES_SORT
+        for line in plan:
+            if full_scan.search(line.strip()):
+                yield f"전체 테이블 스캔: {line.strip()}"
+            elif sort.search(line) and 'sort' not in allow:
+                yield f"임시 정렬: {line.strip()}"
@@ -0,0 +1,175 @@
+# backend/lecture/management/commands/loadtest_enrollment.py
+
+import logging
+import statistics
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.conf import settings
+from rest_framework.test import APIClient
+
+from lecture.models import Lecture, Enrollment, WaitlistEntry
+from user.models import User
+
+PREFIX = '__loadtest_enroll__'
+
+
+class Command(BaseCommand):
+    help = (
+        "수강신청 동시성 부하 테스트: 학생 여러 명이 같은 강의에 동시에 수강신청 API를 호출한 뒤 "
+        "정원 초과가 없는지(seats_taken == 수강 인원 <= 정원), 같은 Idempotency-Key 재시도가 처음 응답을 "
+        "그대로 돌려받는지, 수강 취소로 빈 좌석이 먼저 대기한 학생 순서대로 넘어가는지 확인합니다. "
+        "하나라도 어긋나면 0이 아닌 코드로 종료합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help="수강신청 요청 수 (학생 수)")
+        parser.add_argument('--concurrency', type=int, default=1000, help="동시에 요청하는 스레드 수")
+        parser.add_argument('--capacity', type=int, default=100, help="강의 정원")
+        parser.add_argument('--drops', type=int, default=20, help="동시에 수강 취소할 학생 수")
+        parser.add_argument('--busy-timeout', type=int, default=300,
+                            help="SQLite 쓰기 잠금 대기 시간 (초, 스레드 1,000개가 한 프로세스의 GIL을 나눠 쓰므로 길게)")
+        parser.add_argument('--keep', action='store_true', help="테스트 데이터를 지우지 않음")
+
+    def handle(self, *args, **options):
+        requests = options['requests']
+        capacity = options['capacity']
+        drops = min(options['drops'], capacity, max(requests - capacity, 0))
+        db = settings.DATABASES['default']
+        self.stdout.write(
+            f"DB: {connection.vendor} ({db['NAME']}), requests={requests}, "
+            f"concurrency={options['concurrency']}, capacity={capacity}"
+        )
+
+        if connection.vendor == 'sqlite':
+            # 이후 스레드가 여는 연결에 적용되도록 연결 설정을 바꾸고 현재 연결을 닫습니다.
+            connections.settings['default'].setdefault('OPTIONS', {})['timeout'] = options['busy_timeout']
+            connection.close()
+        # 요청마다 느린 요청 로그가 쌓이지 않도록 (지연은 아래에서 분위수로 출력)
+        logging.getLogger('doro.slow_requests').setLevel(logging.ERROR)
+
+        self.cleanup()
+        instructor = User.objects.create(username=f'{PREFIX}instructor', role=2)
+        lecture = Lecture.objects.create(name=PREFIX, instructor=instructor, status='OPEN', capacity=capacity)
+        User.objects.bulk_create([User(username=f'{PREFIX}{i}', role=1) for i in range(requests)])
+        students = list(User.objects.filter(username__startswith=PREFIX, role=1).order_by('pk'))
+        url = f'/api/courses/{lecture.pk}/enroll/'
+        self.errors = []
+
+        try:
+            # 1. 동시 수강신청 (학생마다 Idempotency-Key 하나)
+            calls = [('post', student, f'enroll-{student.pk}') for student in students]
+            results, elapsed = self.run_calls(url, calls, options['concurrency'])
+            codes = Counter(code for code, _ in results)
+            self.report("수강신청", results, elapsed)
+            self.check_seats(lecture)
+            expected = min(requests, capacity)
+            self.expect(codes[201] == expected, f"201 응답 {codes[201]}건 (기대 {expected}건)")
+            self.expect(codes[202] == requests - expected, f"202 응답 {codes[202]}건 (기대 {requests - expected}건)")
+
+            # 2. 같은 키로 재시도 -> 처음 응답을 그대로 돌려받고 상태는 바뀌지 않음
+            replays, elapsed = self.run_calls(url, calls, options['concurrency'])
+            self.report("같은 키 재시도", replays, elapsed)
+            replayed = sum(1 for _, headers in replays if headers.get('Idempotent-Replayed') == 'true')
+            self.expect(replayed == requests, f"재시도 {requests}건 중 저장된 응답 재사용 {replayed}건")
+            self.expect(
+                [code for code, _ in replays] == [code for code, _ in results], "재시도 응답 코드가 처음 응답과 다름",
+            )
+            self.check_seats(lecture)
+
+            # 3. 동시 수강 취소 -> 대기 1순위부터 자동 등록 (좌석 수 변화 없음)
+            if drops:
+                queue = list(
+                    WaitlistEntry.objects.filter(lecture=lecture).order_by('created_at', 'id')
+                    .values_list('student_id', flat=True)
+                )
+                enrolled = list(Enrollment.objects.filter(lecture=lecture).values_list('student_id', flat=True))
+                leaving = [student for student in students if student.pk in set(enrolled[:drops])]
+                drop_results, elapsed = self.run_calls(
+                    url, [('delete', student, f'drop-{student.pk}') for student in leaving], options['concurrency'],
+                )
+                self.report("수강 취소", drop_results, elapsed)
+                self.check_seats(lecture)
+                now_enrolled = set(Enrollment.objects.filter(lecture=lecture).values_list('student_id', flat=True))
+                promoted = now_enrolled - set(enrolled)
+                self.expect(promoted == set(queue[:drops]), f"대기 순서대로 등록되지 않음 (등록 {len(promoted)}명)")
+                self.expect(len(now_enrolled) == capacity, f"취소 후 수강 인원 {len(now_enrolled)}명 (기대 {capacity}명)")
+        finally:
+            if not options['keep']:
+                self.cleanup()
+
+        if self.errors:
+            raise CommandError("실패: " + "; ".join(self.errors))
+        self.stdout.write(self.style.SUCCESS("OK: 정원 초과, 중복 등록, 대기 순서 위반 없음"))
+
+    def run_calls(self, url, calls, concurrency):
+        """calls([(method, 학생, Idempotency-Key), ...])를 concurrency개 스레드가 동시에 시작해 나눠 호출"""
+        results = [None] * len(calls)
+        latencies = []
+        lock = threading.Lock()
+        workers = max(1, min(concurrency, len(calls)))
+        start_barrier = threading.Barrier(workers)
+
+        def worker(offset):
+            client = APIClient(HTTP_HOST='127.0.0.1')
+            local_latencies = []
+            try:
+                start_barrier.wait()
+                for index in range(offset, len(calls), workers):
+                    method, student, key = calls[index]
+                    client.force_authenticate(student)
+                    began = time.perf_counter()
+                    try:
+                        response = getattr(client, method)(url, HTTP_IDEMPOTENCY_KEY=key)
+                    except Exception as exc:
+                        results[index] = (None, {'error': repr(exc)})
+                        continue
+                    local_latencies.append(time.perf_counter() - began)
+                    results[index] = (response.status_code, response.headers)
+            finally:
+                # 스레드별 DB 연결 정리
+                connections.close_all()
+            with lock:
+                latencies.extend(local_latencies)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(workers)]
+        began = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.latencies = latencies
+        return [result or (None, {}) for result in results], time.perf_counter() - began
+
+    def report(self, label, results, elapsed):
+        codes = Counter(code for code, _ in results)
+        self.stdout.write(f"{label} {len(results)}건, {elapsed:.2f}초, 응답 코드 {dict(sorted(codes.items(), key=str))}")
+        if len(self.latencies) > 1:
+            quantiles = statistics.quantiles(self.latencies, n=100)
+            self.stdout.write(
+                "지연(ms): p50 {:.1f} / p95 {:.1f} / p99 {:.1f} / max {:.1f}".format(
+                    quantiles[49] * 1000, quantiles[94] * 1000, quantiles[98] * 1000, max(self.latencies) * 1000,
+                )
+            )
+        failed = sum(count for code, count in codes.items() if code is None or code >= 500)
+        self.expect(not failed, f"{label} 실패(5xx/예외) {failed}건")
+
+    def check_seats(self, lecture):
+        lecture.refresh_from_db(fields=['seats_taken', 'capacity'])
+        enrolled = Enrollment.objects.filter(lecture=lecture).count()
+        self.stdout.write(f"  seats_taken={lecture.seats_taken}, 수강 인원={enrolled}, 정원={lecture.capacity}")
+        self.expect(lecture.seats_taken == enrolled <= lecture.capacity,
+                    f"seats_taken {lecture.seats_taken} / 수강 인원 {enrolled} / 정원 {lecture.capacity}")
+
+    def expect(self, ok, message):
+        if not ok:
+            self.errors.append(message)
+            self.stdout.write(self.style.ERROR(f"  실패: {message}"))
+
+    @staticmethod
+    def cleanup():
+        Lecture.objects.filter(name=PREFIX).delete()
+        User.objects.filter(username__startswith=PREFIX).delete()
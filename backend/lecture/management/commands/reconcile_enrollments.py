@@ -0,0 +1,18 @@
+# backend/lecture/management/commands/reconcile_enrollments.py
+
+from django.core.management.base import BaseCommand
+
+from lecture import enrollment
+
+
+class Command(BaseCommand):
+    help = (
+        "강의별 신청 인원(seats_taken)을 실제 수강 인원으로 다시 맞추고, "
+        "보관 기간(24시간)이 지난 수강신청 Idempotency-Key 기록을 삭제합니다. "
+        "(seed_data, 관리자 화면 등 수강신청 API를 거치지 않은 변경 후 실행)"
+    )
+
+    def handle(self, *args, **options):
+        seats = enrollment.recount_seats()
+        pruned = enrollment.prune_requests()
+        self.stdout.write(self.style.SUCCESS(f"신청 인원 {seats}개 강의 보정, 요청 기록 {pruned}건 삭제"))
@@ -0,0 +1,211 @@
+# backend/lecture/management/commands/run_benchmarks.py
+
+import json
+import math
+import re
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from community.models import Thread
+from doro.cache import tagged_cache
+from consultations.models import Consultation
+from lecture.models import Enrollment, LectureNotice
+from notice.models import SystemNotice
+from user.models import InterestTag, UserInterest
+
+# 필수 쿼리 파라미터가 있는 API (샘플 데이터에 따라 달라지는 값은 Command.query_strings)
+QUERY_STRINGS = {
+    'api/search/': 'q=게시판',
+}
+# re_path 경로의 이름 있는 그룹 (?P<name>...)
+REGEX_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+
+
+def iter_routes(patterns=None, prefix=''):
+    """doro/urls.py의 모든 URL 패턴을 (경로, 패턴) 형태로 펼칩니다. (include 포함)"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), pattern
+
+
+def allows_get(pattern):
+    view_class = getattr(pattern.callback, 'cls', None)
+    return view_class is not None and 'get' in view_class.http_method_names
+
+
+def build_url(route, values):
+    """경로 패턴에 샘플 값을 넣은 URL (re_path 패턴은 그룹을 값으로 바꾸고 ^, /?$를 정리, 값이 없으면 패턴 그대로)"""
+    values = {name: value for name, value in values.items() if value is not None}
+    url = route
+    for name, value in values.items():
+        url = url.replace(f'<int:{name}>', str(value))
+    if route.startswith('^'):
+        url = REGEX_GROUP.sub(lambda match: str(values.get(match.group(1), match.group(0))), url[1:])
+        url = re.sub(r'/\?\$$', '/', url).rstrip('$')
+    return '/' + url
+
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "doro/urls.py의 모든 GET API를 테스트 클라이언트로 호출해 "
+        "p50/p95/p99 지연, 쿼리 수, 응답 크기를 JSON으로 기록합니다. (seed_data로 데이터를 먼저 생성)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--output', default='benchmark.json', help="결과 JSON 경로")
+        parser.add_argument('--compare', help="이전 결과 JSON과 비교해 변화율 출력")
+        parser.add_argument('--with-cache', action='store_true', help="캐시를 켠 상태로 측정 (기본은 DB 경로 측정)")
+        parser.add_argument('--filter', help="경로에 이 문자열이 포함된 API만 측정")
+
+    def handle(self, *args, **options):
+        enrollment = Enrollment.objects.select_related('student', 'lecture').order_by('id').first()
+        if enrollment is None:
+            raise CommandError("수강 데이터가 없습니다. 먼저 manage.py seed_data 를 실행하세요.")
+        user = enrollment.student
+        params = self.route_params(user, enrollment.lecture_id)
+        query_strings = self.query_strings(enrollment.lecture.instructor_id)
+
+        client = APIClient()
+        client.force_authenticate(user)
+
+        settings_override = {'ALLOWED_HOSTS': ['*']}
+        if not options['with_cache']:
+            settings_override['CACHES'] = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+        results = {}
+        tagged_cache.reset_stats()
+        with override_settings(**settings_override):
+            for route, pattern in iter_routes():
+                if route.startswith('admin/') or not allows_get(pattern):
+                    continue
+                if options['filter'] and options['filter'] not in route:
+                    continue
+                url = build_url(route, params.get(route, {}))
+                if route in query_strings:
+                    url += '?' + query_strings[route]
+                if '<' in url:
+                    self.stderr.write(f"건너뜀 (샘플 값 없음): {route}")
+                    continue
+                results[route] = self.measure(client, url, options['iterations'], options['warmup'])
+                result = results[route]
+                self.stdout.write(
+                    f"{result['status']}  p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+                    f"p99 {result['p99_ms']:8.2f}ms  {result['queries']:3d} queries  {result['bytes']:9d} B  {url}"
+                )
+
+        report = {
+            'meta': {
+                'created_at': datetime.now(dt_timezone.utc).isoformat(),
+                'database': connection.vendor,
+                'iterations': options['iterations'],
+                'with_cache': options['with_cache'],
+                'user_id': user.pk,
+                # 이 명령 실행 동안의 TaggedCache 카운터 (프로세스별 - 서버 워커의 적중률과는 별개)
+                'tagged_cache': tagged_cache.stats(),
+            },
+            'endpoints': results,
+        }
+        with open(options['output'], 'w', encoding='utf-8') as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {options['output']}"))
+
+        if options['compare']:
+            self.compare(options['compare'], results)
+
+    def route_params(self, user, lecture_id):
+        """경로 파라미터에 넣을 샘플 값 (벤치마크 사용자 기준)"""
+        def first_pk(queryset):
+            return queryset.order_by('pk').values_list('pk', flat=True).first()
+
+        lecture_params = {'lecture_id': lecture_id}
+        return {
+            'api/dashboard/notices/<int:pk>/': {'pk': first_pk(SystemNotice.objects.all())},
+            'api/community/<int:pk>/': {'pk': first_pk(Thread.objects.filter(lecture_id=lecture_id))
+                                        or first_pk(Thread.objects.all())},
+            'api/lecture/<int:lecture_id>/notices/': lecture_params,
+            'api/lecture/notices/<int:pk>/': {'pk': first_pk(LectureNotice.objects.filter(lecture_id=lecture_id))},
+            'api/lecture/<int:lecture_id>/assignments/': lecture_params,
+            'api/lecture/<int:lecture_id>/attendance/': lecture_params,
+            'api/lecture/<int:lecture_id>/attendance/stats/': lecture_params,
+            'api/community/<int:pk>/comments/': {'pk': first_pk(Thread.objects.filter(lecture_id=lecture_id))
+                                                 or first_pk(Thread.objects.all())},
+            r'^api/courses/(?P<lecture_id>\d+)/enroll/?$': lecture_params,
+            'api/interests/<int:tag_id>/users/': {
+                'tag_id': UserInterest.objects.order_by('tag_id').values_list('tag_id', flat=True).first()
+                or first_pk(InterestTag.objects.all()),
+            },
+            'api/consultations/<int:pk>/': {'pk': first_pk(Consultation.objects.filter(student=user))},
+        }
+
+    def query_strings(self, instructor_id):
+        """필수 쿼리 파라미터 (빈 시간 조회: 수강 강의 강사의 오늘부터 4주)"""
+        today = timezone.localdate()
+        return {
+            **QUERY_STRINGS,
+            'api/consultations/slots/': (
+                f"instructor_id={instructor_id}&start={today}&end={today + timedelta(days=27)}"
+            ),
+        }
+
+    def measure(self, client, url, iterations, warmup):
+        for _ in range(warmup):
+            client.get(url)
+
+        timings = []
+        queries = 0
+        size = 0
+        status = None
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as ctx:
+                began = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - began) * 1000)
+            queries = len(ctx.captured_queries)
+            size = len(response.content)
+            status = response.status_code
+
+        timings.sort()
+        return {
+            'url': url,
+            'status': status,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'queries': queries,
+            'bytes': size,
+        }
+
+    def compare(self, path, results):
+        with open(path, encoding='utf-8') as fp:
+            baseline = json.load(fp)['endpoints']
+        self.stdout.write(f"\n{path} 대비 변화 (p95, 쿼리 수, 응답 크기)")
+        for route, result in results.items():
+            before = baseline.get(route)
+            if before is None:
+                self.stdout.write(f"  (신규) {route}")
+                continue
+            change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0.0
+            self.stdout.write(
+                f"  {change:+7.1f}%  queries {before['queries']} -> {result['queries']}  "
+                f"bytes {before['bytes']} -> {result['bytes']}  {route}"
+            )
@@ -0,0 +1,244 @@
+# backend/lecture/management/commands/seed_data.py
+
+import itertools
+import random
+import time
+from datetime import time as dt_time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from community import counters
+from community.models import Thread, Comment
+from consultations.models import Consultation, InstructorAvailability, SLOT_LENGTH
+from lecture import enrollment, recommend
+from lecture.models import Lecture, Enrollment, LectureSchedule, LectureNotice, Assignment, Attendance, Wishlist
+from notice.models import SystemNotice
+from search import index as search_index
+from user.models import User
+
+SEED_PREFIX = 'seed_'
+
+# 규모 프리셋 (--scale), 개별 옵션으로 덮어쓸 수 있습니다.
+SCALES = {
+    'small': dict(users=1_000, lectures=50, enrollments=10_000, attendance=50_000, threads=5_000, comments=10_000),
+    'medium': dict(users=20_000, lectures=500, enrollments=200_000, attendance=1_000_000, threads=100_000, comments=100_000),
+    'large': dict(users=100_000, lectures=2_000, enrollments=1_000_000, attendance=5_000_000, threads=500_000, comments=500_000),
+}
+
+WEEKS = 16
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = "벤치마크용 합성 데이터를 bulk insert로 생성합니다. (사용자 이름이 'seed_'로 시작)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=SCALES, default='small')
+        for name in SCALES['small']:
+            parser.add_argument(f'--{name}', type=int, help=f"{name} 행 수 (프리셋 값 대신 사용)")
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--seed', type=int, default=42, help="난수 시드 (같은 값이면 같은 데이터)")
+        parser.add_argument('--clear', action='store_true', help="기존 seed 데이터를 먼저 삭제")
+
+    def handle(self, *args, **options):
+        counts = dict(SCALES[options['scale']])
+        for name in counts:
+            if options[name] is not None:
+                counts[name] = options[name]
+        self.batch_size = options['batch_size']
+        self.random = random.Random(options['seed'])
+        self.now = timezone.now()
+
+        if options['clear']:
+            self.step("기존 seed 데이터 삭제", self.clear)
+
+        self.stdout.write(f"생성 규모: {counts}")
+        user_ids, student_ids, instructor_ids = self.step("users", self.create_users, counts['users'])
+        lecture_ids = self.step("lectures", self.create_lectures, counts['lectures'], instructor_ids)
+        pairs = self.step("enrollments", self.create_enrollments, counts['enrollments'], lecture_ids, student_ids)
+        self.step("attendance", self.create_attendance, counts['attendance'], pairs)
+        self.step("notices / assignments", self.create_lecture_content, lecture_ids, instructor_ids)
+        thread_ids = self.step("threads", self.create_threads, counts['threads'], lecture_ids, user_ids)
+        self.step("comments", self.create_comments, counts['comments'], thread_ids, user_ids)
+        self.step("consultations / availability / wishlists", self.create_consultations, pairs, instructor_ids)
+        # bulk_create로 넣은 수강 인원을 좌석 수에 반영합니다. (정원보다 많으면 정원을 늘림)
+        self.step("seats", enrollment.recount_seats)
+        # bulk_create는 시그널을 보내지 않으므로 검색 색인은 마지막에 한 번에 만듭니다.
+        self.step("search index", search_index.rebuild, None, self.batch_size)
+        self.step("recommendations", recommend.build)
+        self.stdout.write(self.style.SUCCESS("완료"))
+
+    # --- 유틸 ---
+    def step(self, label, func, *args):
+        began = time.perf_counter()
+        result = func(*args)
+        self.stdout.write(f"  {label}: {time.perf_counter() - began:.1f}s")
+        return result
+
+    def bulk(self, model, rows, **kwargs):
+        """제너레이터를 batch_size 단위로 나눠 bulk_create (메모리 사용량 일정)"""
+        for batch in batched(rows, self.batch_size):
+            with transaction.atomic():
+                model.objects.bulk_create(batch, batch_size=self.batch_size, **kwargs)
+
+    def past(self, max_days=120):
+        return self.now - timedelta(seconds=self.random.randint(0, max_days * 86400))
+
+    def clear(self):
+        # 강의/사용자를 지우면 나머지는 CASCADE로 함께 삭제됩니다.
+        Lecture.objects.filter(name__startswith=SEED_PREFIX).delete()
+        User.objects.filter(username__startswith=SEED_PREFIX).delete()
+
+    # --- 생성 단계 ---
+    def create_users(self, count):
+        # 비밀번호 해시는 비싸므로 한 번만 계산해 재사용 (비밀번호: seed-password)
+        password = make_password('seed-password')
+        instructor_count = max(1, count // 50)
+        start = User.objects.filter(username__startswith=SEED_PREFIX).count()
+        self.bulk(User, (
+            User(
+                username=f'{SEED_PREFIX}{start + i}',
+                email=f'{SEED_PREFIX}{start + i}@example.com',
+                password=password,
+                role=2 if i < instructor_count else 1,
+            )
+            for i in range(count)
+        ))
+        users = list(User.objects.filter(username__startswith=SEED_PREFIX).values_list('id', 'role'))
+        students = [pk for pk, role in users if role == 1]
+        instructors = [pk for pk, role in users if role == 2]
+        return [pk for pk, _ in users], students, instructors
+
+    def create_lectures(self, count, instructor_ids):
+        statuses = [choice for choice, _ in Lecture.STATUS_CHOICES]
+        start = Lecture.objects.filter(name__startswith=SEED_PREFIX).count()
+        self.bulk(Lecture, (
+            Lecture(
+                name=f'{SEED_PREFIX}강의 {start + i}',
+                description='벤치마크용 강의',
+                instructor_id=self.random.choice(instructor_ids),
+                status=self.random.choice(statuses),
+            )
+            for i in range(count)
+        ))
+        lecture_ids = list(Lecture.objects.filter(name__startswith=SEED_PREFIX).values_list('id', flat=True))
+        self.bulk(LectureSchedule, (
+            LectureSchedule(lecture_id=pk, start_date=self.past().date()) for pk in lecture_ids
+        ))
+        return lecture_ids
+
+    def create_enrollments(self, count, lecture_ids, student_ids):
+        # 강의마다 겹치지 않는 학생을 뽑아 (lecture, student) 중복 없이 생성
+        per_lecture = min(len(student_ids), max(1, count // len(lecture_ids)))
+        pairs = [
+            (lecture_id, student_id)
+            for lecture_id in lecture_ids
+            for student_id in self.random.sample(student_ids, per_lecture)
+        ][:count]
+        self.bulk(Enrollment, (
+            Enrollment(lecture_id=lecture_id, student_id=student_id) for lecture_id, student_id in pairs
+        ), ignore_conflicts=True)
+        return pairs
+
+    def create_attendance(self, count, pairs):
+        statuses = [value for value, _ in Attendance.Status.choices]
+        weights = [1, 8, 1]  # 결석 / 출석 / 지각
+        rows = (
+            Attendance(
+                lecture_id=lecture_id,
+                user_id=student_id,
+                week=week,
+                attendance_date=(self.now - timedelta(weeks=WEEKS - week)).date(),
+                status=self.random.choices(statuses, weights)[0],
+            )
+            for week in range(1, WEEKS + 1)
+            for lecture_id, student_id in pairs
+        )
+        self.bulk(Attendance, itertools.islice(rows, count))
+
+    def create_lecture_content(self, lecture_ids, instructor_ids):
+        self.bulk(LectureNotice, (
+            LectureNotice(lecture_id=pk, title=f'{n}주차 공지', body='벤치마크용 공지 내용입니다.')
+            for pk in lecture_ids for n in range(1, 6)
+        ))
+        self.bulk(Assignment, (
+            Assignment(
+                lecture_id=pk, title=f'과제 {n}', content='벤치마크용 과제',
+                deadline=self.now + timedelta(days=self.random.randint(-30, 30)),
+            )
+            for pk in lecture_ids for n in range(1, 4)
+        ))
+        self.bulk(SystemNotice, (
+            SystemNotice(author_id=self.random.choice(instructor_ids), title=f'시스템 공지 {n}', content='점검 안내')
+            for n in range(50)
+        ))
+
+    def create_threads(self, count, lecture_ids, user_ids):
+        self.bulk(Thread, (
+            Thread(
+                title=f'{SEED_PREFIX}질문 {i}',
+                content='벤치마크용 게시글 내용입니다. ' * 5,
+                student_id=self.random.choice(user_ids),
+                # 절반은 전체 게시판, 절반은 강의 게시판
+                lecture_id=self.random.choice(lecture_ids) if i % 2 else None,
+            )
+            for i in range(count)
+        ))
+        return list(Thread.objects.filter(title__startswith=SEED_PREFIX).values_list('id', flat=True))
+
+    def create_comments(self, count, thread_ids, user_ids):
+        self.bulk(Comment, (
+            Comment(
+                thread_id=self.random.choice(thread_ids),
+                student_id=self.random.choice(user_ids),
+                content='벤치마크용 댓글',
+            )
+            for _ in range(count)
+        ))
+        # bulk_create는 시그널을 보내지 않으므로 게시글 댓글 수 / 마지막 활동 시각을 한 번에 다시 계산합니다.
+        for batch in batched(thread_ids, self.batch_size):
+            counters.repair(batch)
+
+    def create_consultations(self, pairs, instructor_ids):
+        sample = self.random.sample(pairs, min(len(pairs), 10_000))
+        statuses = [choice for choice, _ in Consultation.STATUS_CHOICES]
+        # 같은 강사의 상담 시간이 겹치지 않도록 (강사, 시각) 조합을 한 번씩만 씁니다. (bulk_create는 save()를 거치지 않으므로 ends_at도 직접 채움)
+        hour = self.now.replace(minute=0, second=0, microsecond=0)
+        taken = set()
+
+        def consultations():
+            for _, student_id in sample:
+                instructor_id, offset = self.random.choice(instructor_ids), self.random.randint(-500, 500)
+                if (instructor_id, offset) in taken:
+                    continue
+                taken.add((instructor_id, offset))
+                scheduled_at = hour + timedelta(hours=offset)
+                yield Consultation(
+                    student_id=student_id,
+                    instructor_id=instructor_id,
+                    content='상담 요청',
+                    topic='진로',
+                    scheduled_at=scheduled_at,
+                    ends_at=scheduled_at + SLOT_LENGTH,
+                    status=self.random.choice(statuses),
+                )
+
+        self.bulk(Consultation, consultations())
+        # 강사 상담 가능 시간: 평일 10-12시, 14-18시
+        self.bulk(InstructorAvailability, (
+            InstructorAvailability(instructor_id=instructor_id, weekday=weekday, start_time=start, end_time=end)
+            for instructor_id in instructor_ids
+            for weekday in range(5)
+            for start, end in ((dt_time(10), dt_time(12)), (dt_time(14), dt_time(18)))
+        ))
+        self.bulk(Wishlist, (
+            Wishlist(lecture_id=lecture_id, user_id=student_id) for lecture_id, student_id in sample
+        ))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0003_alter_lecture_name_alter_lecture_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lecturenotice',
+            index=models.Index(fields=['lecture', 'created_at', 'id'], name='lecturenotice_lecture_idx'),
+        ),
+    ]
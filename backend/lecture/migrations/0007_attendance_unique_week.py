@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def check_duplicate_attendance(apps, schema_editor):
+    # 같은 (강의, 학생, 주차)에 여러 행이 있으면 유니크 제약을 만들 수 없습니다.
+    Attendance = apps.get_model('lecture', 'Attendance')
+    duplicates = list(
+        Attendance.objects.values_list('lecture_id', 'user_id', 'week')
+        .annotate(rows=models.Count('id')).filter(rows__gt=1).order_by('lecture_id', 'user_id', 'week')
+    )
+    if duplicates:
+        # 중복 출결은 자동으로 지우지 않습니다. (어느 기록을 남길지는 사람이 정해야 함)
+        keys = [(lecture_id, user_id, week) for lecture_id, user_id, week, _ in duplicates]
+        raise RuntimeError(
+            f"같은 주차의 출결이 중복되어 유니크 제약을 만들 수 없습니다. 정리 후 다시 실행하세요 "
+            f"(강의 ID, 학생 ID, 주차): {keys}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0006_hot_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_attendance, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(fields=('lecture', 'user', 'week'), name='attendance_lecture_user_week_uniq'),
+        ),
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='attendance_lecture_user_idx',
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0007_attendance_unique_week'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['created_at', 'id'], name='lecture_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='lecture_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['instructor', 'created_at', 'id'], name='lecture_instructor_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lectureschedule',
+            index=models.Index(fields=['start_date', 'lecture'], name='schedule_start_lecture_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0008_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LecturePopularity',
+            fields=[
+                ('lecture', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='popularity', serialize=False, to='lecture.lecture')),
+                ('score', models.FloatField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-score'], name='lecturepopularity_score_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LectureKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.FloatField()),
+                ('lecture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='lecture.lecture')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('term', 'lecture'), name='lecturekeyword_term_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LectureNeighbor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('lecture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbors', to='lecture.lecture')),
+                ('neighbor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='lecture.lecture')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('lecture', 'neighbor'), name='lectureneighbor_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+
+def count_seats(apps, schema_editor):
+    """기존 수강 인원으로 seats_taken을 채우고, 정원(기본 30)보다 많으면 정원을 인원에 맞춥니다."""
+    Lecture = apps.get_model('lecture', 'Lecture')
+    Enrollment = apps.get_model('lecture', 'Enrollment')
+    enrolled = (
+        Enrollment.objects.filter(lecture=OuterRef('pk')).order_by().values('lecture')
+        .annotate(n=Count('id')).values('n')
+    )
+    Lecture.objects.update(seats_taken=Coalesce(Subquery(enrolled, output_field=IntegerField()), 0))
+    Lecture.objects.update(capacity=Greatest('capacity', 'seats_taken'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lecture', '0009_recommendation_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnrollmentRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64)),
+                ('method', models.CharField(max_length=6)),
+                ('status_code', models.PositiveSmallIntegerField(null=True)),
+                ('response', models.JSONField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='lecture',
+            name='capacity',
+            field=models.PositiveIntegerField(default=30, verbose_name='정원'),
+        ),
+        migrations.AddField(
+            model_name='lecture',
+            name='seats_taken',
+            field=models.PositiveIntegerField(default=0, verbose_name='신청 인원'),
+        ),
+        migrations.RunPython(count_seats, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='lecture',
+            constraint=models.CheckConstraint(condition=models.Q(('seats_taken__lte', models.F('capacity'))), name='lecture_seats_within_capacity'),
+        ),
+        migrations.AddField(
+            model_name='enrollmentrequest',
+            name='lecture',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='lecture.lecture'),
+        ),
+        migrations.AddField(
+            model_name='enrollmentrequest',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='lecture',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist', to='lecture.lecture'),
+        ),
+        migrations.AddField(
+            model_name='waitlistentry',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlisted_lectures', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentrequest',
+            index=models.Index(fields=['created_at'], name='enrollrequest_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='enrollmentrequest',
+            constraint=models.UniqueConstraint(fields=('user', 'key'), name='enrollrequest_user_key_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='waitlistentry',
+            index=models.Index(fields=['lecture', 'created_at', 'id'], name='waitlist_queue_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='waitlistentry',
+            constraint=models.UniqueConstraint(fields=('lecture', 'student'), name='waitlist_lecture_student_uniq'),
+        ),
+    ]
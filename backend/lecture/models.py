@@ -25,6 +25,21 @@ class Lecture(models.Model):
     )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='RECRUITING')
     created_at = models.DateTimeField(auto_now_add=True)
+    # 정원과 신청 인원 (수강신청 API가 조건부 UPDATE로 증감 - lecture/enrollment.py)
+    capacity = models.PositiveIntegerField(default=30, verbose_name="정원")
+    seats_taken = models.PositiveIntegerField(default=0, verbose_name="신청 인원")
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=models.Q(seats_taken__lte=models.F('capacity')), name='lecture_seats_within_capacity'),
+        ]
+        indexes = [
+            # 강의 목록(api/courses/) 커서 페이지네이션: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['created_at', 'id'], name='lecture_created_idx'),
+            # 상태 / 강사 필터 + 같은 정렬 (상태 패싯 GROUP BY도 이 인덱스로 처리)
+            models.Index(fields=['status', 'created_at', 'id'], name='lecture_status_created_idx'),
+            models.Index(fields=['instructor', 'created_at', 'id'], name='lecture_instructor_created_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.get_status_display()}] {self.name}"
@@ -80,10 +95,56 @@ class Enrollment(models.Model):
         return f"{self.student.username} -> {self.lecture.name}"
 
 
+# 3-1. 수강 대기 (정원이 찬 강의, 수강 취소 시 먼저 신청한 순서대로 자동 등록)
+class WaitlistEntry(models.Model):
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="waitlist")
+    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name="waitlisted_lectures")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['lecture', 'student'], name='waitlist_lecture_student_uniq'),
+        ]
+        indexes = [
+            # 대기 순서: WHERE lecture_id = ? ORDER BY created_at, id
+            models.Index(fields=['lecture', 'created_at', 'id'], name='waitlist_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.student.username} -> {self.lecture.name} (대기)"
+
+
+# 3-2. 수강신청/취소 요청 기록 (Idempotency-Key 헤더가 같은 재시도에는 저장된 응답을 그대로 돌려줌)
+class EnrollmentRequest(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    key = models.CharField(max_length=64)
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="+")
+    method = models.CharField(max_length=6)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response = models.JSONField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='enrollrequest_user_key_uniq'),
+        ]
+        indexes = [
+            # 보관 기간이 지난 기록 삭제 (manage.py reconcile_enrollments)
+            models.Index(fields=['created_at'], name='enrollrequest_created_idx'),
+        ]
+
+
 # 4. 기타 부가 기능 (유지)
 class LectureSchedule(models.Model):
     lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="schedules")
     start_date = models.DateField()
+
+    class Meta:
+        indexes = [
+            # 강의 목록 시작일 필터 / 월별 패싯: WHERE start_date BETWEEN ? AND ? -> lecture_id
+            models.Index(fields=['start_date', 'lecture'], name='schedule_start_lecture_idx'),
+        ]
+
     def __str__(self):
         return f"{self.lecture.name} 일정"
 
@@ -92,6 +153,13 @@ class LectureNotice(models.Model):
     title = models.CharField(max_length=255)
     body = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True) # 이 줄을 추가하세요!
+    updated_at = models.DateTimeField(auto_now=True) # 조건부 GET(ETag) 계산용
+
+    class Meta:
+        indexes = [
+            # 강의별 공지 목록 / 대시보드 통합 공지 피드: WHERE lecture_id IN (...) ORDER BY created_at DESC
+            models.Index(fields=['lecture', 'created_at', 'id'], name='lecturenotice_lecture_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.lecture.name}] {self.title}"
@@ -118,6 +186,12 @@ class Attendance(models.Model):
         default=Status.ABSENT
     )
 
+    class Meta:
+        constraints = [
+            # 한 학생의 주차별 출결은 하나 (일괄 기록 upsert의 충돌 기준, 내 출결 조회 인덱스 겸용)
+            models.UniqueConstraint(fields=['lecture', 'user', 'week'], name='attendance_lecture_user_week_uniq'),
+        ]
+
     def __str__(self):
         return f"{self.lecture.name} - {self.week}주차 - {self.get_status_display()}"
 
@@ -130,6 +204,51 @@ class Assignment(models.Model):
     content = models.TextField()
     deadline = models.DateTimeField() # 마감 기한
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # 강의별/내 과제 목록: WHERE lecture_id = ? ORDER BY deadline
+            models.Index(fields=['lecture', 'deadline'], name='assignment_deadline_idx'),
+        ]
 
     def __str__(self):
-        return f"[{self.lecture.name}] {self.title}"
\ No newline at end of file
+        return f"[{self.lecture.name}] {self.title}"
+
+# 5. 강의 추천 색인 (manage.py build_recommendations 배치가 통째로 다시 만듭니다 - lecture/recommend.py)
+
+class LectureNeighbor(models.Model):
+    """강의별 유사 강의 상위 K개 (공동 수강/찜 + 강의 내용 유사도)"""
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="neighbors")
+    neighbor = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # 추천 조회: WHERE lecture_id IN (내 수강/찜 강의)
+            models.UniqueConstraint(fields=['lecture', 'neighbor'], name='lectureneighbor_uniq'),
+        ]
+
+
+class LectureKeyword(models.Model):
+    """강의별 대표 키워드 (강의명/설명 토큰의 TF-IDF 상위), 관심분야 -> 강의 역색인"""
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="keywords")
+    term = models.CharField(max_length=64)
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # 추천 조회: WHERE term IN (관심분야 토큰)
+            models.UniqueConstraint(fields=['term', 'lecture'], name='lecturekeyword_term_uniq'),
+        ]
+
+
+class LecturePopularity(models.Model):
+    """추천 대상 강의의 인기도 (수강/찜 가중 합계), 추천 근거가 부족한 사용자용"""
+    lecture = models.OneToOneField(Lecture, on_delete=models.CASCADE, primary_key=True, related_name="popularity")
+    score = models.FloatField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-score'], name='lecturepopularity_score_idx'),
+        ]
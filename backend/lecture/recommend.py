@@ -0,0 +1,281 @@
+# backend/lecture/recommend.py
+
+import itertools
+import math
+import zlib
+from collections import Counter, defaultdict
+
+import numpy as np
+from django.db import transaction
+from django.db.models import FloatField, Value
+
+from search.tokenizer import index_tokens
+from user.interests import tag_names
+from .models import Lecture, Enrollment, Wishlist, LectureNeighbor, LectureKeyword, LecturePopularity
+
+# 추천할 수 있는 강의 (신청 가능한 상태)
+RECOMMENDABLE_STATUSES = ('OPEN', 'RECRUITING')
+
+# 상호작용 가중치 (찜은 수강보다 약한 신호)
+ENROLLMENT_WEIGHT = 1.0
+WISHLIST_WEIGHT = 0.5
+# 강의 간 유사도 = 공동 수강/찜 코사인 * 0.7 + 강의 내용(TF-IDF) 코사인 * 0.3
+COOCCURRENCE_WEIGHT = 0.7
+CONTENT_WEIGHT = 0.3
+# 관심분야 키워드 일치 점수 배율
+INTEREST_WEIGHT = 1.0
+
+TOP_K = 20                   # 강의별로 저장할 유사 강의 수
+KEYWORDS_PER_LECTURE = 20    # 강의별로 저장할 키워드 수
+MAX_INTEREST_TERMS = 50
+TITLE_REPEAT = 3             # 강의명 토큰은 설명 토큰보다 3배 가중
+HASH_DIM = 4_096             # 내용 벡터 차원 (토큰 해싱, 어휘 크기와 무관하게 메모리 고정)
+MAX_ITEMS_PER_USER = 200     # 사용자당 상호작용 상한 (사용자 한 명이 만드는 쌍 = 상한^2)
+PAIR_CHUNK = 5_000_000       # 한 번에 집계하는 (강의, 강의) 쌍 수
+ROW_CHUNK = 512              # 상위 K 선택 시 한 번에 처리하는 행 수
+BATCH_SIZE = 5_000
+
+
+# === 배치: 유사도 계산 (manage.py build_recommendations) ===
+# 강의 n개 기준 메모리는 n x n float32 행렬 두세 개 (5천 개 = 약 100MB씩)이고,
+# 사용자 수에는 쌍 집계 청크 크기만큼만 비례합니다.
+
+def load_interactions(lecture_ids):
+    """
+    (사용자 ID, 강의 인덱스, 가중치) 배열 - 사용자 순 정렬, 같은 사용자 안에서는 가중치 큰 순
+    같은 (사용자, 강의)는 가중치가 큰 쪽 하나만, 사용자당 MAX_ITEMS_PER_USER개까지
+    """
+    users, items, weights = [], [], []
+    for model, user_field, weight in (
+        (Enrollment, 'student_id', ENROLLMENT_WEIGHT),
+        (Wishlist, 'user_id', WISHLIST_WEIGHT),
+    ):
+        rows = model.objects.order_by().values_list(user_field, 'lecture_id').iterator(chunk_size=BATCH_SIZE)
+        pairs = np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64).reshape(-1, 2)
+        users.append(pairs[:, 0])
+        items.append(np.searchsorted(lecture_ids, pairs[:, 1]))
+        weights.append(np.full(len(pairs), weight, dtype=np.float32))
+    users, items, weights = np.concatenate(users), np.concatenate(items), np.concatenate(weights)
+    if not len(users):
+        return users, items, weights
+
+    order = np.lexsort((-weights, items, users))
+    users, items, weights = users[order], items[order], weights[order]
+    first = np.r_[True, (users[1:] != users[:-1]) | (items[1:] != items[:-1])]
+    users, items, weights = users[first], items[first], weights[first]
+
+    order = np.lexsort((-weights, users))
+    users, items, weights = users[order], items[order], weights[order]
+    starts = np.r_[True, users[1:] != users[:-1]]
+    group_start = np.flatnonzero(starts)[np.cumsum(starts) - 1]
+    keep = np.arange(len(users)) - group_start < MAX_ITEMS_PER_USER
+    return users[keep], items[keep], weights[keep]
+
+
+def pair_indices(sizes):
+    """연속된 묶음(크기 sizes)마다 묶음 안의 모든 (a, b) 행 번호 쌍 (a == b 포함)"""
+    offsets = np.r_[0, np.cumsum(sizes)[:-1]]
+    row_sizes = np.repeat(sizes, sizes)
+    row_offsets = np.repeat(offsets, sizes)
+    a = np.repeat(np.arange(len(row_sizes)), row_sizes)
+    position = np.arange(len(a)) - np.repeat(np.cumsum(row_sizes) - row_sizes, row_sizes)
+    b = np.repeat(row_offsets, row_sizes) + position
+    return a, b
+
+
+def cooccurrence_similarity(users, items, weights, n):
+    """
+    공동 상호작용 코사인 유사도 (n x n)
+    C[i, j] = Σ_u w(u, i) * w(u, j)를 사용자 묶음 단위 희소 쌍 집계로 더한 뒤 sqrt(C[i, i] * C[j, j])로 나눕니다.
+    (사용자 x 강의 행렬을 만들지 않으므로 비용은 사용자 수가 아니라 쌍 수에 비례)
+    """
+    matrix = np.zeros(n * n, dtype=np.float32)
+    if len(users):
+        starts = np.flatnonzero(np.r_[True, users[1:] != users[:-1]])
+        sizes = np.diff(np.r_[starts, len(users)])
+        # 사용자 묶음을 쌍 수가 PAIR_CHUNK 이하가 되도록 나눕니다.
+        chunk_of_group = (np.cumsum(sizes.astype(np.int64) ** 2) - 1) // PAIR_CHUNK
+        bounds = np.r_[0, np.flatnonzero(np.diff(chunk_of_group)) + 1, len(sizes)]
+        for g0, g1 in zip(bounds[:-1], bounds[1:]):
+            row0 = starts[g0]
+            a, b = pair_indices(sizes[g0:g1])
+            a += row0
+            b += row0
+            keys, inverse = np.unique(items[a] * n + items[b], return_inverse=True)
+            matrix[keys] += np.bincount(inverse, weights=weights[a] * weights[b]).astype(np.float32)
+
+    matrix = matrix.reshape(n, n)
+    norms = np.sqrt(np.diag(matrix))
+    inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    matrix *= inverse_norms[:, None]
+    matrix *= inverse_norms[None, :]
+    return matrix
+
+
+def lecture_terms(name, description):
+    tokens = index_tokens(name).split() * TITLE_REPEAT + index_tokens(description).split()
+    return Counter(token for token in tokens if len(token) <= 64)
+
+
+def content_vectors(term_counts):
+    """
+    강의별 TF-IDF 벡터 (토큰 해싱, 행 단위 L2 정규화)와 대표 키워드 [(토큰, 가중치)]
+    """
+    n = len(term_counts)
+    document_frequency = Counter(term for counts in term_counts for term in counts)
+    vectors = np.zeros((n, HASH_DIM), dtype=np.float32)
+    keywords = []
+    for i, counts in enumerate(term_counts):
+        weighted = {
+            term: (1 + math.log(count)) * (math.log((1 + n) / (1 + document_frequency[term])) + 1)
+            for term, count in counts.items()
+        }
+        norm = math.sqrt(sum(value * value for value in weighted.values())) or 1.0
+        for term, value in weighted.items():
+            vectors[i, zlib.crc32(term.encode()) % HASH_DIM] += value / norm
+        top = sorted(weighted.items(), key=lambda item: (-item[1], item[0]))[:KEYWORDS_PER_LECTURE]
+        keywords.append([(term, value / norm) for term, value in top])
+
+    norms = np.linalg.norm(vectors, axis=1)
+    vectors /= np.where(norms > 0, norms, 1.0)[:, None]
+    return vectors, keywords
+
+
+def top_neighbors(similarity, candidates, k):
+    """행별 점수 상위 k개 (자기 자신, 추천 대상이 아닌 강의, 0 이하 점수 제외) -> (행, 열, 점수) 배열"""
+    n = len(similarity)
+    np.fill_diagonal(similarity, -1.0)
+    similarity[:, ~candidates] = -1.0
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float32)
+
+    rows, columns, scores = [], [], []
+    for start in range(0, n, ROW_CHUNK):
+        block = similarity[start:start + ROW_CHUNK]
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        keep = top_scores > 0
+        rows.append(np.nonzero(keep)[0] + start)
+        columns.append(top[keep])
+        scores.append(top_scores[keep])
+    return np.concatenate(rows), np.concatenate(columns), np.concatenate(scores)
+
+
+def build(k=TOP_K):
+    """
+    추천 색인(유사 강의 / 키워드 / 인기도)을 다시 계산해 통째로 교체합니다.
+    반환값: 테이블별 행 수
+    """
+    lectures = list(Lecture.objects.order_by('id').values_list('id', 'name', 'description', 'status'))
+    lecture_ids = np.fromiter((row[0] for row in lectures), dtype=np.int64, count=len(lectures))
+    candidates = np.fromiter((row[3] in RECOMMENDABLE_STATUSES for row in lectures), dtype=bool, count=len(lectures))
+    n = len(lectures)
+
+    users, items, weights = load_interactions(lecture_ids)
+    popularity = np.bincount(items, weights=weights, minlength=n)
+
+    vectors, keywords = content_vectors([lecture_terms(name, description) for _, name, description, _ in lectures])
+    similarity = cooccurrence_similarity(users, items, weights, n)
+    similarity *= COOCCURRENCE_WEIGHT
+    similarity += CONTENT_WEIGHT * (vectors @ vectors.T)
+    del vectors
+    rows, columns, scores = top_neighbors(similarity, candidates, k)
+    del similarity
+
+    with transaction.atomic():
+        LectureNeighbor.objects.all().delete()
+        LectureKeyword.objects.all().delete()
+        LecturePopularity.objects.all().delete()
+        LectureNeighbor.objects.bulk_create((
+            LectureNeighbor(lecture_id=lecture_ids[row], neighbor_id=lecture_ids[column], score=score)
+            for row, column, score in zip(rows.tolist(), columns.tolist(), scores.tolist())
+        ), batch_size=BATCH_SIZE)
+        LectureKeyword.objects.bulk_create((
+            LectureKeyword(lecture_id=lecture_id, term=term, weight=weight)
+            for lecture_id, terms in zip(lecture_ids.tolist(), keywords) for term, weight in terms
+        ), batch_size=BATCH_SIZE)
+        LecturePopularity.objects.bulk_create((
+            LecturePopularity(lecture_id=lecture_id, score=score)
+            for lecture_id, score, candidate in zip(lecture_ids.tolist(), popularity.tolist(), candidates.tolist())
+            if score > 0 and candidate
+        ), batch_size=BATCH_SIZE)
+
+    return {
+        'lectures': n,
+        'interactions': len(users),
+        'neighbors': len(rows),
+        'keywords': sum(len(terms) for terms in keywords),
+        'popular': int(((popularity > 0) & candidates).sum()),
+    }
+
+
+# === 조회: 사용자별 추천 (배치가 만든 색인만 읽음) ===
+
+def interest_terms(user):
+    """관심분야 태그 이름 -> 강의 키워드와 같은 방식으로 나눈 토큰"""
+    return sorted(set(index_tokens(' '.join(tag_names(user))).split()))[:MAX_INTEREST_TERMS]
+
+
+def recommend(user, limit=10, lectures=None):
+    """
+    사용자에게 추천할 강의 목록 (각 Lecture에 score, reason 속성을 붙여 반환)
+    - history: 수강/찜한 강의의 유사 강의 (LectureNeighbor)
+    - interest: 관심분야 토큰과 일치하는 강의 키워드 (LectureKeyword)
+    - popular: 근거가 부족하면 인기 강의로 채움 (LecturePopularity)
+    이미 수강/찜한 강의와 신청할 수 없는 상태의 강의는 제외합니다.
+    lectures: 강의를 읽을 queryset (직렬화용 select_related/annotate를 미리 적용해 넘김)
+    """
+    lectures = Lecture.objects.all() if lectures is None else lectures
+    lectures = lectures.filter(status__in=RECOMMENDABLE_STATUSES)
+
+    enrolled = Enrollment.objects.filter(student=user).values_list(
+        'lecture_id', Value(ENROLLMENT_WEIGHT, output_field=FloatField()))
+    wished = Wishlist.objects.filter(user=user).values_list(
+        'lecture_id', Value(WISHLIST_WEIGHT, output_field=FloatField()))
+    seeds = {}
+    for lecture_id, weight in enrolled.union(wished, all=True):
+        seeds[lecture_id] = max(weight, seeds.get(lecture_id, 0.0))
+
+    history = defaultdict(float)
+    if seeds:
+        for lecture_id, neighbor_id, score in LectureNeighbor.objects.filter(lecture_id__in=seeds).values_list(
+                'lecture_id', 'neighbor_id', 'score'):
+            history[neighbor_id] += seeds[lecture_id] * score
+
+    interest = defaultdict(float)
+    terms = interest_terms(user)
+    if terms:
+        for lecture_id, weight in LectureKeyword.objects.filter(term__in=terms).values_list('lecture_id', 'weight'):
+            interest[lecture_id] += INTEREST_WEIGHT * weight
+
+    scores = {
+        lecture_id: history[lecture_id] + interest[lecture_id]
+        for lecture_id in history.keys() | interest.keys() if lecture_id not in seeds
+    }
+    # 상태 조건으로 빠질 강의를 감안해 여유 있게 읽습니다.
+    ranked = sorted(scores, key=lambda lecture_id: (-scores[lecture_id], lecture_id))[:limit * 3]
+    picked = {lecture.pk: lecture for lecture in lectures.filter(id__in=ranked)} if ranked else {}
+    results = []
+    for lecture_id in ranked:
+        if lecture_id in picked and len(results) < limit:
+            lecture = picked[lecture_id]
+            lecture.score = round(scores[lecture_id], 4)
+            lecture.reason = 'history' if history[lecture_id] >= interest[lecture_id] else 'interest'
+            results.append(lecture)
+
+    if len(results) < limit:
+        # 인기도는 배치 시점에 추천 대상이던 강의만 저장되어 있고, 이후 바뀐 상태는 강의를 읽을 때 거릅니다.
+        exclude = seeds.keys() | {lecture.pk for lecture in results}
+        popular = list(
+            LecturePopularity.objects.exclude(lecture_id__in=exclude).order_by('-score')
+            .values_list('lecture_id', flat=True)[:(limit - len(results)) * 3]
+        )
+        picked = {lecture.pk: lecture for lecture in lectures.filter(id__in=popular)} if popular else {}
+        for lecture_id in popular:
+            if lecture_id in picked and len(results) < limit:
+                lecture = picked[lecture_id]
+                lecture.score = 0.0
+                lecture.reason = 'popular'
+                results.append(lecture)
+    return results
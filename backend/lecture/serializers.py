@@ -1,18 +1,41 @@
 from rest_framework import serializers
+from doro.prefetch import EagerLoadingMixin
 from .models import Lecture, Enrollment, Assignment, LectureNotice, Attendance
 
 # 1. 강의 정보 시리얼라이저
-class LectureSerializer(serializers.ModelSerializer):
+class LectureSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     # instructor_name 필드 유지
     instructor_name = serializers.ReadOnlyField(source='instructor.username')
 
+    select_related_fields = ('instructor',)
+
     class Meta:
         model = Lecture
         # 모델에 실제로 존재하는 필드만 포함시킵니다.
         fields = ['id', 'name', 'instructor_name', 'status', 'description']
 
+# 1-1. 강의 목록(수강신청 카탈로그) 카드용 (start_date는 lecture/catalog.py의 annotate 값)
+class CourseCatalogSerializer(LectureSerializer):
+    # 신청 인원은 수강신청 API가 갱신하는 좌석 수 (lecture/enrollment.py)
+    enrolled_count = serializers.IntegerField(source='seats_taken', read_only=True)
+    start_date = serializers.DateField(read_only=True, allow_null=True)
+
+    only_fields = ('id', 'name', 'description', 'status', 'created_at', 'capacity', 'seats_taken', 'instructor__username')
+
+    class Meta(LectureSerializer.Meta):
+        fields = LectureSerializer.Meta.fields + ['capacity', 'enrolled_count', 'start_date']
+
+# 1-2. 추천 강의 카드 (score, reason은 lecture/recommend.py가 붙이는 속성)
+class CourseRecommendationSerializer(CourseCatalogSerializer):
+    score = serializers.FloatField(read_only=True)
+    reason = serializers.CharField(read_only=True)
+
+    class Meta(CourseCatalogSerializer.Meta):
+        fields = CourseCatalogSerializer.Meta.fields + ['score', 'reason']
+
 # 2. 수강 내역 시리얼라이저 (내 강의 목록용)
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    # lecture, lecture__instructor는 LectureSerializer 선언에 따라 자동으로 JOIN 됩니다.
     lecture = LectureSerializer(read_only=True)
 
     class Meta:
@@ -20,27 +43,56 @@ class EnrollmentSerializer(serializers.ModelSerializer):
         fields = ['id', 'lecture', 'joined_at'] # id 필드도 포함하는 것이 좋습니다.
 
 # 3. 과제 시리얼라이저
-class AssignmentSerializer(serializers.ModelSerializer):
+class AssignmentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     lecture_name = serializers.ReadOnlyField(source='lecture.name')
 
+    select_related_fields = ('lecture',)
+    only_fields = ('id', 'title', 'deadline', 'content', 'lecture__name')
+
     class Meta:
         model = Assignment
         fields = ['id', 'lecture_name', 'title', 'deadline', 'content']
 
 # 4. 강의 공지 시리얼라이저
-class LectureNoticeSerializer(serializers.ModelSerializer):
+class LectureNoticeSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     content = serializers.CharField(source='body') 
     lecture_name = serializers.ReadOnlyField(source='lecture.name')
     author_name = serializers.ReadOnlyField(source='lecture.instructor.username')
-    
+
+    select_related_fields = ('lecture__instructor',)
+    only_fields = ('id', 'title', 'body', 'created_at', 'lecture__name', 'lecture__instructor__username')
+
     class Meta:
         model = LectureNotice
         fields = ['id', 'title', 'content', 'created_at', 'lecture_name', 'author_name', 'lecture']
 
 # 5. 출결 시리얼라이저
-class AttendanceSerializer(serializers.ModelSerializer):
+class AttendanceSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     status = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
         model = Attendance
-        fields = ['id', 'week', 'attendance_date', 'status']
\ No newline at end of file
+        fields = ['id', 'week', 'attendance_date', 'status']
+
+# 6. 출결 일괄 기록 시리얼라이저 (강사용)
+class AttendanceBulkSerializer(serializers.Serializer):
+    week = serializers.IntegerField(min_value=1)
+    attendance_date = serializers.DateField()
+    # {"학생 ID": "PRESENT" | "LATE" | "ABSENT" (또는 1 / 2 / 0)}
+    records = serializers.DictField(child=serializers.CharField(), allow_empty=False)
+
+    def validate_records(self, value):
+        statuses = {label: status for status, label in Attendance.Status.choices}
+        statuses.update({str(status): status for status in Attendance.Status.values})
+        records = {}
+        errors = {}
+        for student_id, status in value.items():
+            if not str(student_id).isdigit():
+                errors[student_id] = "학생 ID는 정수여야 합니다."
+            elif status.upper() not in statuses:
+                errors[student_id] = f"알 수 없는 출결 상태입니다: {status}"
+            else:
+                records[int(student_id)] = statuses[status.upper()]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return records
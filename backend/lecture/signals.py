@@ -0,0 +1,47 @@
+# backend/lecture/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from doro.cache import tagged_cache
+from .models import Lecture, LectureNotice, LectureSchedule, Assignment
+from .catalog import FACET_TAG
+from . import enrollment
+
+
+# === 캐시 무효화 (doro.cache 태그, 트랜잭션 커밋 후) ===
+
+@receiver([post_save, post_delete], sender=LectureNotice)
+def lecture_notice_changed(sender, instance, **kwargs):
+    tagged_cache.invalidate_on_commit(f'lecture:{instance.lecture_id}', f'lecture_notice:{instance.pk}')
+
+
+@receiver([post_save, post_delete], sender=Assignment)
+def assignment_changed(sender, instance, **kwargs):
+    tagged_cache.invalidate_on_commit(f'lecture:{instance.lecture_id}')
+
+
+@receiver(post_save, sender=Lecture)
+def lecture_changed(sender, instance, created, **kwargs):
+    if created:
+        return
+    # 강의명/강사가 바뀌면 공지 상세에 표시되는 값도 바뀝니다.
+    notice_ids = instance.notices.values_list('id', flat=True)
+    tagged_cache.invalidate_on_commit(f'lecture:{instance.pk}', *(f'lecture_notice:{pk}' for pk in notice_ids))
+
+
+@receiver([post_save, post_delete], sender=Lecture)
+@receiver([post_save, post_delete], sender=LectureSchedule)
+def catalog_changed(sender, instance, **kwargs):
+    # 강의 상태/강사 변경, 새 강의, 일정 변경은 강의 목록 패싯 개수를 바꿉니다.
+    tagged_cache.invalidate_on_commit(FACET_TAG)
+
+
+# === 수강 대기자 자동 등록 (lecture/enrollment.py) ===
+
+@receiver(post_save, sender=Lecture)
+def lecture_seats_changed(sender, instance, created, raw=False, **kwargs):
+    # 정원을 늘리거나 수강신청을 다시 열면 빈 좌석만큼 대기자를 등록합니다. (좌석이 없으면 UPDATE 한 번)
+    if not created and not raw and instance.status == enrollment.OPEN_STATUS:
+        transaction.on_commit(lambda: enrollment.fill_from_waitlist(instance))
@@ -1,3 +1,87 @@
-from django.test import TestCase
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from user.models import User
+from . import enrollment
+from .models import Lecture, Enrollment, WaitlistEntry
+
+
+class EnrollmentApiTests(APITestCase):
+    """수강신청 API: 좌석 수, 대기 순번, 대기자 자동 등록, Idempotency-Key (lecture/enrollment.py)"""
+
+    def setUp(self):
+        instructor = User.objects.create(username='instructor', role=2)
+        self.lecture = Lecture.objects.create(name='lecture', instructor=instructor, status='OPEN', capacity=2)
+        self.url = f'/api/courses/{self.lecture.pk}/enroll/'
+        self.students = [User.objects.create(username=f'student{i}', role=1) for i in range(5)]
+
+    def call(self, method, student, key=None, url=None):
+        self.client.force_authenticate(student)
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        return getattr(self.client, method)(url or self.url, **headers)
+
+    def assertSeats(self, expected):
+        self.lecture.refresh_from_db()
+        self.assertEqual(self.lecture.seats_taken, expected)
+        self.assertEqual(Enrollment.objects.filter(lecture=self.lecture).count(), expected)
+
+    def test_full_lecture_waitlists_with_position(self):
+        codes = [self.call('post', student).status_code for student in self.students[:2]]
+        self.assertEqual(codes, [201, 201])
+
+        for position, student in enumerate(self.students[2:], start=1):
+            response = self.call('post', student)
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.data, {'lecture_id': self.lecture.pk, 'status': 'WAITLISTED', 'position': position})
+        self.assertSeats(2)
+        # 같은 학생이 다시 신청해도 좌석/인원은 그대로
+        self.assertEqual(self.call('post', self.students[0]).status_code, 200)
+        self.assertSeats(2)
+
+    def test_drop_promotes_first_waitlisted_student(self):
+        for student in self.students[:4]:
+            self.call('post', student)
+
+        response = self.call('delete', self.students[0])
+
+        self.assertEqual(response.data['status'], 'DROPPED')
+        self.assertSeats(2)
+        enrolled = set(Enrollment.objects.filter(lecture=self.lecture).values_list('student_id', flat=True))
+        self.assertEqual(enrolled, {self.students[1].pk, self.students[2].pk})
+        self.assertEqual(self.call('get', self.students[3]).data['position'], 1)
+
+    def test_capacity_increase_fills_from_waitlist(self):
+        for student in self.students[:4]:
+            self.call('post', student)
+        # 정원을 늘리면 커밋 후 빈 좌석만큼 대기 순서대로 등록 (lecture/signals.py)
+        self.lecture.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.lecture.capacity = 3
+            self.lecture.save()
+
+        self.assertSeats(3)
+        self.assertTrue(Enrollment.objects.filter(lecture=self.lecture, student=self.students[2]).exists())
+        self.assertEqual(list(WaitlistEntry.objects.values_list('student_id', flat=True)), [self.students[3].pk])
+        # 좌석이 없으면 아무도 등록하지 않습니다.
+        self.assertEqual(enrollment.fill_from_waitlist(self.lecture), [])
+
+    def test_same_idempotency_key_replays_stored_response(self):
+        for student in self.students[:2]:
+            self.call('post', student)
+        first = self.call('post', self.students[2], key='retry-1')
+        replay = self.call('post', self.students[2], key='retry-1')
+
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual((replay.status_code, replay.data), (202, first.data))
+        self.assertEqual(replay['Idempotent-Replayed'], 'true')
+        self.assertEqual(WaitlistEntry.objects.filter(lecture=self.lecture).count(), 1)
+
+    def test_idempotency_key_reused_on_other_lecture_is_rejected(self):
+        other = Lecture.objects.create(name='other', instructor=self.lecture.instructor, status='OPEN', capacity=2)
+        self.assertEqual(self.call('post', self.students[0], key='key-1').status_code, 201)
+
+        response = self.call('post', self.students[0], key='key-1', url=f'/api/courses/{other.pk}/enroll/')
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(Enrollment.objects.filter(lecture=other).exists())
+        # 같은 강의라도 다른 메서드(취소)에 쓰면 거절
+        self.assertEqual(self.call('delete', self.students[0], key='key-1').status_code, 422)
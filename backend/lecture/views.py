@@ -1,15 +1,24 @@
 # backend/lecture/views.py
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework import status
+from doro.cache import tagged_cache, make_key
+from doro.conditional import conditional_on
 from .models import Enrollment, Assignment
 from .serializers import EnrollmentSerializer, AssignmentSerializer
 from .models import LectureNotice
 from .serializers import LectureNoticeSerializer
-from .models import Attendance
-from .serializers import AttendanceSerializer
+from .models import Attendance, Lecture
+from .serializers import AttendanceSerializer, AttendanceBulkSerializer, CourseCatalogSerializer
+from .serializers import CourseRecommendationSerializer
+from .analytics import attendance_stats
+from . import catalog, enrollment, recommend
+from user import stats as user_stats
 
 # 1. 내 수강 강의 목록 조회
 @api_view(['GET'])
@@ -19,7 +28,7 @@ def my_course_list_api(request):
     로그인한 학생이 수강 신청한 강의 목록 조회
     """
     user = request.user
-    enrollments = Enrollment.objects.filter(student=user).select_related('lecture', 'lecture__instructor')
+    enrollments = EnrollmentSerializer.setup_eager_loading(Enrollment.objects.filter(student=user))
     serializer = EnrollmentSerializer(enrollments, many=True)
     return Response(serializer.data)
 
@@ -36,6 +45,7 @@ def my_task_list_api(request):
     
     # 해당 강의들의 과제만 가져오기 (마감일 순 정렬)
     tasks = Assignment.objects.filter(lecture_id__in=enrolled_lecture_ids).order_by('deadline')
+    tasks = AssignmentSerializer.setup_eager_loading(tasks)
     
     serializer = AssignmentSerializer(tasks, many=True)
     return Response(serializer.data)
@@ -43,39 +53,226 @@ def my_task_list_api(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional_on(lambda lecture_id: [LectureNotice.objects.filter(lecture_id=lecture_id)])
 def course_notice_list_api(request, lecture_id):
     """특정 강의의 공지사항 목록 조회"""
-    # 해당 강의의 공지들만 가져옴 (최신순 정렬)
-    notices = LectureNotice.objects.filter(lecture_id=lecture_id).order_by('-created_at')
-    serializer = LectureNoticeSerializer(notices, many=True)
-    return Response(serializer.data)
+    def build():
+        # 해당 강의의 공지들만 가져옴 (최신순 정렬)
+        notices = LectureNotice.objects.filter(lecture_id=lecture_id).order_by('-created_at')
+        notices = LectureNoticeSerializer.setup_eager_loading(notices)
+        return list(LectureNoticeSerializer(notices, many=True).data)
+
+    # 공지/강의가 바뀌면 lecture:<id> 태그로 무효화 (lecture/signals.py)
+    data = tagged_cache.get_or_set(make_key('lecture', lecture_id, 'notices'), build, tags=[f'lecture:{lecture_id}'])
+    return Response(data)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def attendance_api(request, lecture_id):
+    """특정 강의의 내 출결 현황 조회(GET) 및 주차 출결 일괄 기록(POST, 강사)"""
+    user = request.user
+
+    if request.method == 'GET':
+        attendances = Attendance.objects.filter(lecture_id=lecture_id, user=user).order_by('week')
+        serializer = AttendanceSerializer(attendances, many=True)
+        return Response(serializer.data)
+
+    elif request.method == 'POST':
+        lecture = get_object_or_404(Lecture, pk=lecture_id)
+        if lecture.instructor_id != user.id and not user.is_staff:
+            return Response({"error": "담당 강사만 출결을 기록할 수 있습니다."}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = AttendanceBulkSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        week = serializer.validated_data['week']
+        attendance_date = serializer.validated_data['attendance_date']
+        records = serializer.validated_data['records']
+
+        # 수강생이 아닌 ID는 한 번의 쿼리로 걸러냅니다.
+        enrolled = set(
+            Enrollment.objects.filter(lecture=lecture, student_id__in=records.keys()).values_list('student_id', flat=True)
+        )
+        not_enrolled = sorted(set(records) - enrolled)
+        if not_enrolled:
+            return Response(
+                {"error": "수강생이 아닌 학생이 포함되어 있습니다.", "student_ids": not_enrolled},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # (lecture, user, week) 유니크 제약 기준 upsert - 이미 있으면 상태/날짜만 갱신
+        rows = [
+            Attendance(lecture=lecture, user_id=student_id, week=week, attendance_date=attendance_date, status=value)
+            for student_id, value in records.items()
+        ]
+        with transaction.atomic():
+            # bulk_create는 시그널을 보내지 않으므로 마이페이지 출결 카운터는 이전 상태와 비교해 직접 갱신합니다.
+            previous = dict(
+                Attendance.objects.filter(lecture=lecture, week=week, user_id__in=records.keys())
+                .values_list('user_id', 'status')
+            )
+            Attendance.objects.bulk_create(
+                rows,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['lecture', 'user', 'week'],
+                update_fields=['status', 'attendance_date'],
+            )
+            user_stats.apply_attendance_changes(
+                (student_id, previous.get(student_id), value) for student_id, value in records.items()
+            )
+        return Response({"week": week, "recorded": len(rows)}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
-def my_attendance_api(request, lecture_id):
-    """특정 강의의 내 출결 현황 조회"""
+def attendance_stats_api(request, lecture_id):
+    """
+    강의 출결 통계 (학생별 출석/지각/결석 수·비율, 주차별 합계, 연속 출석)
+    담당 강사와 관리자는 전체 학생, 수강생은 본인 통계만 조회합니다.
+    """
+    lecture = get_object_or_404(Lecture, pk=lecture_id)
     user = request.user
-    attendances = Attendance.objects.filter(lecture_id=lecture_id, user=user).order_by('week')
-    serializer = AttendanceSerializer(attendances, many=True)
-    return Response(serializer.data)
+
+    if lecture.instructor_id == user.id or user.is_staff:
+        return Response(attendance_stats(lecture.id))
+    if Enrollment.objects.filter(lecture=lecture, student=user).exists():
+        return Response(attendance_stats(lecture.id, user_id=user.id))
+    return Response({"error": "권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional_on(lambda pk: [LectureNotice.objects.filter(pk=pk)])
 def lecture_notice_detail_api(request, pk):
     """특정 강의 공지사항 상세 조회"""
-    notice = get_object_or_404(LectureNotice, pk=pk)
-    serializer = LectureNoticeSerializer(notice)
-    return Response(serializer.data)
+    def build():
+        notice = get_object_or_404(LectureNoticeSerializer.setup_eager_loading(LectureNotice.objects.all()), pk=pk)
+        return dict(LectureNoticeSerializer(notice).data)
+
+    data = tagged_cache.get_or_set(make_key('lecture_notice', pk), build, tags=[f'lecture_notice:{pk}'])
+    return Response(data)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional_on(lambda lecture_id: [Assignment.objects.filter(lecture_id=lecture_id)])
 def course_assignment_list_api(request, lecture_id):
     """특정 강의의 과제 목록 조회"""
-    # URL에서 넘겨받은 lecture_id로 필터링
-    tasks = Assignment.objects.filter(lecture_id=lecture_id).order_by('deadline')
-    serializer = AssignmentSerializer(tasks, many=True)
-    return Response(serializer.data)
+    def build():
+        # URL에서 넘겨받은 lecture_id로 필터링
+        tasks = Assignment.objects.filter(lecture_id=lecture_id).order_by('deadline')
+        tasks = AssignmentSerializer.setup_eager_loading(tasks)
+        return list(AssignmentSerializer(tasks, many=True).data)
+
+    data = tagged_cache.get_or_set(make_key('lecture', lecture_id, 'assignments'), build, tags=[f'lecture:{lecture_id}'])
+    return Response(data)
+
+# [삭제됨] my_activity_api는 여기 있으면 안 됩니다.
+
+
+# 강의 목록 (수강신청 카탈로그)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def course_catalog_api(request):
+    """
+    강의 목록 (필터: status, instructor_id, start_from, start_to, q - lecture/catalog.py)
+    ?cursor= 또는 ?page_size= 가 있으면 {facets, next_cursor, results} 형태로 응답하고,
+    패싯 개수(facets)는 첫 페이지에만 포함합니다. (캐시됨)
+    """
+    filters = catalog.parse_filters(request.query_params)
+    lectures = CourseCatalogSerializer.setup_eager_loading(catalog.filtered_lectures(filters))
+    lectures = catalog.with_card_fields(lectures).order_by(*catalog.catalog_pagination.ordering)
+
+    if not catalog.catalog_pagination.is_requested(request):
+        return Response(CourseCatalogSerializer(lectures, many=True).data)
+
+    page, next_cursor = catalog.catalog_pagination.paginate_queryset(lectures, request)
+    data = catalog.catalog_pagination.get_response_data(CourseCatalogSerializer(page, many=True).data, next_cursor)
+    if catalog.catalog_pagination.cursor_query_param not in request.query_params:
+        data = {'facets': catalog.facet_counts(filters), **data}
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def course_facets_api(request):
+    """강의 목록 패싯 개수만 조회 (필터 파라미터는 목록과 동일)"""
+    return Response(catalog.facet_counts(catalog.parse_filters(request.query_params)))
+
+
+MAX_RECOMMENDATIONS = 50
+
+
+# 추천 강의 (배치가 미리 계산한 추천 색인 조회 - manage.py build_recommendations)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def course_recommend_api(request):
+    """
+    수강/찜 이력과 관심분야로 고른 추천 강의 (?limit=, 기본 10, 최대 50)
+    reason: history(수강/찜한 강의와 비슷함) / interest(관심분야 일치) / popular(인기 강의)
+    """
+    limit = request.query_params.get('limit', '10')
+    if not limit.isdigit() or int(limit) < 1:
+        raise ValidationError({'limit': "1 이상의 정수여야 합니다."})
+    lectures = catalog.with_card_fields(CourseRecommendationSerializer.setup_eager_loading(Lecture.objects.all()))
+    results = recommend.recommend(request.user, min(int(limit), MAX_RECOMMENDATIONS), lectures)
+    return Response(CourseRecommendationSerializer(results, many=True).data)
+
+
+# 수강신청 / 취소 (좌석·대기·멱등성 처리는 lecture/enrollment.py)
+@api_view(['GET', 'POST', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def course_enroll_api(request, lecture_id):
+    """
+    POST: 수강신청 (201 등록 / 200 이미 수강 중 / 202 정원이 차서 대기 등록)
+    DELETE: 수강 취소 또는 대기 취소 (수강 취소로 빈 좌석은 대기 1순위에게 자동 등록)
+    GET: 내 신청 상태와 좌석 현황
+    Idempotency-Key 헤더를 보내면 같은 키로 재시도한 요청은 처음 응답을 그대로 돌려받습니다. (24시간 보관)
+    """
+    lecture = get_object_or_404(Lecture.objects.only('id', 'status', 'capacity', 'seats_taken'), pk=lecture_id)
+    if request.method == 'GET':
+        result, position = enrollment.status_of(request.user, lecture)
+        return Response({
+            'lecture_id': lecture.pk,
+            'status': result,
+            'position': position,
+            'capacity': lecture.capacity,
+            'seats_taken': lecture.seats_taken,
+        })
+
+    key = request.headers.get('Idempotency-Key')
+    if not key:
+        return enrollment_action(request, lecture)
+    if len(key) > 64:
+        return Response({"error": "Idempotency-Key는 64자 이하여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # 키 선점, 처리, 응답 저장을 한 트랜잭션으로 묶어 처리 도중 실패하면 키도 함께 취소됩니다.
+    with transaction.atomic():
+        record, previous = enrollment.claim_request(request.user, key, lecture, request.method)
+        if previous is not None:
+            if previous.lecture_id != lecture.pk or previous.method != request.method:
+                return Response({"error": "다른 요청에 사용한 Idempotency-Key입니다."},
+                                status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+            return Response(previous.response, status=previous.status_code, headers={'Idempotent-Replayed': 'true'})
+        response = enrollment_action(request, lecture)
+        record.status_code, record.response = response.status_code, response.data
+        record.save(update_fields=['status_code', 'response'])
+    return response
+
+
+def enrollment_action(request, lecture):
+    if request.method == 'POST':
+        if lecture.status != enrollment.OPEN_STATUS:
+            return Response({"error": "수강신청 기간이 아닌 강의입니다."}, status=status.HTTP_409_CONFLICT)
+        result, position = enrollment.enroll(request.user, lecture)
+        if result == enrollment.WAITLISTED:
+            return Response({'lecture_id': lecture.pk, 'status': result, 'position': position},
+                            status=status.HTTP_202_ACCEPTED)
+        code = status.HTTP_201_CREATED if result == enrollment.ENROLLED else status.HTTP_200_OK
+        return Response({'lecture_id': lecture.pk, 'status': result}, status=code)
 
-# [삭제됨] my_activity_api는 여기 있으면 안 됩니다.
\ No newline at end of file
+    result, _ = enrollment.drop(request.user, lecture)
+    if result is None:
+        return Response({"error": "신청하지 않은 강의입니다."}, status=status.HTTP_404_NOT_FOUND)
+    return Response({'lecture_id': lecture.pk, 'status': result})
@@ -1,7 +1,21 @@
 from django.contrib import admin
-from .models import SystemNotice
+from .models import SystemNotice, Notification, NotificationCounter
 
 # Register your models here.
 @admin.register(SystemNotice)
 class SystemNoticeAdmin(admin.ModelAdmin):
-    pass
\ No newline at end of file
+    pass
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ('user', 'kind', 'title', 'created_at', 'read_at')
+    list_filter = ('kind',)
+    raw_id_fields = ('user', 'lecture')
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    list_display = ('user', 'unread_count')
+    raw_id_fields = ('user',)
+
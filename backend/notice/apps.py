@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class NoticeConfig(AppConfig):
     name = 'notice'
+
+    def ready(self):
+        # 대시보드 스냅샷 / 캐시 무효화 시그널 등록
+        from . import signals  # noqa: F401
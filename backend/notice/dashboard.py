@@ -0,0 +1,194 @@
+# backend/notice/dashboard.py
+
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from lecture.models import Enrollment, Assignment
+from lecture.serializers import EnrollmentSerializer, AssignmentSerializer
+from .feed import build_notice_feed, lecture_notice_row
+from . import notifications
+from .serializers import NoticeFeedSerializer
+
+# 스냅샷은 변경 시 시그널로 고치거나 지우지만, 혹시 놓친 변경을 위해 만료 시간도 둡니다.
+SNAPSHOT_TIMEOUT = 60 * 5
+# 시스템 공지는 모든 사용자에게 보이므로 사용자별 삭제 대신 버전 값으로 한 번에 무효화
+SYSTEM_VERSION_KEY = 'dashboard:system-version'
+LATEST_NOTICE_COUNT = 5
+RECENT_NOTICE_DAYS = 7
+
+
+def snapshot_key(user_id):
+    return f'dashboard:snapshot:{user_id}'
+
+
+def bump_system_version():
+    """시스템 공지가 바뀌면 모든 사용자의 스냅샷을 무효화"""
+    cache.set(SYSTEM_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_users(user_ids):
+    cache.delete_many([snapshot_key(user_id) for user_id in user_ids])
+
+
+def invalidate_lecture(lecture_id):
+    """강의 정보가 바뀌면 수강생들의 스냅샷 무효화 (강의명 등은 여러 항목에 들어 있어 다시 계산)"""
+    student_ids = Enrollment.objects.filter(lecture_id=lecture_id).values_list('student_id', flat=True)
+    invalidate_users(list(student_ids))
+
+
+# === 스냅샷 부분 갱신 (notice/signals.py, 커밋 후) ===
+# 강의 공지/과제는 수강생 전원의 스냅샷에 들어가므로, 모두 지우면 다음 조회마다 전체를 다시 계산합니다.
+# 대신 캐시에 있는 스냅샷만 골라 바뀐 항목 하나를 끼우거나 빼서 다시 저장합니다. (항목 직렬화는 한 번)
+
+def patch_lecture_snapshots(lecture_id, patch):
+    """
+    강의 수강생의 캐시된 스냅샷에 patch(data)를 적용해 다시 저장합니다.
+    patch가 False를 돌려주면 부분 갱신할 수 없는 경우이므로 그 스냅샷은 지웁니다. (다음 조회에서 다시 계산)
+    """
+    student_ids = Enrollment.objects.filter(lecture_id=lecture_id).values_list('student_id', flat=True)
+    entries = cache.get_many([snapshot_key(student_id) for student_id in student_ids])
+    patched, stale = {}, []
+    for key, entry in entries.items():
+        if patch(entry['data']):
+            patched[key] = entry
+        else:
+            stale.append(key)
+    if patched:
+        cache.set_many(patched, SNAPSHOT_TIMEOUT)
+    if stale:
+        cache.delete_many(stale)
+
+
+def notice_sort_key(notice):
+    # 공지 피드 정렬 (-created_at, -type, -id)과 같은 순서
+    return parse_datetime(notice['created_at']), notice['type'], notice['id']
+
+
+def assignment_sort_key(task):
+    return parse_datetime(task['deadline']), task['id']
+
+
+def is_recent(created_at):
+    return created_at >= timezone.now() - timedelta(days=RECENT_NOTICE_DAYS)
+
+
+def lecture_notice_saved(lecture_id, notice_id, created):
+    row = lecture_notice_row(notice_id)
+    if row is None:
+        return
+    item = dict(NoticeFeedSerializer(row).data)
+    recent = is_recent(row['created_at'])
+
+    def patch(data):
+        listed = [notice for notice in data['notices'] if (notice['type'], notice['id']) == ('lecture', notice_id)]
+        if created:
+            # 새 공지는 최신 목록 맨 앞쪽에 들어가고 최근 공지 수가 하나 늘어납니다.
+            if not listed:
+                notices = sorted([item, *data['notices']], key=notice_sort_key, reverse=True)
+                data['notices'] = notices[:LATEST_NOTICE_COUNT]
+                if recent:
+                    data['recent_notice_count'] += 1
+        elif listed:
+            # 수정: 목록에 보이는 공지만 제목/내용을 바꿉니다. (작성 시각은 그대로라 순서 유지)
+            data['notices'] = [item if notice in listed else notice for notice in data['notices']]
+        return True
+
+    patch_lecture_snapshots(lecture_id, patch)
+
+
+def lecture_notice_deleted(lecture_id, notice_id, created_at):
+    def patch(data):
+        notices = [notice for notice in data['notices'] if (notice['type'], notice['id']) != ('lecture', notice_id)]
+        if len(notices) != len(data['notices']) and len(data['notices']) == LATEST_NOTICE_COUNT:
+            # 빈자리를 채울 다음 공지는 스냅샷에 없으므로 다시 계산
+            return False
+        data['notices'] = notices
+        if is_recent(created_at):
+            data['recent_notice_count'] -= 1
+        return True
+
+    patch_lecture_snapshots(lecture_id, patch)
+
+
+def assignment_saved(lecture_id, assignment_id):
+    assignment = AssignmentSerializer.setup_eager_loading(Assignment.objects.filter(pk=assignment_id)).first()
+    if assignment is None:
+        return
+    item = dict(AssignmentSerializer(assignment).data)
+    upcoming = assignment.deadline >= timezone.now()
+
+    def patch(data):
+        # 새 과제/마감 변경: 기존 항목을 빼고 마감 전이면 마감순 자리에 다시 넣습니다.
+        tasks = [task for task in data['upcoming_assignments'] if task['id'] != assignment_id]
+        if upcoming:
+            tasks = sorted([item, *tasks], key=assignment_sort_key)
+        data['upcoming_assignments'] = tasks
+        return True
+
+    patch_lecture_snapshots(lecture_id, patch)
+
+
+def assignment_deleted(lecture_id, assignment_id):
+    def patch(data):
+        data['upcoming_assignments'] = [task for task in data['upcoming_assignments'] if task['id'] != assignment_id]
+        return True
+
+    patch_lecture_snapshots(lecture_id, patch)
+
+
+def build_snapshot(user):
+    """대시보드 화면 전체를 한 번에 계산 (캐시 미스일 때만 실행)"""
+    enrollments = EnrollmentSerializer.setup_eager_loading(Enrollment.objects.filter(student=user))
+    courses = EnrollmentSerializer(enrollments, many=True).data
+    lecture_ids = [course['lecture']['id'] for course in courses]
+
+    tasks = Assignment.objects.filter(lecture_id__in=lecture_ids, deadline__gte=timezone.now()).order_by('deadline')
+    tasks = AssignmentSerializer.setup_eager_loading(tasks)
+
+    notices = build_notice_feed(user, limit=LATEST_NOTICE_COUNT)
+    recent = build_notice_feed(user, since=timezone.now() - timedelta(days=RECENT_NOTICE_DAYS))
+
+    return {
+        'courses': list(courses),
+        'notices': list(NoticeFeedSerializer(notices, many=True).data),
+        'upcoming_assignments': list(AssignmentSerializer(tasks, many=True).data),
+        'recent_notice_count': recent.count(),
+    }
+
+
+def get_dashboard(user):
+    """
+    캐시된 스냅샷 반환 (스냅샷과 시스템 공지 버전을 한 번의 get_many로 조회)
+    없거나 시스템 공지 버전이 다르면 다시 계산해 저장합니다.
+    안 읽은 알림 수는 읽음 처리마다 바뀌므로 스냅샷에 넣지 않고 읽을 때 카운터 행 하나로 조회합니다.
+    """
+    key = snapshot_key(user.pk)
+    cached = cache.get_many([key, SYSTEM_VERSION_KEY])
+    version = cached.get(SYSTEM_VERSION_KEY)
+    if version is None:
+        # 버전 키가 지워졌다면 이전 스냅샷을 믿을 수 없으므로 새 버전 발급
+        cache.add(SYSTEM_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(SYSTEM_VERSION_KEY)
+
+    entry = cached.get(key)
+    if entry is None or entry['system_version'] != version:
+        entry = {'system_version': version, 'data': build_snapshot(user)}
+        cache.set(key, entry, SNAPSHOT_TIMEOUT)
+
+    snapshot = dict(entry['data'])
+    # 캐시된 사이에 마감이 지난 과제는 읽을 때 걸러냅니다.
+    now = timezone.now()
+    snapshot['upcoming_assignments'] = [
+        task for task in snapshot['upcoming_assignments'] if parse_datetime(task['deadline']) >= now
+    ]
+    snapshot['counts'] = {
+        'courses': len(snapshot['courses']),
+        'upcoming_assignments': len(snapshot['upcoming_assignments']),
+        'recent_notices': snapshot.pop('recent_notice_count'),
+        'unread_notifications': notifications.unread_count(user),
+    }
+    return snapshot
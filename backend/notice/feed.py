@@ -0,0 +1,69 @@
+# backend/notice/feed.py
+
+from django.db import connection
+from django.db.models import BigIntegerField, CharField, F, Value
+
+from doro.pagination import CursorPagination
+from lecture.models import Enrollment, LectureNotice
+from .models import SystemNotice
+
+# 두 공지 테이블을 같은 모양으로 맞춘 컬럼 (UNION 컬럼 순서와 동일)
+FEED_COLUMNS = ('id', 'title', 'content', 'created_at', 'author_name', 'lecture_id', 'lecture_name', 'type')
+
+# created_at이 같을 때는 type, id 순으로 끊어 커서가 항상 한 행을 가리키도록 합니다.
+feed_pagination = CursorPagination(ordering=('-created_at', '-type', '-id'))
+
+
+def system_notice_rows():
+    return SystemNotice.objects.annotate(
+        author_name=F('author__username'),
+        lecture_id=Value(None, output_field=BigIntegerField()),
+        lecture_name=Value(None, output_field=CharField()),
+        type=Value('system', output_field=CharField()),
+    )
+
+
+def annotate_lecture_notices(queryset):
+    return queryset.annotate(
+        content=F('body'),
+        author_name=F('lecture__instructor__username'),
+        lecture_name=F('lecture__name'),
+        type=Value('lecture', output_field=CharField()),
+    )
+
+
+def lecture_notice_rows(user):
+    # 수강 중인 강의 ID는 서브쿼리로 넘겨 한 번의 쿼리 안에서 처리
+    enrolled_lecture_ids = Enrollment.objects.filter(student=user).values('lecture_id')
+    return annotate_lecture_notices(LectureNotice.objects.filter(lecture_id__in=enrolled_lecture_ids))
+
+
+def lecture_notice_row(notice_id):
+    """강의 공지 한 건을 피드 행 모양(FEED_COLUMNS dict)으로 (대시보드 스냅샷 부분 갱신용)"""
+    return annotate_lecture_notices(LectureNotice.objects.filter(pk=notice_id)).values(*FEED_COLUMNS).first()
+
+
+def build_notice_feed(user, since=None, after=None, limit=None):
+    """
+    시스템 공지 + 내 강의 공지를 UNION ALL 한 단일 정렬 쿼리
+    - since: 이 시각 이후에 작성된 공지만
+    - after: 커서 값 (feed_pagination.decode_cursor 결과)
+    - limit: 최대 행 수
+    """
+    branches = []
+    for rows in (system_notice_rows(), lecture_notice_rows(user)):
+        if since is not None:
+            rows = rows.filter(created_at__gt=since)
+        if after is not None:
+            rows = rows.filter(feed_pagination.keyset_filter(after))
+        rows = rows.values(*FEED_COLUMNS)
+        if limit is not None and connection.features.supports_slicing_ordering_in_compound:
+            # PostgreSQL 등에서는 각 테이블에서도 상위 limit개만 읽고 합칩니다.
+            rows = rows.order_by(*feed_pagination.ordering)[:limit]
+        branches.append(rows)
+
+    system, lecture = branches
+    feed = system.union(lecture, all=True).order_by(*feed_pagination.ordering)
+    if limit is not None:
+        feed = feed[:limit]
+    return feed
@@ -0,0 +1,16 @@
+# backend/notice/management/commands/reconcile_notifications.py
+
+from django.core.management.base import BaseCommand
+
+from notice import notifications
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자별 안 읽은 알림 수(NotificationCounter)를 알림 테이블 집계로 다시 맞춥니다. "
+        "(관리자 화면 등 알림 API를 거치지 않은 변경 후 실행)"
+    )
+
+    def handle(self, *args, **options):
+        changed = notifications.recount()
+        self.stdout.write(self.style.SUCCESS(f"안 읽은 알림 수 {changed}명 보정"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='systemnotice',
+            index=models.Index(fields=['created_at', 'id'], name='systemnotice_created_idx'),
+        ),
+    ]
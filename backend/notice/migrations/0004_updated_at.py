@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notice', '0003_notice_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemnotice',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from lecture.models import Lecture
 from user.models import User
 
 # Create your models here.
@@ -12,3 +13,52 @@ class SystemNotice(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True) # 조건부 GET(ETag) 계산용
+
+    class Meta:
+        indexes = [
+            # 대시보드 통합 공지 피드: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['created_at', 'id'], name='systemnotice_created_idx'),
+        ]
+
+
+# 사용자별 알림함 (새 강의 공지/과제를 수강생마다 한 행씩, notice/notifications.py)
+class Notification(models.Model):
+    KIND_CHOICES = (
+        ('lecture_notice', '강의 공지'),
+        ('assignment', '과제'),
+    )
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    source_id = models.IntegerField()  # LectureNotice / Assignment ID
+    lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name='+')
+    title = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # 같은 공지/과제 알림은 한 사용자에게 한 번만 (원본 삭제 시 WHERE kind = ? AND source_id = ? 에도 사용)
+            models.UniqueConstraint(fields=['kind', 'source_id', 'user'], name='notification_source_user_uniq'),
+        ]
+        indexes = [
+            # 알림함: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=['user', 'created_at', 'id'], name='notification_user_idx'),
+            # 안 읽은 알림만: 위와 같은 순서, 안 읽은 행만 담는 부분 인덱스
+            models.Index(fields=['user', 'created_at', 'id'], condition=models.Q(read_at__isnull=True),
+                         name='notification_unread_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}: {self.title}"
+
+
+# 사용자별 안 읽은 알림 수 (알림 생성/읽음/삭제 시 F()로 증감, manage.py reconcile_notifications로 보정)
+class NotificationCounter(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='notification_counter')
+    unread_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user.username} 안 읽은 알림 {self.unread_count}"
+
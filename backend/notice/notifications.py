@@ -0,0 +1,134 @@
+# backend/notice/notifications.py
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from doro.pagination import CursorPagination
+from lecture.models import Enrollment, LectureNotice, Assignment
+from .models import Notification, NotificationCounter
+
+# 알림함 커서 페이지네이션 (notification_user_idx / notification_unread_idx)
+notification_pagination = CursorPagination(ordering=('-created_at', '-id'))
+
+# 알림 종류 -> 원본 모델
+SOURCES = {
+    'lecture_notice': LectureNotice,
+    'assignment': Assignment,
+}
+# 한 번에 만드는 알림 수 (수강생 2,000명 강의 = INSERT 4번)
+FANOUT_CHUNK = 500
+
+
+def bump(user_ids, delta):
+    """user_ids의 안 읽은 알림 수에 delta를 더합니다. (카운터 행이 없으면 먼저 만듦)"""
+    if delta > 0:
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in user_ids], ignore_conflicts=True,
+        )
+    NotificationCounter.objects.filter(user_id__in=user_ids).update(unread_count=F('unread_count') + delta)
+
+
+def title_of(kind, source):
+    return f"[새 과제] {source.title}" if kind == 'assignment' else source.title
+
+
+def fan_out(kind, source_id):
+    """
+    강의 공지/과제 알림을 수강생 전원에게 만듭니다. (notice/tasks.py 작업 하나에서 실행)
+    수강생을 student_id 순으로 FANOUT_CHUNK명씩 읽어, 묶음마다 bulk_create 한 번 + 카운터 UPDATE 한 번.
+    이미 알림이 있는 수강생은 건너뛰므로 작업이 중간에 실패해 재시도해도 알림과 카운터가 두 번 늘지 않습니다.
+    반환값: 만든 알림 수
+    """
+    source = SOURCES[kind].objects.filter(pk=source_id).first()
+    if source is None:
+        return 0
+
+    title = title_of(kind, source)
+    created = 0
+    after_id = 0
+    while True:
+        # Enrollment (lecture, student) unique 인덱스 범위 스캔
+        student_ids = list(
+            Enrollment.objects.filter(lecture_id=source.lecture_id, student_id__gt=after_id)
+            .order_by('student_id').values_list('student_id', flat=True)[:FANOUT_CHUNK]
+        )
+        if not student_ids:
+            return created
+        with transaction.atomic():
+            notified = set(
+                Notification.objects.filter(kind=kind, source_id=source_id, user_id__in=student_ids)
+                .values_list('user_id', flat=True)
+            )
+            new_ids = [user_id for user_id in student_ids if user_id not in notified]
+            if new_ids:
+                Notification.objects.bulk_create([
+                    Notification(user_id=user_id, kind=kind, source_id=source_id, lecture_id=source.lecture_id, title=title)
+                    for user_id in new_ids
+                ])
+                bump(new_ids, 1)
+        created += len(new_ids)
+        after_id = student_ids[-1]
+
+
+@transaction.atomic
+def remove(kind, source_id):
+    """원본(공지/과제)이 삭제되면 알림도 지우고, 안 읽은 알림 수를 줄입니다."""
+    notifications = Notification.objects.filter(kind=kind, source_id=source_id)
+    unread = list(notifications.filter(read_at__isnull=True).values_list('user_id', flat=True))
+    notifications.delete()
+    if unread:
+        bump(unread, -1)
+
+
+# === 조회 / 읽음 처리 ===
+
+def inbox(user, unread_only=False):
+    notifications = Notification.objects.filter(user=user).select_related('lecture').only(
+        'id', 'kind', 'source_id', 'title', 'created_at', 'read_at', 'lecture__id', 'lecture__name',
+    )
+    if unread_only:
+        notifications = notifications.filter(read_at__isnull=True)
+    return notifications
+
+
+def unread_count(user):
+    return NotificationCounter.objects.filter(user=user).values_list('unread_count', flat=True).first() or 0
+
+
+@transaction.atomic
+def mark_read(user, ids=None):
+    """
+    알림을 읽음으로 표시합니다. (ids가 None이면 안 읽은 알림 전체)
+    UPDATE 한 번으로 바꾸고, 실제로 바뀐 수만큼 카운터를 줄입니다. 반환값: 읽음 처리한 수
+    """
+    unread = Notification.objects.filter(user=user, read_at__isnull=True)
+    if ids is not None:
+        unread = unread.filter(pk__in=ids)
+    updated = unread.update(read_at=timezone.now())
+    if updated:
+        NotificationCounter.objects.filter(user=user).update(unread_count=F('unread_count') - updated)
+    return updated
+
+
+# === 보정 (manage.py reconcile_notifications) ===
+
+def recount():
+    """
+    안 읽은 알림 수를 알림 테이블 집계로 다시 맞춥니다. 반환값: 값이 바뀐 사용자 수
+    """
+    actual = dict(
+        Notification.objects.filter(read_at__isnull=True).order_by().values_list('user_id').annotate(n=Count('id'))
+    )
+    current = dict(NotificationCounter.objects.values_list('user_id', 'unread_count'))
+    drifted = {
+        user_id: actual.get(user_id, 0)
+        for user_id in set(actual) | set(current)
+        if actual.get(user_id, 0) != current.get(user_id)
+    }
+    with transaction.atomic():
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, unread_count=count) for user_id, count in drifted.items()],
+            batch_size=500, update_conflicts=True, unique_fields=['user'], update_fields=['unread_count'],
+        )
+    return len(drifted)
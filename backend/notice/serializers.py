@@ -1,9 +1,60 @@
 from rest_framework import serializers
-from .models import SystemNotice
+from doro.metrics import SerializerTimingMixin
+from doro.prefetch import EagerLoadingMixin
+from .models import SystemNotice, Notification
 
-class SystemNoticeSerializer(serializers.ModelSerializer):
+class SystemNoticeSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     author_name = serializers.ReadOnlyField(source='author.username') # 작성자 이름 표시
 
+    select_related_fields = ('author',)
+    only_fields = ('id', 'title', 'content', 'created_at', 'author__username')
+
     class Meta:
         model = SystemNotice
-        fields = ['id', 'title', 'content', 'created_at', 'author_name']
\ No newline at end of file
+        fields = ['id', 'title', 'content', 'created_at', 'author_name']
+
+# 대시보드 통합 공지 피드용 (notice/feed.py의 UNION 결과 dict를 그대로 받음)
+class NoticeFeedSerializer(SerializerTimingMixin, serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    content = serializers.CharField()
+    created_at = serializers.DateTimeField()
+    author_name = serializers.CharField(allow_null=True)
+    lecture_name = serializers.CharField(allow_null=True)
+    lecture = serializers.IntegerField(source='lecture_id', allow_null=True)
+    type = serializers.CharField()
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if data['type'] == 'system':
+            # 시스템 공지는 강의 정보 없이 '전체 공지'로 표시
+            data.pop('lecture_name')
+            data.pop('lecture')
+            data['category'] = '전체 공지'
+        else:
+            data['category'] = data['lecture_name'] or '강의 공지'
+        return data
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    lecture_name = serializers.ReadOnlyField(source='lecture.name')
+    is_read = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Notification
+        fields = ['id', 'kind', 'source_id', 'lecture', 'lecture_name', 'title', 'created_at', 'read_at', 'is_read']
+
+    def get_is_read(self, obj):
+        return obj.read_at is not None
+
+
+class NotificationReadSerializer(serializers.Serializer):
+    """알림 읽음 처리 (ids 또는 all 중 하나)"""
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=500)
+    all = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if not attrs['all'] and not attrs.get('ids'):
+            raise serializers.ValidationError("ids 또는 all: true 가 필요합니다.")
+        return attrs
+
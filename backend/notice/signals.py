@@ -0,0 +1,106 @@
+# backend/notice/signals.py
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from doro import realtime
+from doro.cache import tagged_cache
+from lecture.models import Lecture, Enrollment, LectureNotice, Assignment
+from .models import SystemNotice
+from . import dashboard
+from .tasks import send_notice_emails, fan_out_notification, notice_emails_enabled
+from . import notifications
+
+
+# === 대시보드 스냅샷 / 캐시 무효화 ===
+# 커밋 전에 지우면 그 사이 다른 요청이 커밋 전 데이터로 스냅샷을 다시 만들 수 있으므로 커밋 후에 지웁니다.
+# (삭제 후에는 instance.pk가 None이 되므로 ID는 미리 꺼내 둠)
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def enrollment_changed(sender, instance, **kwargs):
+    student_id = instance.student_id
+    transaction.on_commit(lambda: dashboard.invalidate_users([student_id]))
+
+
+# 강의 공지/과제는 수강생 스냅샷을 지우지 않고 해당 항목만 고칩니다. (notice/dashboard.py 부분 갱신)
+@receiver(post_save, sender=LectureNotice)
+def dashboard_notice_saved(sender, instance, created, **kwargs):
+    lecture_id, notice_id = instance.lecture_id, instance.pk
+    transaction.on_commit(lambda: dashboard.lecture_notice_saved(lecture_id, notice_id, created))
+
+
+@receiver(post_delete, sender=LectureNotice)
+def dashboard_notice_deleted(sender, instance, **kwargs):
+    lecture_id, notice_id, created_at = instance.lecture_id, instance.pk, instance.created_at
+    transaction.on_commit(lambda: dashboard.lecture_notice_deleted(lecture_id, notice_id, created_at))
+
+
+@receiver(post_save, sender=Assignment)
+def dashboard_assignment_saved(sender, instance, **kwargs):
+    lecture_id, assignment_id = instance.lecture_id, instance.pk
+    transaction.on_commit(lambda: dashboard.assignment_saved(lecture_id, assignment_id))
+
+
+@receiver(post_delete, sender=Assignment)
+def dashboard_assignment_deleted(sender, instance, **kwargs):
+    lecture_id, assignment_id = instance.lecture_id, instance.pk
+    transaction.on_commit(lambda: dashboard.assignment_deleted(lecture_id, assignment_id))
+
+
+@receiver(post_save, sender=Lecture)
+def lecture_changed(sender, instance, created, **kwargs):
+    # 새 강의는 아직 수강생이 없으므로 무효화할 스냅샷도 없습니다.
+    if not created:
+        lecture_id = instance.pk
+        transaction.on_commit(lambda: dashboard.invalidate_lecture(lecture_id))
+
+
+@receiver([post_save, post_delete], sender=SystemNotice)
+def system_notice_changed(sender, instance, **kwargs):
+    transaction.on_commit(dashboard.bump_system_version)
+    tagged_cache.invalidate_on_commit(f'system_notice:{instance.pk}')
+
+
+# === 새 공지 알림 메일 (백그라운드 작업, notice/tasks.py) ===
+
+@receiver(post_save, sender=LectureNotice)
+@receiver(post_save, sender=SystemNotice)
+def notice_created(sender, instance, created, raw=False, **kwargs):
+    source = 'lecture_notice' if sender is LectureNotice else 'system_notice'
+    if created and not raw and notice_emails_enabled(source):
+        send_notice_emails.enqueue(source, instance.pk)
+
+
+# === 수강생 알림함 (notice/notifications.py) ===
+# 수강생 수만큼 행을 만드는 일은 요청 밖(백그라운드 작업 하나)에서 합니다.
+
+@receiver(post_save, sender=LectureNotice)
+@receiver(post_save, sender=Assignment)
+def notification_source_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        kind = 'lecture_notice' if sender is LectureNotice else 'assignment'
+        fan_out_notification.enqueue(kind, instance.pk)
+
+
+# 강의를 삭제하면 Notification.lecture CASCADE가 post_delete보다 먼저 알림 행을 지우므로(fast delete)
+# 안 읽은 알림 수를 줄일 수 없습니다. pre_delete는 어떤 행도 지우기 전에 보내지므로 여기서 처리합니다.
+@receiver(pre_delete, sender=LectureNotice)
+@receiver(pre_delete, sender=Assignment)
+def notification_source_deleted(sender, instance, **kwargs):
+    notifications.remove('lecture_notice' if sender is LectureNotice else 'assignment', instance.pk)
+
+
+# === 실시간 이벤트 (doro/realtime.py, /api/stream/) ===
+# 강의 공지는 그 강의 채널, 시스템 공지는 전체 채널로 보냅니다. (커밋된 뒤 발행)
+
+@receiver(post_save, sender=LectureNotice)
+@receiver(post_save, sender=SystemNotice)
+def notice_published(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    data = {'id': instance.pk, 'title': instance.title, 'created_at': instance.created_at}
+    if sender is LectureNotice:
+        realtime.publish([f'lecture:{instance.lecture_id}'], 'lecture_notice', {**data, 'lecture_id': instance.lecture_id})
+    else:
+        realtime.publish(['system'], 'system_notice', data)
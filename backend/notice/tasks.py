@@ -0,0 +1,69 @@
+# backend/notice/tasks.py
+
+from django.conf import settings
+from django.core.mail import send_mass_mail
+
+from lecture.models import Enrollment, LectureNotice
+from taskqueue.queue import task
+from user.models import User
+from .models import SystemNotice
+from . import notifications
+
+# 작업 하나가 보내는 메일 수 (다음 묶음은 새 작업으로 이어서 보냄)
+EMAIL_BATCH = 200
+
+# 공지 종류 -> (모델, 메일 본문으로 쓸 필드)
+NOTICE_SOURCES = {
+    'lecture_notice': (LectureNotice, 'body'),
+    'system_notice': (SystemNotice, 'content'),
+}
+
+# settings.NOTICE_EMAILS 기본값 (시스템 공지 메일은 전체 회원에게 가므로 켠 경우에만)
+EMAIL_DEFAULTS = {
+    'LECTURE_NOTICE': True,
+    'SYSTEM_NOTICE': False,
+}
+
+
+def notice_emails_enabled(source):
+    return {**EMAIL_DEFAULTS, **getattr(settings, 'NOTICE_EMAILS', {})}[source.upper()]
+
+
+def notice_recipients(source, notice, after_id):
+    """공지 알림 수신자 (ID, 이메일) - ID 순으로 after_id 다음부터 EMAIL_BATCH명"""
+    if source == 'lecture_notice':
+        # 강의 수강생 (Enrollment (lecture, student) unique 인덱스 범위 스캔)
+        rows = Enrollment.objects.filter(lecture_id=notice.lecture_id, student_id__gt=after_id).exclude(student__email='')
+        rows = rows.order_by('student_id').values_list('student_id', 'student__email')
+    else:
+        rows = User.objects.filter(pk__gt=after_id, is_active=True).exclude(email='')
+        rows = rows.order_by('pk').values_list('pk', 'email')
+    return list(rows[:EMAIL_BATCH])
+
+
+@task()
+def send_notice_emails(source, notice_id, after_id=0):
+    """
+    새 공지 알림 메일 (source: 'lecture_notice' 강의 수강생 / 'system_notice' 전체 회원)
+    수신자가 많으면 EMAIL_BATCH명씩 나눠, 보낸 다음 묶음을 새 작업으로 넣습니다.
+    묶음 하나는 send_mass_mail 한 번(SMTP 연결 하나)으로 보내므로, 중간에 실패하면 작업 재시도가
+    그 묶음 전체를 다시 보내 앞쪽 수신자는 같은 메일을 두 번 받을 수 있습니다.
+    (앞선 묶음은 별도 작업으로 이미 끝났으므로 다시 보내지 않음)
+    """
+    model, body_field = NOTICE_SOURCES[source]
+    notice = model.objects.filter(pk=notice_id).first()
+    if notice is None:
+        return
+
+    rows = notice_recipients(source, notice, after_id)
+    subject = f"[DORO] {notice.title}"
+    body = getattr(notice, body_field)
+    send_mass_mail([(subject, body, None, [email]) for _, email in rows], fail_silently=False)
+    if len(rows) == EMAIL_BATCH:
+        send_notice_emails.enqueue(source, notice_id, after_id=rows[-1][0])
+
+
+@task()
+def fan_out_notification(kind, source_id):
+    """새 강의 공지/과제 알림을 수강생 알림함에 넣습니다. (notice/notifications.py fan_out)"""
+    notifications.fan_out(kind, source_id)
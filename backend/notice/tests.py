@@ -1,3 +1,148 @@
-from django.test import TestCase
+from django.core import mail
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from datetime import timedelta
 
-# Create your tests here.
+from django.utils import timezone
+
+from lecture.models import Lecture, Enrollment, LectureNotice, Assignment
+from taskqueue.models import Task
+from user.models import User
+from . import dashboard, notifications
+from .models import Notification, SystemNotice
+from .tasks import send_notice_emails
+
+
+class NotificationCounterTests(TestCase):
+    """안 읽은 알림 수(NotificationCounter)가 알림 행과 어긋나지 않는지"""
+
+    def setUp(self):
+        self.student = User.objects.create(username='student', role=1)
+        instructor = User.objects.create(username='instructor', role=2)
+        self.lecture = Lecture.objects.create(name='lecture', instructor=instructor)
+        Enrollment.objects.create(lecture=self.lecture, student=self.student)
+        notice = LectureNotice.objects.create(lecture=self.lecture, title='notice', body='body')
+        notifications.fan_out('lecture_notice', notice.pk)
+        self.notice = notice
+
+    def test_fan_out_counts_unread(self):
+        self.assertEqual(notifications.unread_count(self.student), 1)
+
+    def test_dashboard_counts_unread(self):
+        self.assertEqual(dashboard.get_dashboard(self.student)['counts']['unread_notifications'], 1)
+        notifications.mark_read(self.student)
+        # 스냅샷이 캐시돼 있어도 읽음 처리가 바로 반영됩니다.
+        self.assertEqual(dashboard.get_dashboard(self.student)['counts']['unread_notifications'], 0)
+
+    def test_deleting_source_decrements_unread(self):
+        self.notice.delete()
+        self.assertEqual(notifications.unread_count(self.student), 0)
+
+    def test_deleting_lecture_decrements_unread(self):
+        # Notification.lecture CASCADE가 공지보다 먼저 알림 행을 지워도 카운터가 함께 줄어야 합니다.
+        assignment = Assignment.objects.create(
+            lecture=self.lecture, title='assignment', content='content', deadline=timezone.now(),
+        )
+        notifications.fan_out('assignment', assignment.pk)
+        self.assertEqual(notifications.unread_count(self.student), 2)
+
+        self.lecture.delete()
+
+        self.assertFalse(Notification.objects.filter(user=self.student).exists())
+        self.assertEqual(notifications.unread_count(self.student), 0)
+        self.assertEqual(notifications.recount(), 0)
+
+
+class NoticeEmailTests(TestCase):
+    """새 공지 알림 메일: 시스템 공지(전체 회원)는 설정으로 켠 경우에만 보냅니다."""
+
+    def setUp(self):
+        self.instructor = User.objects.create(username='instructor', role=2, email='instructor@example.com')
+        self.student = User.objects.create(username='student', role=1, email='student@example.com')
+        self.lecture = Lecture.objects.create(name='lecture', instructor=self.instructor)
+        Enrollment.objects.create(lecture=self.lecture, student=self.student)
+
+    def queued(self):
+        return list(Task.objects.filter(name='notice.send_notice_emails').values_list('payload', flat=True))
+
+    def test_system_notice_emails_are_off_by_default(self):
+        SystemNotice.objects.create(author=self.instructor, title='system', content='content')
+        self.assertEqual(self.queued(), [])
+
+    @override_settings(NOTICE_EMAILS={'SYSTEM_NOTICE': True})
+    def test_system_notice_emails_when_enabled(self):
+        notice = SystemNotice.objects.create(author=self.instructor, title='system', content='content')
+        self.assertEqual(self.queued(), [{'args': ['system_notice', notice.pk], 'kwargs': {}}])
+
+        send_notice_emails('system_notice', notice.pk)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         ['instructor@example.com', 'student@example.com'])
+        self.assertEqual(mail.outbox[0].body, 'content')
+
+    def test_lecture_notice_emails_enrolled_students(self):
+        notice = LectureNotice.objects.create(lecture=self.lecture, title='notice', body='body')
+        self.assertEqual(len(self.queued()), 1)
+
+        send_notice_emails('lecture_notice', notice.pk)
+        self.assertEqual([message.to for message in mail.outbox], [['student@example.com']])
+        self.assertEqual(mail.outbox[0].subject, '[DORO] notice')
+        self.assertEqual(mail.outbox[0].body, 'body')
+
+
+class DashboardInvalidationTests(TestCase):
+    """대시보드 스냅샷은 변경이 커밋된 뒤에 무효화됩니다. (커밋 전 데이터로 다시 캐시되지 않도록)"""
+
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create(username='student', role=1)
+        instructor = User.objects.create(username='instructor', role=2)
+        self.lecture = Lecture.objects.create(name='lecture', instructor=instructor)
+        Enrollment.objects.create(lecture=self.lecture, student=self.student)
+
+    def notice_titles(self):
+        return [notice['title'] for notice in dashboard.get_dashboard(self.student)['notices']]
+
+    def assertSnapshotFresh(self):
+        """부분 갱신한 스냅샷이 처음부터 다시 계산한 결과와 같아야 합니다."""
+        cached = dashboard.get_dashboard(self.student)
+        rebuilt = dashboard.build_snapshot(self.student)
+        self.assertEqual(cached['notices'], rebuilt['notices'])
+        self.assertEqual(cached['upcoming_assignments'], rebuilt['upcoming_assignments'])
+        self.assertEqual(cached['counts']['recent_notices'], rebuilt['recent_notice_count'])
+
+    def test_lecture_changes_patch_cached_snapshot(self):
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            notices = [LectureNotice.objects.create(lecture=self.lecture, title=f'n{i}', body='b') for i in range(6)]
+            early = Assignment.objects.create(lecture=self.lecture, title='a1', content='c', deadline=now + timedelta(days=1))
+        dashboard.get_dashboard(self.student)  # 스냅샷 캐시
+
+        steps = [
+            lambda: LectureNotice.objects.create(lecture=self.lecture, title='new', body='b'),
+            lambda: setattr(notices[-1], 'title', 'edited') or notices[-1].save(),
+            lambda: notices[0].delete(),       # 목록(최신 5개) 밖의 공지
+            lambda: notices[-1].delete(),      # 목록 안 공지 -> 빈자리를 채울 수 없어 다시 계산
+            lambda: Assignment.objects.create(lecture=self.lecture, title='a0', content='c', deadline=now + timedelta(hours=1)),
+            lambda: Assignment.objects.create(lecture=self.lecture, title='past', content='c', deadline=now - timedelta(days=1)),
+            lambda: early.delete(),
+        ]
+        for step in steps:
+            with self.captureOnCommitCallbacks(execute=True):
+                step()
+            self.assertSnapshotFresh()
+
+    def test_new_notice_is_patched_without_rebuild(self):
+        dashboard.get_dashboard(self.student)
+        with self.captureOnCommitCallbacks(execute=True):
+            LectureNotice.objects.create(lecture=self.lecture, title='notice', body='body')
+        with self.assertNumQueries(0):
+            entry = cache.get(dashboard.snapshot_key(self.student.pk))
+        self.assertEqual([notice['title'] for notice in entry['data']['notices']], ['notice'])
+        self.assertEqual(entry['data']['recent_notice_count'], 1)
+
+    def test_snapshot_is_invalidated_after_commit(self):
+        self.assertEqual(self.notice_titles(), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            LectureNotice.objects.create(lecture=self.lecture, title='notice', body='body')
+            self.assertEqual(self.notice_titles(), [])
+        self.assertEqual(self.notice_titles(), ['notice'])
@@ -3,48 +3,107 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
+from doro.cache import tagged_cache, make_key
+from doro.conditional import conditional_on
+from lecture.models import LectureNotice
 from .models import SystemNotice
-from .serializers import SystemNoticeSerializer
-from lecture.models import LectureNotice, Enrollment
-from lecture.serializers import LectureNoticeSerializer
+from .serializers import SystemNoticeSerializer, NoticeFeedSerializer, NotificationSerializer, NotificationReadSerializer
+from .feed import build_notice_feed, feed_pagination
+from .dashboard import get_dashboard
+from . import notifications
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def dashboard_api(request):
+    """
+    대시보드 통합 조회 (내 강의 + 최신 공지 + 다가오는 과제 + 개수)
+    사용자별 스냅샷을 캐시에서 읽고, 관련 데이터가 바뀌면 시그널로 고치거나(강의 공지/과제) 무효화됩니다.
+    """
+    return Response(get_dashboard(request.user))
+
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def dashboard_notice_list_api(request):
     """
     대시보드용 통합 공지 (시스템 공지 + 내 강의 공지)
+    두 테이블을 DB에서 UNION ALL 후 정렬하므로 파이썬 정렬 없이 한 번의 쿼리로 끝납니다.
+    - ?since=<ISO 시각> : 이후 작성된 공지만
+    - ?page_size=, ?cursor= : 커서 페이지 단위 응답 (없으면 기존처럼 전체 목록)
     """
-    user = request.user
-
-    # 1. 전체 시스템 공지 가져오기
-    sys_notices = SystemNotice.objects.all()
-    sys_data = SystemNoticeSerializer(sys_notices, many=True).data
-    # 구분 태그 추가
-    for item in sys_data:
-        item['category'] = '전체 공지'
-        item['type'] = 'system'
-
-    # 2. 내가 수강 중인 강의의 공지 가져오기
-    enrolled_lecture_ids = Enrollment.objects.filter(student=user).values_list('lecture_id', flat=True)
-    lec_notices = LectureNotice.objects.filter(lecture_id__in=enrolled_lecture_ids)
-    lec_data = LectureNoticeSerializer(lec_notices, many=True).data
-    # 구분 태그 추가
-    for item in lec_data:
-        item['category'] = item.get('lecture_name', '강의 공지') # 강의 이름 표시
-        item['type'] = 'lecture'
-
-    # 3. 두 리스트 합치고 날짜(created_at) 기준 내림차순 정렬
-    all_notices = sys_data + lec_data
-    all_notices.sort(key=lambda x: x['created_at'], reverse=True)
-
-    return Response(all_notices)
+    since = None
+    since_param = request.query_params.get('since')
+    if since_param:
+        try:
+            since = parse_datetime(since_param)
+        except ValueError:
+            since = None
+        if since is None:
+            raise ValidationError({'since': "ISO 8601 형식의 시각이어야 합니다."})
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+    if feed_pagination.is_requested(request):
+        size = feed_pagination.get_page_size(request)
+        cursor = request.query_params.get(feed_pagination.cursor_query_param)
+        # 두 공지 테이블의 created_at/id 타입이 같으므로 강의 공지 모델 기준으로 확인 (type은 annotate 값)
+        after = feed_pagination.decode_cursor(cursor, LectureNotice) if cursor else None
+        rows = list(build_notice_feed(request.user, since=since, after=after, limit=size + 1))
+        page, next_cursor = feed_pagination.split_page(rows, size)
+        data = NoticeFeedSerializer(page, many=True).data
+        return Response(feed_pagination.get_response_data(data, next_cursor))
+
+    rows = build_notice_feed(request.user, since=since)
+    return Response(NoticeFeedSerializer(rows, many=True).data)
 
 @api_view(['GET'])
+@conditional_on(lambda pk: [SystemNotice.objects.filter(pk=pk)])
 def notice_detail_api(request, pk):
     # (기존 상세 조회 로직 유지 - 필요하면 시스템/강의 공지 구분해서 가져오는 로직 추가 필요)
     # 일단 간단하게 시스템 공지 상세만 구현
-    notice = get_object_or_404(SystemNotice, pk=pk)
-    serializer = SystemNoticeSerializer(notice)
-    return Response(serializer.data)
\ No newline at end of file
+    def build():
+        notice = get_object_or_404(SystemNoticeSerializer.setup_eager_loading(SystemNotice.objects.all()), pk=pk)
+        return dict(SystemNoticeSerializer(notice).data)
+
+    data = tagged_cache.get_or_set(make_key('system_notice', pk), build, tags=[f'system_notice:{pk}'])
+    return Response(data)
+
+
+# === 알림함 (notice/notifications.py) ===
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def notification_list_api(request):
+    """
+    내 알림 (최신순 커서 페이지네이션 - 항상 {unread_count, next_cursor, results})
+    - ?unread=1 : 안 읽은 알림만
+    """
+    unread_only = request.query_params.get('unread') in ('1', 'true')
+    queryset = notifications.inbox(request.user, unread_only=unread_only)
+    page, next_cursor = notifications.notification_pagination.paginate_queryset(queryset, request)
+    data = notifications.notification_pagination.get_response_data(NotificationSerializer(page, many=True).data, next_cursor)
+    return Response({'unread_count': notifications.unread_count(request.user), **data})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def notification_unread_count_api(request):
+    """안 읽은 알림 수 (헤더 배지 폴링용, 카운터 행 한 건 조회)"""
+    return Response({'unread_count': notifications.unread_count(request.user)})
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def notification_read_api(request):
+    """알림 읽음 처리 ({"ids": [1, 2, 3]} 또는 {"all": true}) - UPDATE 한 번"""
+    serializer = NotificationReadSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    ids = None if serializer.validated_data['all'] else serializer.validated_data['ids']
+    updated = notifications.mark_read(request.user, ids)
+    return Response({'updated': updated, 'unread_count': notifications.unread_count(request.user)})
+
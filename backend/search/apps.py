@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    name = 'search'
+
+    def ready(self):
+        # 게시글/댓글/공지 저장·삭제 시 검색 색인 갱신 시그널 등록
+        from . import signals  # noqa: F401
@@ -0,0 +1,168 @@
+# backend/search/backends.py
+
+from django.db.models import Q
+
+from .models import SearchDocument
+
+TABLE = SearchDocument._meta.db_table
+COLUMNS = ('id', 'source', 'source_id', 'lecture_id', 'thread_id', 'title', 'body', 'created_at')
+
+
+class SearchBackend:
+    """
+    DB 종류별 전문 검색 구현
+    - install_sql / uninstall_sql: 마이그레이션에서 실행하는 색인 생성/삭제 SQL
+    - search(): 점수 순 SearchDocument 목록 (score 속성 포함, 높을수록 관련도 높음)
+        terms: tokenizer.parse_query() 결과 / sources: 문서 종류 목록
+        visible_lecture_ids: 볼 수 있는 강의 ID (None이면 제한 없음, 강의 없는 문서는 항상 포함)
+        lecture_id: 특정 강의 문서만
+    """
+    install_sql = ()
+    uninstall_sql = ()
+
+    def search(self, terms, sources, visible_lecture_ids, lecture_id, limit, offset):
+        raise NotImplementedError
+
+    @staticmethod
+    def select_columns(alias):
+        return ', '.join(f'{alias}.{column}' for column in COLUMNS)
+
+    @staticmethod
+    def where_clause(alias, sources, visible_lecture_ids, lecture_id):
+        """검색 조건 외 필터 (' AND ...' 형태 SQL, 파라미터)"""
+        parts = [f"{alias}.source IN ({', '.join(['%s'] * len(sources))})"]
+        params = list(sources)
+        if visible_lecture_ids is not None:
+            if visible_lecture_ids:
+                placeholders = ', '.join(['%s'] * len(visible_lecture_ids))
+                parts.append(f"({alias}.lecture_id IS NULL OR {alias}.lecture_id IN ({placeholders}))")
+                params += visible_lecture_ids
+            else:
+                parts.append(f"{alias}.lecture_id IS NULL")
+        if lecture_id is not None:
+            parts.append(f"{alias}.lecture_id = %s")
+            params.append(lecture_id)
+        return ''.join(' AND ' + part for part in parts), params
+
+
+class SqliteSearchBackend(SearchBackend):
+    """
+    FTS5 외부 콘텐츠 테이블 (문서 본문은 search_searchdocument에만 저장하고 FTS5에는 역색인만 보관)
+    트리거가 문서 INSERT/UPDATE/DELETE를 색인에 반영합니다.
+    토큰은 search/tokenizer.py에서 미리 나눠 두었으므로 unicode61은 공백 단위로만 자릅니다.
+    """
+    FTS_TABLE = 'search_fts'
+    install_sql = (
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+        f"title_tokens, body_tokens, content='{TABLE}', content_rowid='id', tokenize='unicode61')",
+        f"CREATE TRIGGER search_fts_ai AFTER INSERT ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens); "
+        f"END",
+        f"CREATE TRIGGER search_fts_ad AFTER DELETE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) "
+        f"VALUES ('delete', old.id, old.title_tokens, old.body_tokens); "
+        f"END",
+        f"CREATE TRIGGER search_fts_au AFTER UPDATE OF title_tokens, body_tokens ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) "
+        f"VALUES ('delete', old.id, old.title_tokens, old.body_tokens); "
+        f"INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens); "
+        f"END",
+        # 이미 들어 있는 문서로 색인 생성
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+    )
+    uninstall_sql = (
+        "DROP TRIGGER IF EXISTS search_fts_au",
+        "DROP TRIGGER IF EXISTS search_fts_ad",
+        "DROP TRIGGER IF EXISTS search_fts_ai",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    )
+    # 제목 일치를 본문 일치보다 높게 (bm25 컬럼 가중치)
+    TITLE_WEIGHT, BODY_WEIGHT = 3.0, 1.0
+
+    @staticmethod
+    def match_expression(terms):
+        # '"게시 시판"' = 연속 토큰(구) / '"단어 12"*' = 마지막 토큰 접두어, 항목끼리는 AND
+        parts = []
+        for tokens, prefix in terms:
+            phrase = '"' + ' '.join(tokens) + '"'
+            parts.append(phrase + '*' if prefix else phrase)
+        return ' AND '.join(parts)
+
+    def search(self, terms, sources, visible_lecture_ids, lecture_id, limit, offset):
+        where, params = self.where_clause('d', sources, visible_lecture_ids, lecture_id)
+        # bm25()는 작을수록 관련도가 높으므로 부호를 바꿔 score로 씁니다.
+        sql = (
+            f"SELECT {self.select_columns('d')}, "
+            f"-bm25({self.FTS_TABLE}, {self.TITLE_WEIGHT}, {self.BODY_WEIGHT}) AS score "
+            f"FROM {self.FTS_TABLE} JOIN {TABLE} d ON d.id = {self.FTS_TABLE}.rowid "
+            f"WHERE {self.FTS_TABLE} MATCH %s{where} "
+            f"ORDER BY score DESC, d.id DESC LIMIT %s OFFSET %s"
+        )
+        return list(SearchDocument.objects.raw(sql, [self.match_expression(terms), *params, limit, offset]))
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    title_tokens(가중치 A) + body_tokens(가중치 B)로 계산되는 tsvector 생성 컬럼과 GIN 인덱스
+    문서 행이 바뀌면 DB가 생성 컬럼과 인덱스를 함께 갱신합니다. ('simple' 설정: 형태소 분석 없음)
+    """
+    install_sql = (
+        f"ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('simple', title_tokens), 'A') || "
+        f"setweight(to_tsvector('simple', body_tokens), 'B')) STORED",
+        f"CREATE INDEX searchdoc_vector_gin ON {TABLE} USING gin (search_vector)",
+    )
+    uninstall_sql = (
+        "DROP INDEX IF EXISTS searchdoc_vector_gin",
+        f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector",
+    )
+
+    @staticmethod
+    def tsquery(terms):
+        # '게시' <-> '시판' = 연속 토큰(구) / '단어' <-> '12':* = 마지막 토큰 접두어, 항목끼리는 AND
+        parts = []
+        for tokens, prefix in terms:
+            quoted = [f"'{token}'" for token in tokens]
+            if prefix:
+                quoted[-1] += ':*'
+            parts.append('(' + ' <-> '.join(quoted) + ')')
+        return ' & '.join(parts)
+
+    def search(self, terms, sources, visible_lecture_ids, lecture_id, limit, offset):
+        where, params = self.where_clause('d', sources, visible_lecture_ids, lecture_id)
+        sql = (
+            f"SELECT {self.select_columns('d')}, ts_rank(d.search_vector, q) AS score "
+            f"FROM {TABLE} d, to_tsquery('simple', %s) q "
+            f"WHERE d.search_vector @@ q{where} "
+            f"ORDER BY score DESC, d.id DESC LIMIT %s OFFSET %s"
+        )
+        return list(SearchDocument.objects.raw(sql, [self.tsquery(terms), *params, limit, offset]))
+
+
+class FallbackSearchBackend(SearchBackend):
+    """전문 검색을 지원하지 않는 DB용 (토큰 컬럼 LIKE 검색, 점수 없이 최신순)"""
+
+    def search(self, terms, sources, visible_lecture_ids, lecture_id, limit, offset):
+        condition = Q(source__in=sources)
+        for tokens, _ in terms:
+            phrase = ' '.join(tokens)
+            condition &= Q(title_tokens__contains=phrase) | Q(body_tokens__contains=phrase)
+        if visible_lecture_ids is not None:
+            condition &= Q(lecture_id__isnull=True) | Q(lecture_id__in=visible_lecture_ids)
+        if lecture_id is not None:
+            condition &= Q(lecture_id=lecture_id)
+        documents = SearchDocument.objects.filter(condition)
+        documents = list(documents.order_by('-created_at', '-id')[offset:offset + limit])
+        for document in documents:
+            document.score = 0.0
+        return documents
+
+
+BACKENDS = {
+    'sqlite': SqliteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend(connection):
+    return BACKENDS.get(connection.vendor, FallbackSearchBackend)()
@@ -0,0 +1,68 @@
+# backend/search/engine.py
+
+import re
+
+from django.db import connection
+from django.utils.html import escape
+
+from lecture.models import Lecture, Enrollment
+from .backends import get_backend
+from .tokenizer import parse_query
+
+SNIPPET_LENGTH = 120
+
+
+def visible_lecture_ids(user):
+    """검색 결과에 포함할 수 있는 강의 (수강 중이거나 담당하는 강의, 관리자는 제한 없음)"""
+    if user.is_staff:
+        return None
+    # OR 조건 JOIN은 강의 테이블 전체를 훑으므로, 인덱스를 타는 두 조회를 UNION 합니다.
+    enrolled = Enrollment.objects.filter(student=user).values_list('lecture_id', flat=True)
+    teaching = Lecture.objects.filter(instructor=user).values_list('id', flat=True)
+    return list(enrolled.union(teaching))
+
+
+def search(user, query, sources, lecture_id=None, limit=20, offset=0):
+    """
+    전문 검색 (search/backends.py의 DB별 구현 사용)
+    반환값: (검색어 항목, 점수 순 SearchDocument 목록) - 검색어에 단어가 없으면 항목이 비어 있음
+    """
+    terms = parse_query(query)
+    if not terms:
+        return terms, []
+    documents = get_backend(connection).search(
+        terms, sources, visible_lecture_ids(user), lecture_id, limit, offset,
+    )
+    return terms, documents
+
+
+def highlight(text, terms, max_length=None):
+    """
+    text에서 검색어를 <mark>로 감싼 HTML (나머지는 이스케이프)
+    max_length를 주면 첫 일치 위치 주변만 잘라 요약(snippet)으로 만듭니다.
+    """
+    text = text or ''
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE) if terms else None
+    match = pattern.search(text) if pattern else None
+
+    prefix = suffix = ''
+    if max_length is not None and len(text) > max_length:
+        # 일치 위치가 앞쪽 1/3 즈음에 오도록 자릅니다.
+        start = max(0, (match.start() if match else 0) - max_length // 3)
+        end = min(len(text), start + max_length)
+        start = max(0, end - max_length)
+        prefix = '…' if start > 0 else ''
+        suffix = '…' if end < len(text) else ''
+        text = text[start:end]
+
+    if pattern is None:
+        return prefix + escape(text) + suffix
+    parts = []
+    position = 0
+    for found in pattern.finditer(text):
+        parts.append(escape(text[position:found.start()]))
+        parts.append(f'<mark>{escape(found.group())}</mark>')
+        position = found.end()
+    parts.append(escape(text[position:]))
+    return prefix + ''.join(parts) + suffix
+
@@ -0,0 +1,99 @@
+# backend/search/index.py
+
+from django.apps import apps as global_apps
+
+from .tokenizer import index_tokens
+
+UPDATE_FIELDS = ['lecture', 'thread_id', 'title', 'body', 'title_tokens', 'body_tokens', 'created_at']
+
+
+# === 원본 객체 -> 검색 문서 값 ===
+
+def thread_values(thread):
+    return dict(lecture_id=thread.lecture_id, thread_id=thread.pk, title=thread.title, body=thread.content,
+                created_at=thread.created_at)
+
+
+def comment_values(comment):
+    # 댓글은 게시글이 속한 강의의 공개 범위를 따릅니다.
+    return dict(lecture_id=comment.thread.lecture_id, thread_id=comment.thread_id, title='', body=comment.content,
+                created_at=comment.created_at)
+
+
+def lecture_notice_values(notice):
+    return dict(lecture_id=notice.lecture_id, thread_id=None, title=notice.title, body=notice.body,
+                created_at=notice.created_at)
+
+
+def system_notice_values(notice):
+    return dict(lecture_id=None, thread_id=None, title=notice.title, body=notice.content,
+                created_at=notice.created_at)
+
+
+# 문서 종류 -> (원본 모델, 값 계산 함수, 함께 읽을 관계)
+SOURCES = {
+    'thread': ('community.Thread', thread_values, ()),
+    'comment': ('community.Comment', comment_values, ('thread',)),
+    'lecture_notice': ('lecture.LectureNotice', lecture_notice_values, ()),
+    'system_notice': ('notice.SystemNotice', system_notice_values, ()),
+}
+
+
+def build_document(document_model, source, obj):
+    values = SOURCES[source][1](obj)
+    return document_model(
+        source=source,
+        source_id=obj.pk,
+        title_tokens=index_tokens(values['title']),
+        body_tokens=index_tokens(values['body']),
+        **values,
+    )
+
+
+# === 색인 갱신 (search/signals.py) ===
+
+def index_object(source, obj):
+    """문서 한 건 upsert (INSERT ... ON CONFLICT DO UPDATE 한 번, 색인은 DB 트리거/생성 컬럼이 갱신)"""
+    from .models import SearchDocument
+
+    SearchDocument.objects.bulk_create(
+        [build_document(SearchDocument, source, obj)],
+        update_conflicts=True,
+        unique_fields=['source', 'source_id'],
+        update_fields=UPDATE_FIELDS,
+    )
+
+
+def remove_object(source, pk):
+    from .models import SearchDocument
+
+    SearchDocument.objects.filter(source=source, source_id=pk).delete()
+
+
+def rebuild(sources=None, batch_size=1_000, apps=global_apps):
+    """
+    원본 테이블에서 검색 문서를 다시 만듭니다. (초기 색인, bulk insert 이후, rebuild_search_index 명령)
+    apps: 마이그레이션에서 호출할 때는 과거 모델 레지스트리를 넘깁니다.
+    반환값: 문서 종류별 문서 수
+    """
+    document_model = apps.get_model('search', 'SearchDocument')
+    counts = {}
+    for source in sources or SOURCES:
+        model_label, _, related = SOURCES[source]
+        queryset = apps.get_model(model_label).objects.order_by('pk')
+        if related:
+            queryset = queryset.select_related(*related)
+
+        document_model.objects.filter(source=source).delete()
+        batch = []
+        counts[source] = 0
+        for obj in queryset.iterator(chunk_size=batch_size):
+            batch.append(build_document(document_model, source, obj))
+            if len(batch) >= batch_size:
+                document_model.objects.bulk_create(batch)
+                counts[source] += len(batch)
+                batch = []
+        if batch:
+            document_model.objects.bulk_create(batch)
+            counts[source] += len(batch)
+    return counts
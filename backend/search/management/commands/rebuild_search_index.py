@@ -0,0 +1,31 @@
+# backend/search/management/commands/rebuild_search_index.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from search.backends import get_backend
+from search.index import SOURCES, rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "게시글/댓글/공지로 검색 문서와 전문 검색 색인을 다시 만듭니다. "
+        "(seed_data 등 시그널을 거치지 않은 대량 작업 후 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', action='append', choices=list(SOURCES), help="이 종류만 다시 색인 (여러 번 지정 가능)")
+        parser.add_argument('--batch-size', type=int, default=1_000)
+
+    def handle(self, *args, **options):
+        began = time.perf_counter()
+        with transaction.atomic():
+            counts = rebuild(options['source'], options['batch_size'])
+        for source, count in counts.items():
+            self.stdout.write(f"  {source}: {count}건")
+        self.stdout.write(self.style.SUCCESS(
+            f"{get_backend(connection).__class__.__name__}로 {sum(counts.values())}건 색인 "
+            f"({time.perf_counter() - began:.1f}s)"
+        ))
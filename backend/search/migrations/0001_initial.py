@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('lecture', '0007_attendance_unique_week'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('thread', '게시글'), ('comment', '댓글'), ('lecture_notice', '강의 공지'), ('system_notice', '시스템 공지')], max_length=20)),
+                ('source_id', models.IntegerField()),
+                ('thread_id', models.IntegerField(blank=True, null=True)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('title_tokens', models.TextField(blank=True)),
+                ('body_tokens', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+                ('lecture', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='lecture.lecture')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['thread_id'], name='searchdoc_thread_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'source_id'), name='searchdoc_source_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,139 @@
+import re
+
+from django.db import migrations
+
+# 이 마이그레이션이 실행할 SQL과 초기 색인 로직은 search/backends.py, search/index.py, search/tokenizer.py를
+# 작성 시점 그대로 복사해 둔 것입니다. (마이그레이션은 앱 코드가 바뀌어도 그대로 동작해야 하므로 복사)
+
+TABLE = 'search_searchdocument'
+FTS_TABLE = 'search_fts'
+
+INSTALL_SQL = {
+    # FTS5 외부 콘텐츠 테이블 + 문서 INSERT/UPDATE/DELETE를 색인에 반영하는 트리거
+    'sqlite': (
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+        f"title_tokens, body_tokens, content='{TABLE}', content_rowid='id', tokenize='unicode61')",
+        f"CREATE TRIGGER search_fts_ai AFTER INSERT ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens); "
+        f"END",
+        f"CREATE TRIGGER search_fts_ad AFTER DELETE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) "
+        f"VALUES ('delete', old.id, old.title_tokens, old.body_tokens); "
+        f"END",
+        f"CREATE TRIGGER search_fts_au AFTER UPDATE OF title_tokens, body_tokens ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens) "
+        f"VALUES ('delete', old.id, old.title_tokens, old.body_tokens); "
+        f"INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens) VALUES (new.id, new.title_tokens, new.body_tokens); "
+        f"END",
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+    ),
+    # title_tokens(A) + body_tokens(B) tsvector 생성 컬럼 + GIN 인덱스
+    'postgresql': (
+        f"ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('simple', title_tokens), 'A') || "
+        f"setweight(to_tsvector('simple', body_tokens), 'B')) STORED",
+        f"CREATE INDEX searchdoc_vector_gin ON {TABLE} USING gin (search_vector)",
+    ),
+}
+
+UNINSTALL_SQL = {
+    'sqlite': (
+        "DROP TRIGGER IF EXISTS search_fts_au",
+        "DROP TRIGGER IF EXISTS search_fts_ad",
+        "DROP TRIGGER IF EXISTS search_fts_ai",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    ),
+    'postgresql': (
+        "DROP INDEX IF EXISTS searchdoc_vector_gin",
+        f"ALTER TABLE {TABLE} DROP COLUMN IF EXISTS search_vector",
+    ),
+}
+
+# 색인 토큰 (공백 구분, 한글/한자/가나는 2-gram)
+WORD_RE = re.compile(r'[^\W_]+')
+CJK_RE = re.compile(r'([\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3]+)')
+
+
+def index_tokens(text):
+    tokens = []
+    for word in WORD_RE.findall(text or ''):
+        for i, run in enumerate(CJK_RE.split(word.lower())):
+            if not run:
+                continue
+            if i % 2 == 1 and len(run) > 1:
+                tokens.extend(run[j:j + 2] for j in range(len(run) - 1))
+            else:
+                tokens.append(run)
+    return ' '.join(tokens)
+
+
+# 문서 종류 -> (원본 모델, 값 계산 함수, 함께 읽을 관계)
+SOURCES = {
+    'thread': ('community', 'Thread', lambda obj: dict(
+        lecture_id=obj.lecture_id, thread_id=obj.pk, title=obj.title, body=obj.content, created_at=obj.created_at,
+    ), ()),
+    'comment': ('community', 'Comment', lambda obj: dict(
+        lecture_id=obj.thread.lecture_id, thread_id=obj.thread_id, title='', body=obj.content,
+        created_at=obj.created_at,
+    ), ('thread',)),
+    'lecture_notice': ('lecture', 'LectureNotice', lambda obj: dict(
+        lecture_id=obj.lecture_id, thread_id=None, title=obj.title, body=obj.body, created_at=obj.created_at,
+    ), ()),
+    'system_notice': ('notice', 'SystemNotice', lambda obj: dict(
+        lecture_id=None, thread_id=None, title=obj.title, body=obj.content, created_at=obj.created_at,
+    ), ()),
+}
+
+BATCH_SIZE = 1_000
+
+
+def backfill_documents(apps, schema_editor):
+    document_model = apps.get_model('search', 'SearchDocument')
+    for source, (app_label, model_name, values_of, related) in SOURCES.items():
+        queryset = apps.get_model(app_label, model_name).objects.order_by('pk')
+        if related:
+            queryset = queryset.select_related(*related)
+
+        document_model.objects.filter(source=source).delete()
+        batch = []
+        for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+            values = values_of(obj)
+            batch.append(document_model(
+                source=source,
+                source_id=obj.pk,
+                title_tokens=index_tokens(values['title']),
+                body_tokens=index_tokens(values['body']),
+                **values,
+            ))
+            if len(batch) >= BATCH_SIZE:
+                document_model.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            document_model.objects.bulk_create(batch)
+
+
+def install_fulltext_index(apps, schema_editor):
+    # DB 종류별 전문 검색 색인 (그 밖의 DB는 색인 없이 LIKE 검색)
+    for sql in INSTALL_SQL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(sql)
+
+
+def uninstall_fulltext_index(apps, schema_editor):
+    for sql in UNINSTALL_SQL.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('community', '0008_comment_thread_index'),
+        ('lecture', '0007_attendance_unique_week'),
+        ('notice', '0004_updated_at'),
+    ]
+
+    operations = [
+        # 기존 게시글/댓글/공지를 먼저 문서로 만든 뒤 색인을 한 번에 생성합니다.
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+        migrations.RunPython(install_fulltext_index, uninstall_fulltext_index),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+from lecture.models import Lecture
+
+
+# 검색 색인 문서 (게시글/댓글/강의 공지/시스템 공지 한 건당 한 행)
+# 전문 검색 색인은 DB 종류별로 마이그레이션에서 만듭니다. (search/backends.py)
+#   - SQLite: title_tokens/body_tokens를 외부 콘텐츠로 쓰는 FTS5 가상 테이블 + 트리거
+#   - PostgreSQL: 두 컬럼으로 계산되는 tsvector 생성 컬럼 + GIN 인덱스
+class SearchDocument(models.Model):
+    SOURCE_CHOICES = (
+        ('thread', '게시글'),
+        ('comment', '댓글'),
+        ('lecture_notice', '강의 공지'),
+        ('system_notice', '시스템 공지'),
+    )
+
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    source_id = models.IntegerField()
+    # 강의 게시판 글/댓글, 강의 공지의 강의 (Null이면 누구나 볼 수 있는 문서)
+    lecture = models.ForeignKey(Lecture, null=True, blank=True, on_delete=models.CASCADE, related_name="+")
+    thread_id = models.IntegerField(null=True, blank=True)  # 댓글이 달린 게시글 (결과 링크용)
+    title = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    # search/tokenizer.py의 index_tokens() 결과 (2-gram 등 공백 구분 토큰)
+    title_tokens = models.TextField(blank=True)
+    body_tokens = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'source_id'], name='searchdoc_source_uniq'),
+        ]
+        indexes = [
+            # 게시글 강의 이동 시 댓글 문서의 강의 갱신: WHERE source = 'comment' AND thread_id = ?
+            models.Index(fields=['thread_id'], name='searchdoc_thread_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.source}:{self.source_id}] {self.title}"
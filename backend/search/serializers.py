@@ -0,0 +1,20 @@
+from rest_framework import serializers
+from doro.metrics import SerializerTimingMixin
+from .engine import highlight, SNIPPET_LENGTH
+
+# 검색 결과용 (context['terms']: 강조할 검색어 - tokenizer.highlight_terms 결과)
+class SearchResultSerializer(SerializerTimingMixin, serializers.Serializer):
+    type = serializers.CharField(source='source')
+    id = serializers.IntegerField(source='source_id')
+    title = serializers.SerializerMethodField()
+    snippet = serializers.SerializerMethodField()
+    lecture = serializers.IntegerField(source='lecture_id', allow_null=True)
+    thread = serializers.IntegerField(source='thread_id', allow_null=True)
+    created_at = serializers.DateTimeField()
+    score = serializers.FloatField()
+
+    def get_title(self, obj):
+        return highlight(obj.title, self.context['terms'])
+
+    def get_snippet(self, obj):
+        return highlight(obj.body, self.context['terms'], max_length=SNIPPET_LENGTH)
@@ -0,0 +1,48 @@
+# backend/search/signals.py
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from community.models import Thread, Comment
+from lecture.models import LectureNotice
+from notice.models import SystemNotice
+from .models import SearchDocument
+from . import index
+
+# 원본 모델 -> 검색 문서 종류
+SOURCE_OF = {
+    Thread: 'thread',
+    Comment: 'comment',
+    LectureNotice: 'lecture_notice',
+    SystemNotice: 'system_notice',
+}
+
+
+# === 검색 색인 갱신 (search/index.py) ===
+# bulk_create처럼 시그널을 거치지 않는 경로는 manage.py rebuild_search_index 로 다시 색인합니다.
+
+@receiver(post_save, sender=Thread)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=LectureNotice)
+@receiver(post_save, sender=SystemNotice)
+def source_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    index.index_object(SOURCE_OF[sender], instance)
+
+
+@receiver(post_save, sender=Thread)
+def thread_moved(sender, instance, created, raw=False, **kwargs):
+    # 게시글의 강의가 바뀌면 댓글 문서의 공개 범위도 함께 바꿉니다.
+    if not created and not raw:
+        SearchDocument.objects.filter(source='comment', thread_id=instance.pk).exclude(
+            lecture_id=instance.lecture_id,
+        ).update(lecture_id=instance.lecture_id)
+
+
+@receiver(post_delete, sender=Thread)
+@receiver(post_delete, sender=Comment)
+@receiver(post_delete, sender=LectureNotice)
+@receiver(post_delete, sender=SystemNotice)
+def source_deleted(sender, instance, **kwargs):
+    index.remove_object(SOURCE_OF[sender], instance.pk)
@@ -0,0 +1,58 @@
+# backend/search/tokenizer.py
+
+import re
+
+# 밑줄은 FTS5 unicode61 토크나이저에서도 구분자이므로 단어에서 제외합니다.
+WORD_RE = re.compile(r'[^\W_]+')
+# 한글/한자/가나는 띄어쓰기와 조사 때문에 단어 단위로 찾을 수 없어 2-gram으로 색인합니다.
+CJK_RE = re.compile(r'([\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7a3]+)')
+
+MAX_QUERY_TERMS = 8
+
+
+def runs(word):
+    """단어를 (CJK 여부, 조각) 단위로 나눕니다. 예: 'Django게시판' -> (False, 'django'), (True, '게시판')"""
+    for i, part in enumerate(CJK_RE.split(word.lower())):
+        if part:
+            yield i % 2 == 1, part
+
+
+def bigrams(run):
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def word_tokens(word):
+    tokens = []
+    for is_cjk, run in runs(word):
+        tokens.extend(bigrams(run) if is_cjk else [run])
+    return tokens
+
+
+def index_tokens(text):
+    """
+    색인용 토큰 문자열 (공백 구분)
+    '게시판에 질문' -> '게시 시판 판에 질문', 'Django ORM' -> 'django orm'
+    DB 전문 검색 엔진(FTS5 unicode61 / PostgreSQL 'simple')은 이 문자열을 공백 단위로만 나눕니다.
+    """
+    return ' '.join(token for word in WORD_RE.findall(text or '') for token in word_tokens(word))
+
+
+def parse_query(query):
+    """
+    검색어를 단어별 [(토큰 목록, 접두어 여부), ...]로 변환 (모든 항목 AND)
+    - 한 단어의 토큰은 연속으로 나와야 하는 구(phrase) 검색 ('게시판' -> '게시 시판', '단어12' -> '단어 12')
+    - 마지막 조각이 영문·숫자나 한글 1글자면 접두어 검색 (입력 중인 단어도 찾도록)
+    """
+    terms = []
+    for word in WORD_RE.findall(query or ''):
+        last_is_cjk, last_run = list(runs(word))[-1]
+        prefix = not last_is_cjk or len(last_run) == 1
+        terms.append((word_tokens(word), prefix))
+    return terms[:MAX_QUERY_TERMS]
+
+
+def highlight_terms(query):
+    """결과 강조에 쓸 원문 검색어 조각 (긴 것부터 - 겹칠 때 긴 쪽을 우선)"""
+    return sorted({word.lower() for word in WORD_RE.findall(query or '')}, key=len, reverse=True)
@@ -0,0 +1,64 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .engine import search
+from .models import SearchDocument
+from .serializers import SearchResultSerializer
+from .tokenizer import highlight_terms
+
+SOURCES = [source for source, _ in SearchDocument.SOURCE_CHOICES]
+MAX_PAGE_SIZE = 50
+
+
+def int_param(request, name, default, minimum=1, maximum=None):
+    raw = request.query_params.get(name)
+    if raw in (None, ''):
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValidationError({name: "정수여야 합니다."})
+    if value < minimum:
+        raise ValidationError({name: f"{minimum} 이상이어야 합니다."})
+    return min(value, maximum) if maximum else value
+
+
+# 통합 검색 (게시글, 댓글, 강의 공지, 시스템 공지)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search_api(request):
+    """
+    ?q=검색어 (필수)
+    ?type=thread,comment,lecture_notice,system_notice (쉼표 구분, 기본 전체)
+    ?lecture_id= (특정 강의 문서만), ?page=, ?page_size= (최대 50)
+    수강/담당하지 않는 강의의 글, 댓글, 공지는 결과에 포함되지 않습니다.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        raise ValidationError({'q': "검색어를 입력하세요."})
+
+    sources = [source for source in request.query_params.get('type', '').split(',') if source] or SOURCES
+    unknown = sorted(set(sources) - set(SOURCES))
+    if unknown:
+        raise ValidationError({'type': f"{', '.join(SOURCES)} 중에서 선택해야 합니다."})
+
+    lecture_id = int_param(request, 'lecture_id', None)
+    page = int_param(request, 'page', 1)
+    page_size = int_param(request, 'page_size', 20, maximum=MAX_PAGE_SIZE)
+
+    # page_size + 1개를 가져와 다음 페이지 존재 여부를 COUNT 없이 판단합니다.
+    terms, documents = search(
+        request.user, query, sources, lecture_id=lecture_id, limit=page_size + 1, offset=(page - 1) * page_size,
+    )
+    if not terms:
+        raise ValidationError({'q': "검색할 단어가 없습니다."})
+
+    serializer = SearchResultSerializer(documents[:page_size], many=True, context={'terms': highlight_terms(query)})
+    return Response({
+        'query': query,
+        'page': page,
+        'has_next': len(documents) > page_size,
+        'results': serializer.data,
+    })
@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import Task
+from . import queue
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'attempts', 'max_attempts', 'run_at', 'created_at', 'finished_at')
+    list_filter = ('status', 'name')
+    readonly_fields = ('created_at', 'finished_at', 'locked_by', 'locked_until', 'last_error')
+    actions = ['retry_tasks']
+
+    @admin.action(description="선택한 실패 작업 다시 시도")
+    def retry_tasks(self, request, queryset):
+        count = queue.retry(queryset)
+        self.message_user(request, f"{count}개 작업을 다시 대기열에 넣었습니다.")
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class TaskqueueConfig(AppConfig):
+    name = 'taskqueue'
+
+    def ready(self):
+        # 각 앱의 tasks.py를 불러와 @task 함수를 등록합니다. (워커가 이름으로 찾아 실행)
+        autodiscover_modules('tasks')
@@ -0,0 +1,89 @@
+# backend/taskqueue/management/commands/run_tasks.py
+
+import multiprocessing
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from taskqueue import queue
+
+# 완료 작업 정리 주기 (초)
+PRUNE_INTERVAL = 3600
+
+
+def _execute_in_pool(task_id, worker):
+    # 풀 스레드/프로세스는 각자 DB 연결을 쓰므로 작업마다 오래된 연결을 정리합니다.
+    close_old_connections()
+    try:
+        return queue.execute(task_id, worker)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = (
+        "DB 작업 큐(taskqueue)의 작업을 실행하는 워커입니다. "
+        "실패한 작업은 백오프 후 재시도하고, 최대 시도 횟수를 넘기면 DEAD로 남깁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1, help="동시에 실행할 작업 수 (기본 1: 워커 스레드에서 직접 실행)")
+        parser.add_argument('--pool', choices=('thread', 'process'), default='thread',
+                            help="concurrency > 1 일 때 실행기 (I/O 위주 작업은 thread, CPU 위주 작업은 process)")
+        parser.add_argument('--batch-size', type=int, default=queue.BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="대기 작업이 없을 때 다시 확인할 간격 (초)")
+        parser.add_argument('--once', action='store_true', help="대기 중인 작업을 모두 실행하고 종료")
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        worker = queue.worker_name()
+        pool = self.make_pool(options['concurrency'], options['pool'])
+        batch_size = max(options['batch_size'], options['concurrency'])
+        self.stdout.write(f"worker {worker} 시작 (concurrency={options['concurrency']}, pool={options['pool']})")
+
+        done = failed = 0
+        last_prune = 0
+        try:
+            while not self.stopping:
+                if time.monotonic() - last_prune > PRUNE_INTERVAL:
+                    queue.prune()
+                    last_prune = time.monotonic()
+                queue.requeue_stale()
+                ids = queue.claim(worker, batch_size)
+                if not ids:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+                if pool is None:
+                    results = [queue.execute(task_id, worker) for task_id in ids]
+                else:
+                    results = list(pool.map(_execute_in_pool, ids, [worker] * len(ids)))
+                done += results.count(True)
+                failed += results.count(False)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self.stdout.write(f"worker {worker} 종료 (성공 {done}, 실패 {failed})")
+
+    def stop(self, signum, frame):
+        # 진행 중인 묶음은 끝내고 멈춥니다. (가져간 작업을 버리면 임대 만료까지 기다려야 함)
+        self.stopping = True
+
+    @staticmethod
+    def make_pool(concurrency, kind):
+        if concurrency <= 1:
+            return None
+        if kind == 'thread':
+            return ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='run_tasks')
+        # 새 프로세스에서 Django 설정을 다시 불러옵니다. (fork로 DB 연결을 공유하지 않도록 spawn 사용)
+        return ProcessPoolExecutor(
+            max_workers=concurrency, mp_context=multiprocessing.get_context('spawn'), initializer=django.setup,
+        )
@@ -0,0 +1,38 @@
+from django.db import models
+
+
+# 백그라운드 작업 (DB 큐, taskqueue/queue.py)
+# 워커(manage.py run_tasks)가 실행할 때가 된 QUEUED 작업을 RUNNING으로 바꿔 가져가고,
+# 실패하면 백오프 후 다시 QUEUED, 최대 시도 횟수를 넘기면 DEAD(dead letter)로 남깁니다.
+class Task(models.Model):
+    STATUS_CHOICES = (
+        ('QUEUED', '대기'),
+        ('RUNNING', '실행 중'),
+        ('DONE', '완료'),
+        ('DEAD', '실패'),
+    )
+
+    name = models.CharField(max_length=100)  # 등록된 작업 이름 (예: user.send_temporary_password)
+    payload = models.JSONField(default=dict)  # {'args': [...], 'kwargs': {...}}
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='QUEUED')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_at = models.DateTimeField()  # 이 시각 이후에 실행 (재시도 백오프)
+    # 실행 중인 워커와 임대 만료 시각 (워커가 죽으면 만료 후 다시 대기열로)
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 작업 가져오기: WHERE status = 'QUEUED' AND run_at <= ? ORDER BY run_at, id
+            # 임대 만료 확인: WHERE status = 'RUNNING' AND locked_until < ?
+            models.Index(fields=['status', 'run_at', 'id'], name='task_status_run_idx'),
+            # 완료 작업 정리: WHERE status = 'DONE' AND finished_at < ?
+            models.Index(fields=['status', 'finished_at'], name='task_status_finished_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,216 @@
+# backend/taskqueue/queue.py
+
+import functools
+import logging
+import os
+import random
+import socket
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger('doro.tasks')
+
+QUEUED = 'QUEUED'
+RUNNING = 'RUNNING'
+DONE = 'DONE'
+DEAD = 'DEAD'
+
+# 실행 중 작업의 임대 시간 (이 안에 끝나지 않으면 워커가 죽은 것으로 보고 다시 대기열로 돌립니다)
+LEASE = timedelta(minutes=5)
+# 재시도 간격: BACKOFF_BASE * 2^(시도 횟수 - 1), 최대 BACKOFF_MAX (동시에 실패한 작업이 한꺼번에 몰리지 않게 0.5~1배 지터)
+BACKOFF_BASE = timedelta(seconds=10)
+BACKOFF_MAX = timedelta(hours=1)
+# 한 번에 가져오는 작업 수 / 완료 작업 보관 기간 (실패 작업은 직접 확인하도록 남겨 둠)
+BATCH_SIZE = 20
+DONE_TTL = timedelta(days=7)
+
+# 작업 이름 -> TaskFunction (각 앱의 tasks.py가 불러와질 때 등록, taskqueue/apps.py)
+registry = {}
+
+
+class TaskFunction:
+    """@task로 등록된 함수 (그냥 호출하면 바로 실행, enqueue()는 큐에 넣음)"""
+
+    def __init__(self, func, name, max_attempts):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, *args, **kwargs):
+        """
+        작업을 큐에 넣습니다. (인자는 JSON으로 저장 가능한 값이어야 함)
+        호출한 쪽의 트랜잭션 안에서 INSERT 되므로, 트랜잭션이 롤백되면 작업도 함께 사라집니다.
+        """
+        return self.enqueue_many([(args, kwargs)])[0]
+
+    def enqueue_many(self, calls):
+        """[(args, kwargs), ...] 를 bulk_create 한 번으로 큐에 넣습니다."""
+        now = timezone.now()
+        tasks = Task.objects.bulk_create([
+            Task(name=self.name, payload={'args': list(args), 'kwargs': kwargs},
+                 max_attempts=self.max_attempts, run_at=now)
+            for args, kwargs in calls
+        ])
+        if tasks and settings.TASK_QUEUE['EXECUTOR'] == 'thread':
+            transaction.on_commit(kick)
+        return tasks
+
+
+def task(name=None, max_attempts=5):
+    """
+    백그라운드 작업 등록 데코레이터 (이름 기본값: '앱.함수명')
+
+        @task()
+        def send_temporary_password(user_id): ...
+
+        send_temporary_password.enqueue(user.pk)
+    """
+    def decorator(func):
+        task_name = name or f"{func.__module__.split('.')[0]}.{func.__name__}"
+        registry[task_name] = TaskFunction(func, task_name, max_attempts)
+        return registry[task_name]
+    return decorator
+
+
+def worker_name(suffix=''):
+    # locked_by 길이(64)에 맞추되, 같은 프로세스의 스레드를 구분하는 suffix는 자르지 않습니다.
+    return f"{socket.gethostname()}:{os.getpid()}"[:64 - len(suffix)] + suffix
+
+
+def backoff(attempts):
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+
+# === 가져오기 / 실행 ===
+
+def claim(worker, limit=BATCH_SIZE):
+    """
+    실행할 때가 된 작업을 limit개까지 RUNNING으로 바꿔 가져옵니다. (시도 횟수 +1, 임대 시작)
+    PostgreSQL은 SKIP LOCKED로 워커끼리 서로 다른 작업을 가져가고,
+    SQLite는 IMMEDIATE 트랜잭션이 워커를 한 줄로 세웁니다. (task_status_run_idx)
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            Task.objects.select_for_update(skip_locked=True)
+            .filter(status=QUEUED, run_at__lte=now).order_by('run_at', 'id')
+            .values_list('pk', flat=True)[:limit]
+        )
+        if ids:
+            Task.objects.filter(pk__in=ids).update(
+                status=RUNNING, locked_by=worker, locked_until=now + LEASE, attempts=F('attempts') + 1,
+            )
+    return ids
+
+
+def execute(task_id, worker):
+    """
+    가져온 작업 하나를 실행합니다. 반환값: 성공 여부
+    - 성공: DONE
+    - 실패: 시도 횟수가 남았으면 백오프 후 다시 QUEUED, 아니면 DEAD
+    임대를 잃은 작업(만료 후 다른 워커가 가져감)의 결과는 기록하지 않습니다.
+    """
+    task = Task.objects.filter(pk=task_id, status=RUNNING, locked_by=worker).first()
+    if task is None:
+        return False
+    mine = Task.objects.filter(pk=task.pk, status=RUNNING, locked_by=worker)
+    try:
+        func = registry.get(task.name)
+        if func is None:
+            raise LookupError(f"등록되지 않은 작업입니다: {task.name}")
+        func(*task.payload.get('args', []), **task.payload.get('kwargs', {}))
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if task.attempts >= task.max_attempts:
+            logger.error("task %s #%s dead after %s attempts\n%s", task.name, task.pk, task.attempts, error)
+            mine.update(status=DEAD, finished_at=now, locked_by='', locked_until=None, last_error=error)
+        else:
+            logger.warning("task %s #%s failed (attempt %s/%s)", task.name, task.pk, task.attempts, task.max_attempts)
+            mine.update(status=QUEUED, run_at=now + backoff(task.attempts), locked_by='', locked_until=None,
+                        last_error=error)
+        return False
+    mine.update(status=DONE, finished_at=timezone.now(), locked_by='', locked_until=None)
+    return True
+
+
+def requeue_stale():
+    """
+    임대가 만료된 RUNNING 작업(워커 종료 등)을 다시 대기열로 돌립니다.
+    시도 횟수를 다 쓴 작업은 DEAD. 반환값: 처리한 작업 수
+    """
+    now = timezone.now()
+    stale = Task.objects.filter(status=RUNNING, locked_until__lt=now)
+    dead = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=DEAD, finished_at=now, locked_by='', locked_until=None, last_error="임대 시간 안에 끝나지 않았습니다.",
+    )
+    requeued = stale.update(status=QUEUED, run_at=now, locked_by='', locked_until=None)
+    return dead + requeued
+
+
+def run_pending(worker, limit=BATCH_SIZE):
+    """대기 중인 작업을 한 묶음 가져와 차례로 실행합니다. 반환값: 실행한 작업 수"""
+    requeue_stale()
+    ids = claim(worker, limit)
+    for task_id in ids:
+        execute(task_id, worker)
+    return len(ids)
+
+
+def prune():
+    """보관 기간이 지난 완료 작업 삭제. 반환값: 삭제 수"""
+    deleted, _ = Task.objects.filter(status=DONE, finished_at__lt=timezone.now() - DONE_TTL).delete()
+    return deleted
+
+
+def retry(queryset):
+    """실패(DEAD) 작업을 처음부터 다시 시도하도록 대기열에 넣습니다. (관리자 화면)"""
+    return queryset.filter(status=DEAD).update(
+        status=QUEUED, run_at=timezone.now(), attempts=0, finished_at=None, last_error='',
+    )
+
+
+# === 스레드 실행기 (TASK_QUEUE['EXECUTOR'] == 'thread') ===
+# 워커 없이 웹 프로세스의 스레드 풀이 커밋 직후 대기 작업을 실행합니다. (개발용)
+# 요청 스레드는 작업을 넣기만 하고 바로 응답하며, 재시도 대기 중인 작업은 다음 작업이 들어올 때 함께 실행됩니다.
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def kick():
+    global _executor
+    if _executor is None:
+        # 여러 요청이 동시에 커밋해도 풀은 하나만 만듭니다.
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.TASK_QUEUE['THREADS'], thread_name_prefix='taskqueue',
+                )
+    _executor.submit(_run_in_thread)
+
+
+def _run_in_thread():
+    close_old_connections()
+    try:
+        # 풀의 스레드마다 따로 작업을 가져오므로 스레드 이름(taskqueue_0, ...)까지 넣어 임대를 구분합니다.
+        while run_pending(worker_name(f':{threading.current_thread().name}')):
+            pass
+    except Exception:
+        logger.exception("task thread failed")
+    finally:
+        close_old_connections()
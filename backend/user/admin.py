@@ -1,7 +1,13 @@
 from django.contrib import admin
-from .models import User
+from .models import User, InterestTag
 
 # Register your models here.
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     pass
+
+# 사용자 수는 user/interests.py가 관리하므로 읽기 전용
+@admin.register(InterestTag)
+class InterestTagAdmin(admin.ModelAdmin):
+    list_display = ('name', 'user_count')
+    readonly_fields = ('user_count',)
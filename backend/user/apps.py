@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class UserConfig(AppConfig):
     name = 'user'
+
+    def ready(self):
+        # 마이페이지 통계 카운터 시그널 등록
+        from . import signals  # noqa: F401
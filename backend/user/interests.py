@@ -0,0 +1,82 @@
+# backend/user/interests.py
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import User, InterestTag, UserInterest
+
+MAX_TAG_LENGTH = 50
+MAX_TAGS_PER_USER = 20
+
+
+def normalize(name):
+    """태그 이름 정리 (앞뒤/연속 공백 제거, 최대 50자)"""
+    return ' '.join(str(name).split())[:MAX_TAG_LENGTH]
+
+
+def parse(value):
+    """'코딩, 드론' 같은 쉼표 구분 문자열 또는 이름 목록 -> 정리된 이름 목록 (입력 순서 유지, 빈 값/중복 제거)"""
+    items = value.split(',') if isinstance(value, str) else value
+    names = []
+    for item in items:
+        name = normalize(item)
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def tag_names(user):
+    # 사용자당 태그는 최대 20개이므로 이름 정렬은 파이썬에서 합니다.
+    return sorted(UserInterest.objects.filter(user=user).order_by().values_list('tag__name', flat=True))
+
+
+@transaction.atomic
+def set_interests(user, names):
+    """
+    사용자의 관심분야를 names로 교체합니다. (바뀐 태그만 추가/삭제하고 태그별 사용자 수를 F()로 증감)
+    없는 태그는 새로 만듭니다. 반환값: 정리된 이름 목록
+    """
+    names = parse(names)
+    # 같은 사용자의 동시 수정이 사용자 수를 두 번 세지 않도록 사용자 행을 잠급니다.
+    User.objects.select_for_update().filter(pk=user.pk).values_list('pk').first()
+
+    current = dict(UserInterest.objects.filter(user=user).values_list('tag__name', 'tag_id'))
+    removed = [tag_id for name, tag_id in current.items() if name not in names]
+    added = [name for name in names if name not in current]
+
+    if removed:
+        UserInterest.objects.filter(user=user, tag_id__in=removed).delete()
+        InterestTag.objects.filter(pk__in=removed).update(user_count=F('user_count') - 1)
+    if added:
+        InterestTag.objects.bulk_create([InterestTag(name=name) for name in added], ignore_conflicts=True)
+        tag_ids = list(InterestTag.objects.filter(name__in=added).values_list('pk', flat=True))
+        UserInterest.objects.bulk_create([UserInterest(user=user, tag_id=tag_id) for tag_id in tag_ids])
+        InterestTag.objects.filter(pk__in=tag_ids).update(user_count=F('user_count') + 1)
+    return names
+
+
+def user_removed(user):
+    """사용자 삭제 시 (CASCADE로 연결이 지워지기 전) 태그별 사용자 수 감소 - user/signals.py"""
+    tag_ids = UserInterest.objects.filter(user=user).values('tag_id')
+    InterestTag.objects.filter(pk__in=tag_ids).update(user_count=F('user_count') - 1)
+
+
+# === 조회 ===
+
+def popular_tags():
+    """사용자가 있는 태그 (사용자 수 많은 순, interesttag_count_idx)"""
+    return InterestTag.objects.filter(user_count__gt=0).order_by('-user_count', 'name')
+
+
+def recount():
+    """
+    태그별 사용자 수를 연결 테이블 집계로 다시 맞춥니다. (manage.py reconcile_user_stats)
+    반환값: 값이 바뀐 태그 수
+    """
+    actual = dict(UserInterest.objects.order_by().values_list('tag_id').annotate(n=Count('id')))
+    changed = 0
+    for tag_id, count in InterestTag.objects.values_list('pk', 'user_count'):
+        if actual.get(tag_id, 0) != count:
+            InterestTag.objects.filter(pk=tag_id).update(user_count=actual.get(tag_id, 0))
+            changed += 1
+    return changed
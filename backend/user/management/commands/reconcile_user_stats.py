@@ -0,0 +1,58 @@
+# backend/user/management/commands/reconcile_user_stats.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from user import interests
+from user.models import UserStats
+from user.stats import COUNTER_FIELDS, collect
+
+
+class Command(BaseCommand):
+    help = (
+        "마이페이지 통계 카운터(UserStats)와 관심분야 태그별 사용자 수를 원본 테이블 집계와 비교해 다시 맞춥니다. "
+        "(seed_data 등 시그널을 거치지 않은 대량 작업 후 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="어긋난 사용자만 출력하고 저장하지 않음")
+
+    def handle(self, *args, **options):
+        expected = collect()
+        current = {
+            row['user_id']: row
+            for row in UserStats.objects.values('user_id', *COUNTER_FIELDS)
+        }
+
+        drifted = []
+        for user_id, values in expected.items():
+            row = current.get(user_id)
+            if row is None:
+                drifted.append((user_id, values, '행 없음'))
+                continue
+            diff = {field: (row[field], value) for field, value in values.items() if row[field] != value}
+            if diff:
+                drifted.append((user_id, values, ', '.join(f"{f} {a}->{b}" for f, (a, b) in diff.items())))
+
+        for user_id, _, detail in drifted[:50]:
+            self.stdout.write(f"  user {user_id}: {detail}")
+        if len(drifted) > 50:
+            self.stdout.write(f"  ... 외 {len(drifted) - 50}명")
+
+        if not options['dry_run']:
+            self.stdout.write(f"관심분야 태그 {interests.recount()}개의 사용자 수를 다시 맞췄습니다.")
+
+        if options['dry_run'] or not drifted:
+            self.stdout.write(self.style.SUCCESS(f"사용자 {len(expected)}명 중 {len(drifted)}명 불일치"))
+            return
+
+        rows = [UserStats(user_id=user_id, **values) for user_id, values, _ in drifted]
+        with transaction.atomic():
+            UserStats.objects.bulk_create(
+                rows,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['user'],
+                update_fields=[*COUNTER_FIELDS, 'updated_at'],
+            )
+        self.stdout.write(self.style.SUCCESS(f"사용자 {len(expected)}명 중 {len(drifted)}명 통계를 다시 맞췄습니다."))
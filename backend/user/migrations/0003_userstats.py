@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0002_user_interests'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('enrolled_courses', models.IntegerField(default=0, verbose_name='수강 강의 수')),
+                ('in_progress_courses', models.IntegerField(default=0, verbose_name='진행 중 강의 수')),
+                ('completed_courses', models.IntegerField(default=0, verbose_name='종료된 강의 수')),
+                ('attendance_present', models.IntegerField(default=0)),
+                ('attendance_late', models.IntegerField(default=0)),
+                ('attendance_absent', models.IntegerField(default=0)),
+                ('thread_count', models.IntegerField(default=0, verbose_name='작성한 글 수')),
+                ('comment_count', models.IntegerField(default=0, verbose_name='작성한 댓글 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+MAX_TAG_LENGTH = 50
+MAX_TAGS_PER_USER = 20
+BATCH_SIZE = 1_000
+
+
+def parse(value):
+    # user/interests.py의 parse()와 같은 규칙 (마이그레이션은 앱 코드가 바뀌어도 그대로 동작해야 하므로 복사)
+    names = []
+    for item in (value or '').split(','):
+        name = ' '.join(item.split())[:MAX_TAG_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names[:MAX_TAGS_PER_USER]
+
+
+def split_interests(apps, schema_editor):
+    """쉼표 구분 User.interests -> InterestTag / UserInterest, 태그별 사용자 수 집계"""
+    User = apps.get_model('user', 'User')
+    InterestTag = apps.get_model('user', 'InterestTag')
+    UserInterest = apps.get_model('user', 'UserInterest')
+
+    users = User.objects.exclude(interests__isnull=True).exclude(interests='').order_by('pk')
+    tag_ids = {}
+    batch = []
+    for user_id, value in users.values_list('pk', 'interests').iterator(chunk_size=BATCH_SIZE):
+        for name in parse(value):
+            if name not in tag_ids:
+                tag_ids[name] = InterestTag.objects.create(name=name).pk
+            batch.append(UserInterest(user_id=user_id, tag_id=tag_ids[name]))
+        if len(batch) >= BATCH_SIZE:
+            UserInterest.objects.bulk_create(batch)
+            batch = []
+    UserInterest.objects.bulk_create(batch)
+
+    for tag_id, count in UserInterest.objects.values_list('tag_id').annotate(n=Count('id')).order_by():
+        InterestTag.objects.filter(pk=tag_id).update(user_count=count)
+
+
+def join_interests(apps, schema_editor):
+    User = apps.get_model('user', 'User')
+    UserInterest = apps.get_model('user', 'UserInterest')
+
+    names = {}
+    for user_id, name in UserInterest.objects.order_by('user_id', 'id').values_list('user_id', 'tag__name'):
+        names.setdefault(user_id, []).append(name)
+    for user_id, values in names.items():
+        User.objects.filter(pk=user_id).update(interests=','.join(values)[:255])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0003_userstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterestTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='관심분야')),
+                ('user_count', models.IntegerField(default=0, verbose_name='사용자 수')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-user_count', 'name'], name='interesttag_count_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserInterest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_links', to='user.interesttag')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interest_links', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='interest_tags',
+            field=models.ManyToManyField(blank=True, related_name='users', through='user.UserInterest', to='user.interesttag', verbose_name='관심분야'),
+        ),
+        migrations.AddIndex(
+            model_name='userinterest',
+            index=models.Index(fields=['tag', 'user'], name='userinterest_tag_user_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='userinterest',
+            constraint=models.UniqueConstraint(fields=('user', 'tag'), name='userinterest_user_tag_uniq'),
+        ),
+        migrations.RunPython(split_interests, join_interests),
+        migrations.RemoveField(
+            model_name='user',
+            name='interests',
+        ),
+    ]
@@ -11,8 +11,58 @@ class User(AbstractUser):
     birth = models.DateField(blank=True, null=True, verbose_name='생년월일')
     role = models.IntegerField(choices=ROLE_CHOICES, default=0, verbose_name='역할')
     
-    # [추가] 관심 분야 (쉼표로 구분하여 저장하거나 별도 모델 분리 가능, 여기선 간단히 텍스트로 저장)
-    interests = models.CharField(max_length=255, blank=True, null=True, verbose_name="관심분야")
+    # 관심 분야 태그 (user/interests.py로 수정 - 태그별 사용자 수를 함께 갱신)
+    interest_tags = models.ManyToManyField(
+        'InterestTag', through='UserInterest', related_name='users', blank=True, verbose_name="관심분야",
+    )
+
+    def __str__(self):
+        return self.username
+
+# 마이페이지 통계 (시그널로 증감 갱신, user/stats.py 참고)
+class UserStats(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    enrolled_courses = models.IntegerField(default=0, verbose_name='수강 강의 수')
+    in_progress_courses = models.IntegerField(default=0, verbose_name='진행 중 강의 수')
+    completed_courses = models.IntegerField(default=0, verbose_name='종료된 강의 수')
+    attendance_present = models.IntegerField(default=0)
+    attendance_late = models.IntegerField(default=0)
+    attendance_absent = models.IntegerField(default=0)
+    thread_count = models.IntegerField(default=0, verbose_name='작성한 글 수')
+    comment_count = models.IntegerField(default=0, verbose_name='작성한 댓글 수')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} 통계"
+
+
+# 관심 분야 태그 (이름은 공백 정리 후 저장, user/interests.py 참고)
+class InterestTag(models.Model):
+    name = models.CharField(max_length=50, unique=True, verbose_name='관심분야')
+    user_count = models.IntegerField(default=0, verbose_name='사용자 수')  # user/interests.py가 증감
+
+    class Meta:
+        indexes = [
+            # 태그 목록: WHERE user_count > 0 ORDER BY user_count DESC, name
+            models.Index(fields=['-user_count', 'name'], name='interesttag_count_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+class UserInterest(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='interest_links')
+    tag = models.ForeignKey(InterestTag, on_delete=models.CASCADE, related_name='user_links')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'tag'], name='userinterest_user_tag_uniq'),
+        ]
+        indexes = [
+            # 태그별 사용자 목록: WHERE tag_id = ? ORDER BY user_id
+            models.Index(fields=['tag', 'user'], name='userinterest_tag_user_idx'),
+        ]
 
     def __str__(self):
-        return self.username
\ No newline at end of file
+        return f"{self.user.username} - {self.tag.name}"
@@ -3,6 +3,9 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
+from . import interests
+from .models import InterestTag, UserInterest
+
 User = get_user_model()
 
 # 1. 회원가입 (이름, 생년월일 추가)
@@ -22,14 +25,62 @@ class UserSignupSerializer(serializers.ModelSerializer):
         )
         return user
 
+# 관심분야 태그 <-> 쉼표 구분 문자열 (마이페이지가 쓰는 기존 'a,b' 형식 유지, 목록으로 보내도 됨)
+class InterestsField(serializers.Field):
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        super().__init__(**kwargs)
+
+    def to_representation(self, user):
+        return ','.join(interests.tag_names(user))
+
+    def to_internal_value(self, data):
+        valid = isinstance(data, str) or (isinstance(data, list) and all(isinstance(item, str) for item in data))
+        if not valid:
+            raise serializers.ValidationError("쉼표로 구분한 문자열 또는 문자열 목록이어야 합니다.")
+        names = interests.parse(data)
+        if len(names) > interests.MAX_TAGS_PER_USER:
+            raise serializers.ValidationError(f"관심분야는 최대 {interests.MAX_TAGS_PER_USER}개까지 등록할 수 있습니다.")
+        return {'interests': names}
+
 # 2. 내 정보 조회/수정 (이름, 생년월일 포함)
 class UserProfileSerializer(serializers.ModelSerializer):
+    # 관심분야는 InterestTag로 저장 (user/interests.py)
+    interests = InterestsField(required=False)
+
     class Meta:
         model = User
-        # interests 필드 추가
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'birth', 'phone', 'date_joined', 'role', 'interests']
         read_only_fields = ['id', 'username', 'date_joined', 'role']
 
+    def update(self, instance, validated_data):
+        names = validated_data.pop('interests', None)
+        instance = super().update(instance, validated_data)
+        if names is not None:
+            interests.set_interests(instance, names)
+        return instance
+
 # 3. 비밀번호 찾기 (유지)
 class PasswordResetSerializer(serializers.Serializer):
-    email = serializers.EmailField()
\ No newline at end of file
+    email = serializers.EmailField()
+
+# 4. 관심분야 태그
+class InterestTagSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = InterestTag
+        fields = ['id', 'name', 'user_count']
+
+class InterestUpdateSerializer(serializers.Serializer):
+    interests = InterestsField()
+
+# 태그별 사용자 목록 (UserInterest 행 -> 사용자 정보)
+class InterestUserSerializer(serializers.ModelSerializer):
+    id = serializers.ReadOnlyField(source='user_id')
+    username = serializers.ReadOnlyField(source='user.username')
+    first_name = serializers.ReadOnlyField(source='user.first_name')
+    last_name = serializers.ReadOnlyField(source='user.last_name')
+    email = serializers.ReadOnlyField(source='user.email')
+
+    class Meta:
+        model = UserInterest
+        fields = ['id', 'username', 'first_name', 'last_name', 'email', 'created_at']
@@ -0,0 +1,101 @@
+# backend/user/signals.py
+
+from collections import Counter
+
+from django.db.models.signals import post_save, post_delete, pre_save, pre_delete
+from django.dispatch import receiver
+
+from community.models import Thread, Comment
+from lecture.models import Lecture, Enrollment, Attendance
+from .models import User, UserStats
+from . import interests, stats
+
+
+# === 마이페이지 통계 카운터 갱신 (user/stats.py) ===
+# bulk_create / QuerySet.update 처럼 시그널을 거치지 않는 경로는 직접 stats를 갱신하거나
+# manage.py reconcile_user_stats 로 다시 맞춥니다.
+
+@receiver(post_save, sender=User)
+def user_created(sender, instance, created, raw=False, **kwargs):
+    # 새 사용자는 모든 값이 0이므로 집계 없이 바로 만듭니다.
+    if created and not raw:
+        UserStats.objects.get_or_create(user=instance)
+
+
+def lecture_status(lecture_id):
+    return Lecture.objects.filter(pk=lecture_id).values_list('status', flat=True).first()
+
+
+@receiver(post_save, sender=Enrollment)
+def enrollment_created(sender, instance, created, **kwargs):
+    if created:
+        stats.bump([instance.student_id], **stats.lecture_status_deltas(lecture_status(instance.lecture_id), 1))
+
+
+@receiver(post_delete, sender=Enrollment)
+def enrollment_deleted(sender, instance, **kwargs):
+    stats.bump([instance.student_id], **stats.lecture_status_deltas(lecture_status(instance.lecture_id), -1))
+
+
+@receiver(pre_save, sender=Lecture)
+def remember_lecture_status(sender, instance, **kwargs):
+    instance._previous_status = lecture_status(instance.pk) if instance.pk else None
+
+
+@receiver(post_save, sender=Lecture)
+def lecture_status_changed(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_status', None)
+    if created or previous is None or previous == instance.status:
+        return
+    # 수강생 전체의 카운터를 이전 상태 -> 새 상태로 옮깁니다. (서브쿼리 UPDATE 한 번)
+    deltas = Counter(stats.lecture_status_deltas(previous, -1))
+    deltas.update(stats.lecture_status_deltas(instance.status, 1))
+    student_ids = Enrollment.objects.filter(lecture=instance).values('student_id')
+    stats.bump(student_ids, **deltas)
+
+
+@receiver(pre_save, sender=Attendance)
+def remember_attendance_status(sender, instance, **kwargs):
+    instance._previous_status = (
+        Attendance.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, **kwargs):
+    stats.apply_attendance_changes([(instance.user_id, getattr(instance, '_previous_status', None), instance.status)])
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted(sender, instance, **kwargs):
+    stats.apply_attendance_changes([(instance.user_id, instance.status, None)])
+
+
+@receiver(post_save, sender=Thread)
+def thread_created(sender, instance, created, **kwargs):
+    if created:
+        stats.bump([instance.student_id], thread_count=1)
+
+
+@receiver(post_delete, sender=Thread)
+def thread_deleted(sender, instance, **kwargs):
+    stats.bump([instance.student_id], thread_count=-1)
+
+
+@receiver(post_save, sender=Comment)
+def comment_created(sender, instance, created, **kwargs):
+    if created:
+        stats.bump([instance.student_id], comment_count=1)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    stats.bump([instance.student_id], comment_count=-1)
+
+
+# === 관심분야 태그별 사용자 수 (user/interests.py) ===
+
+@receiver(pre_delete, sender=User)
+def user_deleting(sender, instance, **kwargs):
+    interests.user_removed(instance)
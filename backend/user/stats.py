@@ -0,0 +1,146 @@
+# backend/user/stats.py
+
+from collections import Counter
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import User, UserStats
+
+# 강의 상태별로 따로 세는 카운터 (나머지 상태는 enrolled_courses에만 포함)
+LECTURE_STATUS_FIELDS = {
+    'IN_PROGRESS': 'in_progress_courses',
+    'CLOSED': 'completed_courses',
+}
+# Attendance.Status 값 -> 카운터 (0: 결석, 1: 출석, 2: 지각)
+ATTENDANCE_FIELDS = {
+    0: 'attendance_absent',
+    1: 'attendance_present',
+    2: 'attendance_late',
+}
+
+
+def bump(user_ids, **deltas):
+    """
+    user_ids(ID 목록 또는 서브쿼리)의 통계 행에 deltas만큼 더합니다. (UPDATE ... SET x = x + n 한 번)
+    아직 통계 행이 없는 사용자는 건너뜁니다. (처음 조회할 때 rebuild()로 전체 계산)
+    """
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    UserStats.objects.filter(user_id__in=user_ids).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + value for field, value in deltas.items()},
+    )
+
+
+def lecture_status_deltas(status, sign):
+    deltas = {'enrolled_courses': sign}
+    if status in LECTURE_STATUS_FIELDS:
+        deltas[LECTURE_STATUS_FIELDS[status]] = sign
+    return deltas
+
+
+def apply_attendance_changes(changes):
+    """
+    출결 변경 목록 [(user_id, 이전 status 또는 None, 새 status 또는 None), ...]을 통계에 반영합니다.
+    같은 (이전, 새) 상태 전이끼리 묶어 전이 종류별로 UPDATE 한 번씩만 실행합니다. (최대 12번)
+    """
+    transitions = {}
+    for user_id, old, new in changes:
+        if old != new:
+            transitions.setdefault((old, new), []).append(user_id)
+
+    for (old, new), user_ids in transitions.items():
+        deltas = Counter()
+        if old is not None:
+            deltas[ATTENDANCE_FIELDS[old]] -= 1
+        if new is not None:
+            deltas[ATTENDANCE_FIELDS[new]] += 1
+        bump(user_ids, **deltas)
+
+
+COUNTER_FIELDS = (
+    'enrolled_courses', *LECTURE_STATUS_FIELDS.values(), *ATTENDANCE_FIELDS.values(), 'thread_count', 'comment_count',
+)
+
+
+def collect(user_ids=None):
+    """
+    원본 테이블을 집계한 사용자별 카운터 {user_id: {필드: 값}}
+    user_ids가 None이면 전체 사용자 (테이블별 GROUP BY 쿼리 한 번씩)
+    """
+    from community.models import Comment, Thread
+    from lecture.models import Attendance, Enrollment
+
+    def scoped(queryset, field):
+        queryset = queryset.order_by()
+        return queryset if user_ids is None else queryset.filter(**{f'{field}__in': user_ids})
+
+    users = scoped(User.objects.all(), 'pk').values_list('pk', flat=True)
+    result = {pk: dict.fromkeys(COUNTER_FIELDS, 0) for pk in users}
+
+    enrollments = scoped(Enrollment.objects.all(), 'student_id').values('student_id').annotate(
+        enrolled=Count('id'),
+        **{field: Count('id', filter=Q(lecture__status=status)) for status, field in LECTURE_STATUS_FIELDS.items()},
+    )
+    for row in enrollments:
+        counters = result[row.pop('student_id')]
+        counters['enrolled_courses'] = row.pop('enrolled')
+        counters.update(row)
+
+    attendance = scoped(Attendance.objects.all(), 'user_id').values_list('user_id', 'status').annotate(n=Count('id'))
+    for user_id, value, n in attendance:
+        result[user_id][ATTENDANCE_FIELDS[value]] = n
+
+    for model, field in ((Thread, 'thread_count'), (Comment, 'comment_count')):
+        rows = scoped(model.objects.all(), 'student_id').values_list('student_id').annotate(n=Count('id'))
+        for user_id, n in rows:
+            result[user_id][field] = n
+    return result
+
+
+def rebuild(user):
+    """원본 테이블을 집계해 통계 행을 새로 만듭니다. (첫 조회 시)"""
+    values = collect([user.pk])[user.pk]
+    stats, _ = UserStats.objects.update_or_create(user=user, defaults=values)
+    return stats
+
+
+def get_stats(user):
+    """통계 행 한 건 조회 (없으면 원본 테이블로 계산해 생성)"""
+    stats = UserStats.objects.filter(user=user).first()
+    return stats if stats is not None else rebuild(user)
+
+
+def overview(user):
+    """마이페이지 통계 (통계 행 1건 + 현재 시각 기준 과제 마감 집계 1건)"""
+    from lecture.models import Assignment
+
+    stats = get_stats(user)
+
+    # 마감 전/후는 시간이 지나면 바뀌므로 카운터로 두지 않고 조회 시점에 한 번에 셉니다.
+    now = timezone.now()
+    assignments = Assignment.objects.filter(lecture__enrollments__student=user).aggregate(
+        due=Count('id', filter=Q(deadline__gte=now)),
+        overdue=Count('id', filter=Q(deadline__lt=now)),
+    )
+
+    attended = stats.attendance_present + stats.attendance_late
+    recorded = attended + stats.attendance_absent
+    return {
+        'username': user.username,
+        'enrolled_courses': stats.enrolled_courses,
+        'completed_courses': stats.completed_courses,
+        'in_progress': stats.in_progress_courses,
+        'attendance': {
+            'present': stats.attendance_present,
+            'late': stats.attendance_late,
+            'absent': stats.attendance_absent,
+            'rate': round(attended / recorded, 4) if recorded else 0.0,
+        },
+        'assignments_due': assignments['due'],
+        'assignments_overdue': assignments['overdue'],
+        'thread_count': stats.thread_count,
+        'comment_count': stats.comment_count,
+    }
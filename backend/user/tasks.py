@@ -0,0 +1,28 @@
+# backend/user/tasks.py
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+from taskqueue.queue import task
+from .models import User
+from .utils import generate_random_password
+
+
+@task()
+def send_temporary_password(user_id):
+    """
+    임시 비밀번호를 발급해 이메일로 보냅니다. (user/views.py find_pw_api)
+    메일을 먼저 보내고 비밀번호를 바꾸므로, 전송에 실패해 재시도하는 동안 기존 비밀번호는 그대로입니다.
+    """
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not user.email:
+        return
+
+    temp_password = generate_random_password()
+    subject = "[DORO] 임시 비밀번호 발급 안내"
+    message = f"회원님의 임시 비밀번호는 [{temp_password}] 입니다.\n로그인 후 반드시 비밀번호를 변경해주세요."
+    from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'admin@doro.com'
+    send_mail(subject, message, from_email, [user.email], fail_silently=False)
+
+    user.set_password(temp_password)
+    user.save(update_fields=['password'])
@@ -9,4 +9,5 @@ urlpatterns = [
     path("password/reset/", views.find_pw_api),
     path('me/', views.user_profile_api),
     path('overview/', views.user_overview_api),
+    path('me/interests/', views.user_interests_api),
 ]
\ No newline at end of file
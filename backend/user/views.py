@@ -1,12 +1,17 @@
-from django.core.mail import send_mail
-from django.conf import settings
-from .utils import generate_random_password
+from . import stats as user_stats
+from . import interests
+from . import tasks as user_tasks
 from django.contrib.auth import authenticate, get_user_model
+from django.shortcuts import get_object_or_404
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from .serializers import UserSignupSerializer, UserProfileSerializer, PasswordResetSerializer
+from .serializers import InterestTagSerializer, InterestUpdateSerializer, InterestUserSerializer
+from .models import InterestTag, UserInterest
+from doro.pagination import CursorPagination
 from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
@@ -85,19 +90,8 @@ def find_pw_api(request):
             # 1. 유저 찾기
             user = User.objects.get(email=email)
             
-            # 2. 임시 비밀번호 생성
-            temp_password = generate_random_password()
-            
-            # 3. 유저 비밀번호 업데이트 (암호화 저장)
-            user.set_password(temp_password)
-            user.save()
-            
-            # 4. 이메일 전송
-            subject = "[DORO] 임시 비밀번호 발급 안내"
-            message = f"회원님의 임시 비밀번호는 [{temp_password}] 입니다.\n로그인 후 반드시 비밀번호를 변경해주세요."
-            from_email = settings.EMAIL_HOST_USER if hasattr(settings, 'EMAIL_HOST_USER') else 'admin@doro.com'
-            
-            send_mail(subject, message, from_email, [email], fail_silently=False)
+            # 2. 임시 비밀번호 발급 + 이메일 전송은 백그라운드 작업으로 (SMTP 지연이 응답에 더해지지 않게)
+            user_tasks.send_temporary_password.enqueue(user.pk)
             
             return Response({"message": f"{email}로 임시 비밀번호를 전송했습니다."}, status=status.HTTP_200_OK)
             
@@ -139,12 +133,46 @@ def user_profile_api(request):
 
 
 @api_view(['GET'])
+@permission_classes([IsAuthenticated])
 def user_overview_api(request):
-    """통계"""
-    data = {
-        "username": str(request.user),
-        "completed_courses": 5,
-        "in_progress": 2,
-        "average_score": 95.5
-    }
-    return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file
+    """통계 (수강/출결/과제/커뮤니티 활동 - user/stats.py)"""
+    return Response(user_stats.overview(request.user), status=status.HTTP_200_OK)
+
+
+# === 3. 관심분야 태그 (user/interests.py) ===
+
+MAX_TAG_LIST = 100
+interest_user_pagination = CursorPagination(ordering=('user_id',), page_size=50)
+
+
+@api_view(['GET', 'PUT'])
+@permission_classes([IsAuthenticated])
+def user_interests_api(request):
+    """내 관심분야 조회(GET) / 교체(PUT {"interests": ["코딩", "드론"]} 또는 "코딩,드론")"""
+    if request.method == 'PUT':
+        serializer = InterestUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        interests.set_interests(request.user, serializer.validated_data['interests'])
+    return Response({'interests': interests.tag_names(request.user)})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def interest_tag_list_api(request):
+    """관심분야 태그별 사용자 수 (많은 순, ?limit= 최대 100)"""
+    limit = request.query_params.get('limit', '50')
+    if not limit.isdigit() or int(limit) < 1:
+        raise ValidationError({'limit': "1 이상의 정수여야 합니다."})
+    tags = interests.popular_tags()[:min(int(limit), MAX_TAG_LIST)]
+    return Response(InterestTagSerializer(tags, many=True).data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def interest_tag_users_api(request, tag_id):
+    """태그를 가진 사용자 목록 (관리자 전용, 사용자 ID 순 커서 페이지네이션 - 항상 {next_cursor, results})"""
+    tag = get_object_or_404(InterestTag, pk=tag_id)
+    links = UserInterest.objects.filter(tag=tag).select_related('user').order_by(*interest_user_pagination.ordering)
+    page, next_cursor = interest_user_pagination.paginate_queryset(links, request)
+    data = interest_user_pagination.get_response_data(InterestUserSerializer(page, many=True).data, next_cursor)
+    return Response({'tag': InterestTagSerializer(tag).data, **data})
@@ -119,7 +119,9 @@ export default function ConsultationPage() {
                 setFormData({ instructor: '', method: '', date: '', type: '', topic: '', content: '' });
                 setFilters({ type: '', method: '', instructor: '', status: '' });
             } else {
-                alert("신청 정보를 확인해주세요.");
+                // 409: 강사의 다른 상담과 시간이 겹침 / 400: 상담 가능 시간이 아님 등 (서버 메시지 표시)
+                const data = await res.json().catch(() => ({}));
+                alert(data.error ?? "신청 정보를 확인해주세요.");
             }
         } catch (err) {
             console.error(err);
@@ -11,7 +11,7 @@ interface Lecture {
     instructor_name: string;
     capacity: number;
     enrolled_count: number;
-    day_time: string;
+    start_date: string | null;
     status: 'OPEN' | 'RECRUITING' | 'IN_PROGRESS' | 'CLOSED';
 }
 
@@ -31,7 +31,7 @@ export default function CourseRegistrationPage() {
 
         const fetchLectures = async () => {
             try {
-                const res = await fetch('http://127.0.0.1:8000/api/courses', {
+                const res = await fetch('http://127.0.0.1:8000/api/courses/', {
                     headers: { 'Authorization': `Bearer ${token}` }
                 });
                 if (res.ok) {
@@ -64,11 +64,17 @@ export default function CourseRegistrationPage() {
                 method: 'POST',
                 headers: {
                     'Authorization': `Bearer ${token}`,
-                    'Content-Type': 'application/json'
+                    'Content-Type': 'application/json',
+                    // 네트워크 재시도로 같은 신청이 두 번 처리되지 않도록 요청마다 키를 붙입니다.
+                    'Idempotency-Key': crypto.randomUUID()
                 }
             });
 
-            if (res.ok) {
+            if (res.status === 202) {
+                const data = await res.json();
+                alert(`정원이 가득 차 대기자 ${data.position}번으로 등록되었습니다.`);
+                window.location.reload();
+            } else if (res.ok) {
                 alert('수강신청이 완료되었습니다!');
                 window.location.reload();
             } else {
@@ -181,12 +187,12 @@ export default function CourseRegistrationPage() {
                                     {lecture.description || '강의 설명이 없습니다.'}
                                 </p>
 
-                                {lecture.day_time && (
+                                {lecture.start_date && (
                                     <div className="flex items-center gap-2 text-sm text-gray-500 mb-4">
                                         <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                                             <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z" />
                                         </svg>
-                                        <span>{lecture.day_time}</span>
+                                        <span>{lecture.start_date}</span>
                                     </div>
                                 )}
 
@@ -200,10 +206,10 @@ export default function CourseRegistrationPage() {
                                     </button>
                                 ) : lecture.status === 'OPEN' && lecture.enrolled_count >= lecture.capacity ? (
                                     <button
-                                        disabled
-                                        className="w-full bg-gray-200 text-gray-500 py-2.5 rounded-lg font-bold cursor-not-allowed"
+                                        onClick={() => handleEnroll(lecture.id)}
+                                        className="w-full bg-amber-500 text-white py-2.5 rounded-lg font-bold hover:bg-amber-600 transition shadow-sm"
                                     >
-                                        정원 마감
+                                        정원 마감 · 대기 신청
                                     </button>
                                 ) : (
                                     <button
@@ -18,7 +18,9 @@ interface Thread {
     content: string;
     created_at: string;
     student_name: string;
-    comments: Comment[]; // 댓글 리스트 포함
+    comment_count: number;
+    comments: Comment[]; // 댓글 첫 페이지
+    comments_next_cursor: string | null; // 다음 댓글 페이지 커서 (없으면 null)
 }
 
 export default function CommunityDetailPage() {
@@ -30,6 +32,7 @@ export default function CommunityDetailPage() {
     const [newComment, setNewComment] = useState(''); // 댓글 입력값
     const [loading, setLoading] = useState(true);
     const [user, setUser] = useState<string>('');
+    const [loadingMore, setLoadingMore] = useState(false);
 
     // 데이터 불러오기
     const fetchThread = async () => {
@@ -51,6 +54,31 @@ export default function CommunityDetailPage() {
         }
     };
 
+    // 댓글 더 보기 (커서 페이지)
+    const fetchMoreComments = async () => {
+        if (!thread?.comments_next_cursor || loadingMore) return;
+        const token = localStorage.getItem('access_token');
+        setLoadingMore(true);
+        try {
+            const res = await fetch(
+                `http://127.0.0.1:8000/api/community/${threadId}/comments/?cursor=${encodeURIComponent(thread.comments_next_cursor)}`,
+                { headers: token ? { 'Authorization': `Bearer ${token}` } : {} }
+            );
+            if (res.ok) {
+                const page = await res.json();
+                setThread((prev) => prev && {
+                    ...prev,
+                    comments: [...prev.comments, ...page.results],
+                    comments_next_cursor: page.next_cursor,
+                });
+            }
+        } catch (error) {
+            console.error(error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     useEffect(() => {
         // 유저 정보 가져오기 (댓글창에 이름 표시용)
         const userData = localStorage.getItem('user');
@@ -140,7 +168,7 @@ export default function CommunityDetailPage() {
                     </div>
                     <div className="flex items-center gap-1">
                         <svg className="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M7 8h10M7 12h4m1 8l-4-4H5a2 2 0 01-2-2V6a2 2 0 012-2h14a2 2 0 012 2v8a2 2 0 01-2 2h-3l-4 4z" /></svg>
-                        <span>{thread.comments?.length || 0}</span>
+                        <span>{thread.comment_count ?? thread.comments?.length ?? 0}</span>
                     </div>
                 </div>
 
@@ -176,6 +204,15 @@ export default function CommunityDetailPage() {
                         </div>
                     ))}
                 </div>
+                {thread.comments_next_cursor && (
+                    <button
+                        onClick={fetchMoreComments}
+                        disabled={loadingMore}
+                        className="mt-6 w-full text-sm text-gray-500 border border-gray-200 rounded py-2 hover:bg-gray-50 transition disabled:opacity-50"
+                    >
+                        {loadingMore ? '불러오는 중...' : '댓글 더 보기'}
+                    </button>
+                )}
             </div>
         </div>
     );
@@ -61,6 +61,58 @@ export default function DashboardPage() {
         fetchData();
     }, [router]);
 
+    // 새 공지 실시간 반영 (서버 푸시, ASGI 서버에서만 동작 - 스트림을 열 수 없으면 처음 조회한 목록만 보임)
+    // 액세스 토큰이 URL(접근 로그)에 남지 않도록 접속할 때마다 일회용 접속권(ticket)을 받아 EventSource를 엽니다.
+    useEffect(() => {
+        const token = localStorage.getItem('access_token');
+        if (!token) return;
+
+        let source: EventSource | null = null;
+        let retryTimer: ReturnType<typeof setTimeout> | undefined;
+        let closed = false;
+
+        const connect = async () => {
+            try {
+                const res = await fetch('http://127.0.0.1:8000/api/stream/ticket/', {
+                    method: 'POST',
+                    headers: { 'Authorization': `Bearer ${token}` },
+                });
+                // 501: ASGI 서버가 아님(runserver 등), 401: 토큰 만료 -> 다시 접속하지 않음
+                if (!res.ok || closed) return;
+                const { ticket } = await res.json();
+                if (closed) return;
+
+                source = new EventSource(`http://127.0.0.1:8000/api/stream/?ticket=${encodeURIComponent(ticket)}`);
+                source.onmessage = (e) => {
+                    const event = JSON.parse(e.data);
+                    if (event.type !== 'system_notice' && event.type !== 'lecture_notice') return;
+                    const notice: Notice = {
+                        id: event.data.id,
+                        title: event.data.title,
+                        created_at: event.data.created_at,
+                        type: event.type === 'system_notice' ? 'system' : 'lecture',
+                        lecture: event.data.lecture_id,
+                    };
+                    setRecentNotices(prev => [notice, ...prev.filter(n => !(n.id === notice.id && n.type === notice.type))].slice(0, 5));
+                };
+                // 접속권은 한 번만 쓸 수 있으므로 브라우저 자동 재접속 대신 새 접속권을 받아 다시 엽니다.
+                source.onerror = () => {
+                    source?.close();
+                    if (!closed) retryTimer = setTimeout(connect, 5000);
+                };
+            } catch (err) {
+                console.error(err);
+            }
+        };
+        connect();
+
+        return () => {
+            closed = true;
+            clearTimeout(retryTimer);
+            source?.close();
+        };
+    }, []);
+
     // 종료된 수업(CLOSED)은 제외
     const activeCourses = enrolledCourses.filter(item => item.lecture.status !== 'CLOSED');
 